@@ -1,7 +1,7 @@
 """Module for the dynamic caches."""
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from datetime import datetime
 import logging
 from typing import Any, Final, cast
@@ -59,6 +59,16 @@ class DeviceDetailsCache:
         self._functions.update(await self._get_all_functions())
         self._last_refreshed = datetime.now()
 
+    def set_rooms_and_functions(
+        self, rooms: Mapping[str, set[str]], functions: Mapping[str, set[str]]
+    ) -> None:
+        """Set the rooms and functions by address, that have been fetched with the names."""
+        self._channel_rooms.clear()
+        self._channel_rooms.update(rooms)
+        self._functions.clear()
+        self._functions.update(functions)
+        self._last_refreshed = datetime.now()
+
     @property
     def device_channel_ids(self) -> Mapping[str, str]:
         """Return device channel ids."""
@@ -138,24 +148,26 @@ class CentralDataCache:
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the central data cache."""
         self._central: Final = central
-        # { key, value}
-        self._value_cache: Final[dict[str, Any]] = {}
-        self._last_refreshed = INIT_DATETIME
+        # { interface, {key, value}}
+        self._value_cache: Final[dict[str, dict[str, Any]]] = {}
+        # { interface, last_refreshed}
+        self._last_refreshed: Final[dict[str, datetime]] = {}
 
     @property
     def is_empty(self) -> bool:
         """Return if cache is empty."""
-        if len(self._value_cache) == 0:
-            return True
-        if not changed_within_seconds(last_change=self._last_refreshed):
-            self.clear()
-            return True
-        return False
+        self._remove_outdated_data()
+        return len(self._value_cache) == 0
 
     async def load(self, direct_call: bool = False) -> None:
         """Fetch data from backend."""
-        if direct_call is False and changed_within_seconds(
-            last_change=self._last_refreshed, max_age=(MAX_CACHE_AGE / 2)
+        if (
+            direct_call is False
+            and self._last_refreshed
+            and all(
+                changed_within_seconds(last_change=last_refreshed, max_age=(MAX_CACHE_AGE / 2))
+                for last_refreshed in self._last_refreshed.values()
+            )
         ):
             return
         self.clear()
@@ -163,15 +175,36 @@ class CentralDataCache:
         for client in self._central.clients:
             await client.fetch_all_device_data()
 
-    async def refresh_entity_data(self, paramset_key: str | None = None) -> None:
-        """Refresh entity data."""
+    async def refresh_entity_data(
+        self,
+        paramset_key: str | None = None,
+        interface_id: str | None = None,
+        device_addresses: Collection[str] | None = None,
+    ) -> None:
+        """Refresh entity data. Optionally only of an interface or of some devices."""
         for entity in self._central.get_readable_generic_entities(paramset_key=paramset_key):
+            if interface_id is not None and entity.device.interface_id != interface_id:
+                continue
+            if (
+                device_addresses is not None
+                and entity.device.device_address not in device_addresses
+            ):
+                continue
             await entity.load_entity_value(call_source=CallSource.HM_INIT)
 
-    def add_data(self, all_device_data: dict[str, Any]) -> None:
-        """Add data to cache."""
-        self._value_cache.update(all_device_data)
-        self._last_refreshed = datetime.now()
+    def add_data(self, interface: str, all_device_data: dict[str, Any]) -> None:
+        """Add the data of an interface to cache. The data is used as is, without a copy."""
+        self._value_cache[interface] = all_device_data
+        self._last_refreshed[interface] = datetime.now()
+
+    def update_data(self, interface: str, device_data: dict[str, Any]) -> None:
+        """Update the data of an interface with the data of some devices or channels."""
+        self._remove_outdated_data()
+        if (interface_data := self._value_cache.get(interface)) is None:
+            self.add_data(interface=interface, all_device_data=device_data)
+            return
+        # The refresh time is kept, so that the rest of the data still expires in time.
+        interface_data.update(device_data)
 
     def get_data(
         self,
@@ -180,15 +213,25 @@ class CentralDataCache:
         parameter: str,
     ) -> Any:
         """Get data from cache."""
-        if not self.is_empty:
+        if not self.is_empty and (interface_data := self._value_cache.get(interface)):
             key = f"{interface}.{channel_address.replace(':','%3A')}.{parameter}"
-            return self._value_cache.get(key, NO_CACHE_ENTRY)
+            return interface_data.get(key, NO_CACHE_ENTRY)
         return NO_CACHE_ENTRY
 
-    def clear(self) -> None:
-        """Clear the cache."""
-        self._value_cache.clear()
-        self._last_refreshed = INIT_DATETIME
+    def clear(self, interface: str | None = None) -> None:
+        """Clear the cache. Optionally only the data of an interface."""
+        if interface is None:
+            self._value_cache.clear()
+            self._last_refreshed.clear()
+            return
+        self._value_cache.pop(interface, None)
+        self._last_refreshed.pop(interface, None)
+
+    def _remove_outdated_data(self) -> None:
+        """Remove the data of interfaces, that has not been refreshed within max age."""
+        for interface, last_refreshed in tuple(self._last_refreshed.items()):
+            if not changed_within_seconds(last_change=last_refreshed):
+                self.clear(interface=interface)
 
 
 class PingPongCache:
@@ -0,0 +1,184 @@
+"""Module about event policies (throttle, debounce, delta) within hahomematic."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import logging
+import os
+from typing import Final
+
+from hahomematic import central as hmcu, support as hms
+from hahomematic.const import DEFAULT_ENCODING, ParamsetKey
+from hahomematic.support import reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_FILE_CUSTOM_EVENT_POLICIES: Final = "event_policy"
+_EVENT_POLICY_WILDCARD: Final = "all"
+
+_POLICY_THROTTLE: Final = "throttle"
+_POLICY_DEBOUNCE: Final = "debounce"
+_POLICY_DELTA: Final = "delta"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EventPolicy:
+    """
+    Policy for events of a parameter.
+
+    throttle: Accept an event, and drop all following events within throttle seconds.
+    debounce: Accept only the last event after debounce seconds without events.
+    delta: Accept only events, that differ more than delta from the current value.
+    """
+
+    throttle: float | None = None
+    debounce: float | None = None
+    delta: float | None = None
+
+
+class EventPolicyCache:
+    """
+    Cache for event policies.
+
+    Lines use the format of the unignore file, followed by the policies:
+    POWER:VALUES@HmIP-PSM:all throttle=5
+    """
+
+    def __init__(
+        self,
+        central: hmcu.CentralUnit,
+    ) -> None:
+        """Init the event policy cache."""
+        self._central = central
+        self._storage_folder: Final = central.config.storage_folder
+        self._raw_event_policy_list: Final[set[str]] = set(
+            central.config.event_policy_list or set()
+        )
+        # device_type, channel_no, parameter, event_policy
+        self._event_policies: Final[dict[str, dict[int | str | None, dict[str, EventPolicy]]]] = {}
+
+    @lru_cache(maxsize=4096)
+    def get_event_policy(
+        self,
+        device_type: str,
+        channel_no: int | None,
+        paramset_key: str,
+        parameter: str,
+    ) -> EventPolicy | None:
+        """Return the event policy of a parameter."""
+        if paramset_key != ParamsetKey.VALUES or not self._event_policies:
+            return None
+        device_type_l = device_type.lower()
+        for dtl, cno in (
+            (device_type_l, channel_no),
+            (device_type_l, _EVENT_POLICY_WILDCARD),
+            (_EVENT_POLICY_WILDCARD, channel_no),
+            (_EVENT_POLICY_WILDCARD, _EVENT_POLICY_WILDCARD),
+        ):
+            if (
+                (channel_policies := self._event_policies.get(dtl))
+                and (parameter_policies := channel_policies.get(cno))
+                and (event_policy := parameter_policies.get(parameter))
+            ):
+                return event_policy
+        return None
+
+    def _add_line_to_cache(self, line: str) -> None:
+        """Add line from event policy file to cache."""
+
+        # ignore empty line
+        if not line.strip():
+            return
+
+        if line_details := self._get_event_policy_line_details(line=line):
+            device_type, channel_no, parameter, event_policy = line_details
+            self._event_policies.setdefault(device_type, {}).setdefault(channel_no, {})[
+                parameter
+            ] = event_policy
+        else:
+            _LOGGER.warning(
+                "ADD_LINE_TO_CACHE failed: No supported format detected for event policy line '%s'. ",
+                line,
+            )
+
+    def _get_event_policy_line_details(
+        self, line: str
+    ) -> tuple[str, int | str | None, str, EventPolicy] | None:
+        """
+        Check the format of the line for event policy file.
+
+        device_type, channel_no, parameter, event_policy
+        """
+        key, *raw_policies = line.split()
+        if not raw_policies:
+            return None
+
+        device_type: str = _EVENT_POLICY_WILDCARD
+        channel_no: int | str | None = _EVENT_POLICY_WILDCARD
+        parameter: str = key
+        if "@" in key:
+            param_data, _, channel_data = key.partition("@")
+            parameter, _, paramset_key = param_data.partition(":")
+            if paramset_key != ParamsetKey.VALUES or channel_data.count(":") != 1:
+                return None
+            device_type, _, _channel_no = channel_data.lower().partition(":")
+            channel_no = (
+                int(_channel_no)
+                if _channel_no.isnumeric()
+                else None
+                if _channel_no == ""
+                else _channel_no
+            )
+        elif ":" in key:
+            return None
+
+        policies: dict[str, float] = {}
+        for raw_policy in raw_policies:
+            name, _, raw_value = raw_policy.partition("=")
+            if name not in (_POLICY_THROTTLE, _POLICY_DEBOUNCE, _POLICY_DELTA):
+                return None
+            try:
+                policies[name] = float(raw_value)
+            except ValueError:
+                return None
+            if policies[name] < 0:
+                return None
+        return device_type, channel_no, parameter, EventPolicy(**policies)
+
+    async def load(self) -> None:
+        """Load custom event policies from disk."""
+
+        def _load() -> None:
+            if not hms.check_or_create_directory(self._storage_folder):
+                return  # pragma: no cover
+            if not os.path.exists(os.path.join(self._storage_folder, _FILE_CUSTOM_EVENT_POLICIES)):
+                _LOGGER.debug(
+                    "LOAD: No file found in %s",
+                    self._storage_folder,
+                )
+                return
+
+            try:
+                with open(
+                    file=os.path.join(
+                        self._storage_folder,
+                        _FILE_CUSTOM_EVENT_POLICIES,
+                    ),
+                    encoding=DEFAULT_ENCODING,
+                ) as fptr:
+                    for file_line in fptr.readlines():
+                        if "#" not in file_line:
+                            self._raw_event_policy_list.add(file_line.strip())
+            except Exception as ex:
+                _LOGGER.warning(
+                    "LOAD failed: Could not read event policy file %s",
+                    reduce_args(args=ex.args),
+                )
+
+        if self._central.config.load_event_policy:
+            await self._central.async_add_executor_job(_load)
+
+        for line in self._raw_event_policy_list:
+            if "#" not in line:
+                self._add_line_to_cache(line)
+        self.get_event_policy.cache_clear()
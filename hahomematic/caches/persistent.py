@@ -292,6 +292,18 @@ class ParamsetDescriptionCache(BasePersistentCache):
             paramset_key
         ] = paramset_description
 
+    def add_all(
+        self,
+        interface_id: str,
+        paramset_descriptions: Mapping[str, Mapping[str, dict[str, Any]]],
+    ) -> None:
+        """Add paramset descriptions of many channels to cache."""
+        for channel_address, paramsets in paramset_descriptions.items():
+            if paramsets:
+                self._raw_paramset_descriptions.setdefault(interface_id, {}).setdefault(
+                    channel_address, {}
+                ).update(paramsets)
+
     async def remove_device(self, device: HmDevice) -> None:
         """Remove device paramset descriptions from cache."""
         if interface := self._raw_paramset_descriptions.get(device.interface_id):
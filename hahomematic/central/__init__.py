@@ -6,12 +6,13 @@ This is the python representation of a CCU.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Mapping, Set
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Mapping, Sequence, Set
 from concurrent.futures._base import CancelledError
 from datetime import datetime
 import logging
 import socket
 import threading
+import time
 from typing import Any, Final, TypeVar, cast
 
 from aiohttp import ClientSession
@@ -20,23 +21,44 @@ import voluptuous as vol
 
 from hahomematic import client as hmcl, config
 from hahomematic.caches.dynamic import CentralDataCache, DeviceDetailsCache
+from hahomematic.caches.event_policy import EventPolicyCache
 from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache
 from hahomematic.caches.visibility import ParameterVisibilityCache
 from hahomematic.central import xml_rpc_server as xmlrpc
-from hahomematic.central.decorators import callback_event, callback_system_event
+from hahomematic.central.decorators import callback_system_event
+from hahomematic.central.event_queue import EventQueue
+from hahomematic.central.event_subscriptions import EventSubscriptions
 from hahomematic.client.json_rpc import JsonRpcAioHttpClient
-from hahomematic.client.xml_rpc import XmlRpcProxy
+from hahomematic.client.latency import LatencyTracker
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, XmlRpcProxy
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
+    DEFAULT_ADAPTIVE_READ_CONCURRENCY,
+    DEFAULT_ADAPTIVE_TIMEOUT_MIN,
+    DEFAULT_ADAPTIVE_TIMEOUTS,
+    DEFAULT_ASYNC_XML_RPC_PROXY,
+    DEFAULT_ASYNC_XML_RPC_SERVER,
+    DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_COMMAND_QUEUE_RATE,
+    DEFAULT_COMMAND_QUEUE_SIZE,
+    DEFAULT_DEVICE_DATA_REFRESH_DELAY,
+    DEFAULT_EVENT_OVERLOAD_POLICY,
+    DEFAULT_EVENT_QUEUE_HIGH_WATER_MARK,
+    DEFAULT_MAX_READ_WORKERS,
+    DEFAULT_SYSVAR_DELTA_POLLING,
     DEFAULT_TLS,
     DEFAULT_VERIFY_TLS,
+    DEFAULT_WEAK_EVENT_SUBSCRIPTIONS,
+    DEFAULT_WRITE_COALESCING_WINDOW,
     ENTITY_EVENTS,
     EVENT_AVAILABLE,
     EVENT_DATA,
     EVENT_INTERFACE_ID,
     EVENT_TYPE,
+    CircuitState,
     Description,
     DeviceFirmwareState,
+    EventOverloadPolicy,
     EventType,
     HmPlatform,
     InterfaceEventType,
@@ -64,16 +86,26 @@ from hahomematic.platforms.generic.entity import GenericEntity
 from hahomematic.platforms.hub import Hub
 from hahomematic.platforms.hub.button import HmProgramButton
 from hahomematic.platforms.hub.entity import GenericHubEntity, GenericSystemVariable
-from hahomematic.support import check_config, get_device_address, reduce_args
+from hahomematic.support import (
+    check_config,
+    get_device_address,
+    monotonic_to_datetime,
+    reduce_args,
+)
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# Open circuits are not probed more often.
+_MIN_CHECK_INTERVAL: Final = 1.0
+
 _R = TypeVar("_R")
 _T = TypeVar("_T")
 
 # {instance_name, central}
 CENTRAL_INSTANCES: Final[dict[str, CentralUnit]] = {}
-ConnectionProblemIssuer = JsonRpcAioHttpClient | XmlRpcProxy
+# {interface_id, (central, client)}
+INTERFACE_INSTANCES: Final[dict[str, tuple[CentralUnit, hmcl.Client]]] = {}
+ConnectionProblemIssuer = JsonRpcAioHttpClient | XmlRpcProxy | AsyncXmlRpcProxy
 
 INTERFACE_EVENT_SCHEMA = vol.Schema(
     {
@@ -100,10 +132,15 @@ class CentralUnit:
         self._model: str | None = None
         self._connection_state: Final = central_config.connection_state
         self._loop: Final = asyncio.get_running_loop()
-        self._xml_rpc_server: Final = (
-            xmlrpc.register_xml_rpc_server(
-                local_port=central_config.callback_port or central_config.default_callback_port
-            )
+        # Hands over events from the XmlRPC-Server thread to the loop
+        self.event_queue: Final[EventQueue] = EventQueue(
+            central=self,
+            loop=self._loop,
+            high_water_mark=central_config.event_queue_high_water_mark,
+            overload_policy=central_config.event_overload_policy,
+        )
+        self._xml_rpc_server: Final[xmlrpc.XmlRpcServer | xmlrpc.AsyncXmlRpcServer | None] = (
+            _register_xml_rpc_server(central_config=central_config)
             if central_config.enable_server
             else None
         )
@@ -125,20 +162,27 @@ class CentralUnit:
         self.parameter_visibility: Final[ParameterVisibilityCache] = ParameterVisibilityCache(
             central=self
         )
+        self.event_policy: Final[EventPolicyCache] = EventPolicyCache(central=self)
 
         self._primary_client: hmcl.Client | None = None
         # {interface_id, client}
         self._clients: Final[dict[str, hmcl.Client]] = {}
-        # {{channel_address, parameter}, event_handle}
-        self._entity_event_subscriptions: Final[dict[tuple[str, str], Any]] = {}
+        # Event handlers of entities by device_address, channel_address and parameter
+        self._event_subscriptions: Final = EventSubscriptions(
+            use_weak_references=central_config.weak_event_subscriptions
+        )
+        # {unique_id, subscription token}
+        self._event_subscription_tokens: Final[dict[str, int]] = {}
         # {device_address, device}
         self._devices: Final[dict[str, HmDevice]] = {}
+        # {interface_id, device_addresses}, devices, that are reachable again
+        self._device_data_refreshes: Final[dict[str, set[str]]] = {}
         # {sysvar_name, sysvar_entity}
         self._sysvar_entities: Final[dict[str, GenericSystemVariable]] = {}
         # {sysvar_name, program_button}U
         self._program_buttons: Final[dict[str, HmProgramButton]] = {}
-        # store last event received datetime by interface
-        self.last_events: Final[dict[str, datetime]] = {}
+        # store last event received time.monotonic by interface
+        self._last_event_timestamps: Final[dict[str, float]] = {}
         # Signature: (name, *args)
         # e.g. DEVICES_CREATED, HUB_REFRESHED
         self._callback_system_event: Final[set[Callable]] = set()
@@ -159,6 +203,11 @@ class CentralUnit:
         self._hub: Hub = Hub(central=self)
         self._version: str | None = None
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop of the central."""
+        return self._loop
+
     @property
     def available(self) -> bool:
         """Return the availability of the central."""
@@ -185,13 +234,21 @@ class CentralUnit:
         if self._connection_checker.is_alive():
             return True
         if (
-            self._xml_rpc_server
+            isinstance(self._xml_rpc_server, xmlrpc.XmlRpcServer)
             and self._xml_rpc_server.no_central_registered
             and self._xml_rpc_server.is_alive()
         ):
             return True
         return False
 
+    @property
+    def last_events(self) -> Mapping[str, datetime]:
+        """Return the datetime of the last received event by interface."""
+        return {
+            interface_id: monotonic_to_datetime(timestamp=timestamp)
+            for interface_id, timestamp in self._last_event_timestamps.items()
+        }
+
     @property
     def interface_ids(self) -> tuple[str, ...]:
         """Return all associated interface ids."""
@@ -295,6 +352,9 @@ class CentralUnit:
             _LOGGER.debug("START: Central %s already started", self._name)
             return
         await self.parameter_visibility.load()
+        await self.event_policy.load()
+        if isinstance(self._xml_rpc_server, xmlrpc.AsyncXmlRpcServer):
+            await self._xml_rpc_server.start()
         if self.config.start_direct:
             if await self._create_clients():
                 for client in self._clients.values():
@@ -320,7 +380,10 @@ class CentralUnit:
             self._xml_rpc_server.un_register_central(central=self)
             # un-register and stop XmlRPC-Server, if possible
             if self._xml_rpc_server.no_central_registered:
-                self._xml_rpc_server.stop()
+                if isinstance(self._xml_rpc_server, xmlrpc.AsyncXmlRpcServer):
+                    await self._xml_rpc_server.stop()
+                else:
+                    self._xml_rpc_server.stop()
             _LOGGER.debug("STOP: XmlRPC-Server stopped")
         else:
             _LOGGER.debug(
@@ -385,8 +448,8 @@ class CentralUnit:
         """Start clients ."""
         if await self._create_clients():
             await self._load_caches()
+            await self.fetch_startup_metadata()
             await self._create_devices()
-            await self._init_hub()
             await self._init_clients()
 
     async def _stop_clients(self) -> None:
@@ -395,6 +458,8 @@ class CentralUnit:
         for client in self._clients.values():
             _LOGGER.debug("STOP_CLIENTS: Stopping %s", client.interface_id)
             client.stop()
+            if (instance := INTERFACE_INSTANCES.get(client.interface_id)) and instance[0] is self:
+                del INTERFACE_INSTANCES[client.interface_id]
         _LOGGER.debug("STOP_CLIENTS: Clearing existing clients.")
         self._clients.clear()
 
@@ -433,6 +498,7 @@ class CentralUnit:
                         self._name,
                     )
                     self._clients[client.interface_id] = client
+                    INTERFACE_INSTANCES[client.interface_id] = (self, client)
             except BaseHomematicException as ex:
                 self.fire_interface_event(
                     interface_id=interface_config.interface_id,
@@ -472,6 +538,17 @@ class CentralUnit:
         await self._hub.fetch_program_data()
         await self._hub.fetch_sysvar_data()
 
+    async def fetch_startup_metadata(self) -> None:
+        """Fetch the device details and the hub data together, and fill the caches and the hub."""
+        if (client := self.primary_client) and (
+            metadata := await client.fetch_startup_metadata()
+        ) is not None:
+            await self._hub.update_program_data(programs=metadata.programs)
+            await self._hub.update_sysvar_data(variables=metadata.system_variables)
+            return
+        await self.device_details.load()
+        await self._init_hub()
+
     def fire_interface_event(
         self,
         interface_id: str,
@@ -668,7 +745,6 @@ class CentralUnit:
         try:
             await self.device_descriptions.load()
             await self.paramset_descriptions.load()
-            await self.device_details.load()
             await self.data_cache.load()
         except orjson.JSONDecodeError:  # pragma: no cover
             _LOGGER.warning("LOAD_CACHES failed: Unable to load caches for %s", self._name)
@@ -797,17 +873,29 @@ class CentralUnit:
                 for dev_desc in self.device_descriptions.get_raw_device_descriptions(interface_id)
             )
             client = self._clients[interface_id]
+            new_device_descriptions: list[dict[str, Any]] = []
             for dev_desc in device_descriptions:
                 try:
                     self.device_descriptions.add_device_description(interface_id, dev_desc)
                     if dev_desc[Description.ADDRESS] not in known_addresses:
-                        await client.fetch_paramset_descriptions(dev_desc)
+                        new_device_descriptions.append(dev_desc)
                 except Exception as err:  # pragma: no cover
                     _LOGGER.error(
                         "ADD_NEW_DEVICES failed: %s [%s]",
                         type(err).__name__,
                         reduce_args(args=err.args),
                     )
+            try:
+                # Without known devices this is the bulk fetch of the whole interface.
+                await client.fetch_all_paramset_descriptions(
+                    tuple(new_device_descriptions), report_progress=not known_addresses
+                )
+            except Exception as err:  # pragma: no cover
+                _LOGGER.error(
+                    "ADD_NEW_DEVICES failed: %s [%s]",
+                    type(err).__name__,
+                    reduce_args(args=err.args),
+                )
 
             await self.device_descriptions.save()
             await self.paramset_descriptions.save()
@@ -815,20 +903,61 @@ class CentralUnit:
             await self.data_cache.load()
             await self._create_devices()
 
-    @callback_event
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
-        _LOGGER.debug(
-            "EVENT: interface_id = %s, channel_address = %s, parameter = %s, value = %s",
-            interface_id,
-            channel_address,
-            parameter,
-            str(value),
-        )
-        if not self.has_client(interface_id=interface_id):
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "EVENT: interface_id = %s, channel_address = %s, parameter = %s, value = %s",
+                interface_id,
+                channel_address,
+                parameter,
+                str(value),
+            )
+        self.event_batch(interface_id=interface_id, events=((channel_address, parameter, value),))
+
+    def event_batch(self, interface_id: str, events: Sequence[tuple[str, str, Any]]) -> None:
+        """
+        Handle a batch of events (channel_address, parameter, value) of one interface.
+
+        Used for system.multicall bundles and single events. The client is resolved
+        and the monotonic timestamp is taken only once per batch.
+        """
+        if (client := self._clients.get(interface_id)) is None:
             return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "EVENT_BATCH: interface_id = %s, event_count = %i", interface_id, len(events)
+            )
+        client.last_event_timestamp = self._last_event_timestamps[interface_id] = time.monotonic()
+        for channel_address, parameter, value in events:
+            try:
+                self._process_event(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    parameter=parameter,
+                    value=value,
+                )
+            except Exception as ex:
+                # A malformed event must not stop the other events of the batch.
+                _LOGGER.warning(
+                    "EVENT_BATCH failed: Unable to process event for: %s, %s, %s, %s",
+                    interface_id,
+                    channel_address,
+                    parameter,
+                    reduce_args(args=ex.args),
+                )
+                continue
+            self.fire_entity_event_callback(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                parameter=parameter,
+                value=value,
+            )
 
-        self.last_events[interface_id] = datetime.now()
+    def _process_event(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Handle the pong or call the subscribed entities for an event."""
         # No need to check the response of a XmlRPC-PING
         if parameter == Parameter.PONG:
             if "#" in value:
@@ -841,9 +970,19 @@ class CentralUnit:
                             pong_ts=datetime.strptime(v_timestamp, DATETIME_FORMAT_MILLIS)
                         )
             return
-        if (channel_address, parameter) in self._entity_event_subscriptions:
+        if (
+            parameter == Parameter.DUTY_CYCLE_LEVEL
+            and (interface_client := self._clients.get(interface_id))
+            and interface_client.command_queue
+        ):
+            interface_client.command_queue.set_duty_cycle_level(
+                channel_address=channel_address, value=value
+            )
+        if callbacks := self._event_subscriptions.get_handlers(
+            channel_address=channel_address, parameter=parameter
+        ):
             try:
-                for callback in self._entity_event_subscriptions[(channel_address, parameter)]:
+                for callback in callbacks:
                     callback(value)
             except RuntimeError as rte:  # pragma: no cover
                 _LOGGER.debug(
@@ -874,14 +1013,13 @@ class CentralUnit:
     def add_event_subscription(self, entity: BaseEntity) -> None:
         """Add entity to central event subscription."""
         if isinstance(entity, (GenericEntity, GenericEvent)) and entity.supports_events:
-            if (
-                entity.channel_address,
-                entity.parameter,
-            ) not in self._entity_event_subscriptions:
-                self._entity_event_subscriptions[(entity.channel_address, entity.parameter)] = []
-            self._entity_event_subscriptions[(entity.channel_address, entity.parameter)].append(
-                entity.event
+            self.remove_event_subscription(entity=entity)
+            token = self._event_subscriptions.subscribe(
+                channel_address=entity.channel_address,
+                parameter=entity.parameter,
+                handler=entity.event,
             )
+            self._event_subscription_tokens[entity.unique_id] = token
 
     async def remove_device(self, device: HmDevice) -> None:
         """Remove device to central collections."""
@@ -891,6 +1029,9 @@ class CentralUnit:
                 device.device_address,
             )
             return
+        # All handlers of the device are removed at once. The removal of the entities
+        # only drops their tokens, as their handlers are already unsubscribed.
+        self._event_subscriptions.unsubscribe_device(device_address=device.device_address)
         device.clear_collections()
 
         await self.device_descriptions.remove_device(device=device)
@@ -900,12 +1041,8 @@ class CentralUnit:
 
     def remove_event_subscription(self, entity: BaseEntity) -> None:
         """Remove event subscription from central collections."""
-        if (
-            isinstance(entity, (GenericEntity, GenericEvent))
-            and entity.supports_events
-            and (entity.channel_address, entity.parameter) in self._entity_event_subscriptions
-        ):
-            del self._entity_event_subscriptions[(entity.channel_address, entity.parameter)]
+        if (token := self._event_subscription_tokens.pop(entity.unique_id, None)) is not None:
+            self._event_subscriptions.unsubscribe(token=token)
 
     def create_task(self, target: Awaitable, name: str) -> None:
         """Add task to the executor pool."""
@@ -969,6 +1106,58 @@ class CentralUnit:
             await self.data_cache.load()
         await self.data_cache.refresh_entity_data(paramset_key=paramset_key)
 
+    async def refresh_interfaces_data(self, interface_ids: Collection[str]) -> None:
+        """Refresh the entity data of interfaces with one request per interface."""
+        for interface_id in interface_ids:
+            await self.refresh_interface_data(interface_id=interface_id)
+
+    @measure_execution_time
+    async def refresh_interface_data(self, interface_id: str) -> None:
+        """Refresh the entity data of an interface with one request for the interface."""
+        if not self.has_client(interface_id=interface_id):
+            return
+        await self.get_client(interface_id=interface_id).fetch_device_data()
+        await self.data_cache.refresh_entity_data(
+            paramset_key=ParamsetKey.VALUES, interface_id=interface_id
+        )
+
+    async def refresh_device_data(
+        self, interface_id: str, device_addresses: Collection[str]
+    ) -> None:
+        """Refresh the entity data of some devices with one request for the devices."""
+        if not device_addresses or not self.has_client(interface_id=interface_id):
+            return
+        await self.get_client(interface_id=interface_id).fetch_device_data(
+            addresses=device_addresses
+        )
+        await self.data_cache.refresh_entity_data(
+            paramset_key=ParamsetKey.VALUES, device_addresses=device_addresses
+        )
+
+    def add_device_data_refresh(self, interface_id: str, device_address: str) -> None:
+        """Refresh the entity data of a device soon. Devices of an interface are collected."""
+        self._loop.call_soon_threadsafe(
+            self._add_device_data_refresh, interface_id, device_address
+        )
+
+    def _add_device_data_refresh(self, interface_id: str, device_address: str) -> None:
+        """Add a device to the next refresh of its interface."""
+        if (device_addresses := self._device_data_refreshes.get(interface_id)) is None:
+            device_addresses = self._device_data_refreshes[interface_id] = set()
+            self._async_create_task(
+                self._refresh_collected_device_data(interface_id=interface_id),
+                name=f"refresh_device_data_{interface_id}",
+            )
+        device_addresses.add(device_address)
+
+    async def _refresh_collected_device_data(self, interface_id: str) -> None:
+        """Refresh the devices of an interface, that have been collected within the delay."""
+        await asyncio.sleep(DEFAULT_DEVICE_DATA_REFRESH_DELAY)
+        if device_addresses := self._device_data_refreshes.pop(interface_id, None):
+            await self.refresh_device_data(
+                interface_id=interface_id, device_addresses=device_addresses
+            )
+
     async def get_system_variable(self, name: str) -> Any | None:
         """Get system variable from CCU / Homegear."""
         if client := self.primary_client:
@@ -1152,6 +1341,16 @@ class CentralUnit:
         return f"central name: {self.name}"
 
 
+def _register_xml_rpc_server(
+    central_config: CentralConfig,
+) -> xmlrpc.XmlRpcServer | xmlrpc.AsyncXmlRpcServer:
+    """Register the xml rpc server that matches the central config."""
+    local_port = central_config.callback_port or central_config.default_callback_port
+    if central_config.async_xml_rpc_server:
+        return xmlrpc.register_async_xml_rpc_server(local_port=local_port)
+    return xmlrpc.register_xml_rpc_server(local_port=local_port)
+
+
 class ConnectionChecker(threading.Thread):
     """Periodically check Connection to CCU / Homegear."""
 
@@ -1192,6 +1391,7 @@ class ConnectionChecker(threading.Thread):
                     await self._central.restart_clients()
                 else:
                     reconnects: list[Any] = []
+                    reconnected_interface_ids: list[str] = []
                     for interface_id in self._central.interface_ids:
                         # check:
                         #  - client is available
@@ -1204,10 +1404,16 @@ class ConnectionChecker(threading.Thread):
                             or not client.is_callback_alive()
                         ):
                             reconnects.append(client.reconnect())
+                            reconnected_interface_ids.append(interface_id)
+                        else:
+                            await client.update_duty_cycle_level()
                     if reconnects:
                         await asyncio.gather(*reconnects)
                         if self._central.available:
-                            await self._central.load_and_refresh_entity_data()
+                            # Only the data of the reconnected interfaces is outdated.
+                            await self._central.refresh_interfaces_data(
+                                interface_ids=reconnected_interface_ids
+                            )
             except NoConnection as nex:
                 _LOGGER.error(
                     "CHECK_CONNECTION failed: no connection: %s", reduce_args(args=nex.args)
@@ -1220,7 +1426,17 @@ class ConnectionChecker(threading.Thread):
                     reduce_args(args=err.args),
                 )
             if self._active:
-                await asyncio.sleep(config.CONNECTION_CHECKER_INTERVAL)
+                await asyncio.sleep(self._get_check_interval())
+
+    def _get_check_interval(self) -> float:
+        """Return the seconds until the next check. Open circuits are probed, when due."""
+        interval = float(config.CONNECTION_CHECKER_INTERVAL)
+        for client in self._central.clients:
+            if (
+                circuit_breaker := client.circuit_breaker
+            ) and circuit_breaker.state == CircuitState.OPEN:
+                interval = min(interval, max(_MIN_CHECK_INTERVAL, circuit_breaker.retry_in))
+        return interval
 
 
 class CentralConfig:
@@ -1244,6 +1460,21 @@ class CentralConfig:
         json_port: int | None = None,
         un_ignore_list: list[str] | None = None,
         start_direct: bool = False,
+        async_xml_rpc_server: bool = DEFAULT_ASYNC_XML_RPC_SERVER,
+        async_xml_rpc_proxy: bool = DEFAULT_ASYNC_XML_RPC_PROXY,
+        weak_event_subscriptions: bool = DEFAULT_WEAK_EVENT_SUBSCRIPTIONS,
+        event_policy_list: list[str] | None = None,
+        event_queue_high_water_mark: int = DEFAULT_EVENT_QUEUE_HIGH_WATER_MARK,
+        event_overload_policy: EventOverloadPolicy = DEFAULT_EVENT_OVERLOAD_POLICY,
+        max_read_workers: int = DEFAULT_MAX_READ_WORKERS,
+        adaptive_read_concurrency: bool = DEFAULT_ADAPTIVE_READ_CONCURRENCY,
+        write_coalescing_window: float = DEFAULT_WRITE_COALESCING_WINDOW,
+        command_queue_rate: float = DEFAULT_COMMAND_QUEUE_RATE,
+        command_queue_size: int = DEFAULT_COMMAND_QUEUE_SIZE,
+        circuit_breaker_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        adaptive_timeouts: bool = DEFAULT_ADAPTIVE_TIMEOUTS,
+        adaptive_timeout_min: float = DEFAULT_ADAPTIVE_TIMEOUT_MIN,
+        sysvar_delta_polling: bool = DEFAULT_SYSVAR_DELTA_POLLING,
     ) -> None:
         """Init the client config."""
         self.connection_state: Final = CentralConnectionState()
@@ -1263,6 +1494,21 @@ class CentralConfig:
         self.json_port: Final = json_port
         self.un_ignore_list: Final = un_ignore_list
         self.start_direct = start_direct
+        self.async_xml_rpc_server: Final = async_xml_rpc_server
+        self.async_xml_rpc_proxy: Final = async_xml_rpc_proxy
+        self.weak_event_subscriptions: Final = weak_event_subscriptions
+        self.event_policy_list: Final = event_policy_list
+        self.event_queue_high_water_mark: Final = event_queue_high_water_mark
+        self.event_overload_policy: Final = event_overload_policy
+        self.max_read_workers: Final = max_read_workers
+        self.adaptive_read_concurrency: Final = adaptive_read_concurrency
+        self.write_coalescing_window: Final = write_coalescing_window
+        self.command_queue_rate: Final = command_queue_rate
+        self.command_queue_size: Final = command_queue_size
+        self.circuit_breaker_threshold: Final = circuit_breaker_threshold
+        self.adaptive_timeouts: Final = adaptive_timeouts
+        self.adaptive_timeout_min: Final = adaptive_timeout_min
+        self.sysvar_delta_polling: Final = sysvar_delta_polling
 
     @property
     def central_url(self) -> str:
@@ -1280,6 +1526,11 @@ class CentralConfig:
         """Return if server and connection checker should be started."""
         return self.start_direct is False
 
+    @property
+    def load_event_policy(self) -> bool:
+        """Return if the event policy file should be loaded."""
+        return self.start_direct is False
+
     @property
     def load_un_ignore(self) -> bool:
         """Return if unignore should be loaded."""
@@ -1321,6 +1572,12 @@ class CentralConfig:
             client_session=self.client_session,
             tls=self.tls,
             verify_tls=self.verify_tls,
+            latency_tracker=LatencyTracker(
+                name=f"{self.name}-JSON-RPC",
+                adaptive=self.adaptive_timeouts,
+                min_timeout=self.adaptive_timeout_min,
+                max_timeout=config.TIMEOUT,
+            ),
         )
 
 
@@ -1338,7 +1595,10 @@ class CentralConnectionState:
             self._json_issues.append(iid)
             _LOGGER.debug("add_issue: add issue  [%s] for JsonRpcAioHttpClient", iid)
             return True
-        if isinstance(issuer, XmlRpcProxy) and iid not in self._xml_proxy_issues:
+        if (
+            isinstance(issuer, XmlRpcProxy | AsyncXmlRpcProxy)
+            and iid not in self._xml_proxy_issues
+        ):
             self._xml_proxy_issues.append(iid)
             _LOGGER.debug("add_issue: add issue [%s] for %s", iid, issuer.interface_id)
             return True
@@ -1350,7 +1610,10 @@ class CentralConnectionState:
             self._json_issues.remove(iid)
             _LOGGER.debug("remove_issue: removing issue [%s] for JsonRpcAioHttpClient", iid)
             return True
-        if isinstance(issuer, XmlRpcProxy) and issuer.interface_id in self._xml_proxy_issues:
+        if (
+            isinstance(issuer, XmlRpcProxy | AsyncXmlRpcProxy)
+            and issuer.interface_id in self._xml_proxy_issues
+        ):
             self._xml_proxy_issues.remove(iid)
             _LOGGER.debug("remove_issue: removing issue [%s] for %s", iid, issuer.interface_id)
             return True
@@ -1360,7 +1623,7 @@ class CentralConnectionState:
         """Add issue to collection."""
         if isinstance(issuer, JsonRpcAioHttpClient):
             return iid in self._json_issues
-        if isinstance(issuer, XmlRpcProxy):
+        if isinstance(issuer, XmlRpcProxy | AsyncXmlRpcProxy):
             return iid in self._xml_proxy_issues
 
     def handle_exception_log(
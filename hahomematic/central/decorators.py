@@ -68,32 +68,3 @@ def callback_system_event(system_event: SystemEvent) -> Callable:
         return wrapper_callback_system_event
 
     return decorator_callback_system_event
-
-
-def callback_event(func: Callable[_P, _R]) -> Callable[_P, _R]:
-    """Check if callback_event is set and call it AFTER original function."""
-
-    @wraps(func)
-    def wrapper_callback_event(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-        """Wrap callback events."""
-        return_value = func(*args, **kwargs)
-        _exec_callback_entity_event(*args, **kwargs)
-        return return_value
-
-    def _exec_callback_entity_event(*args: Any, **kwargs: Any) -> None:
-        """Execute the callback for an entity event."""
-        try:
-            args = args[1:]
-            interface_id: str = args[0] if len(args) > 1 else str(kwargs[_INTERFACE_ID])
-            if client := hmcl.get_client(interface_id=interface_id):
-                client.last_updated = datetime.now()
-                client.central.fire_entity_event_callback(*args, **kwargs)
-        except Exception as err:  # pragma: no cover
-            _LOGGER.warning(
-                "EXEC_CALLBACK_ENTITY_EVENT failed: Unable to reduce kwargs for callback_event"
-            )
-            raise HaHomematicException(
-                f"args-exception callback_event [{reduce_args(args=err.args)}]"
-            ) from err
-
-    return wrapper_callback_event
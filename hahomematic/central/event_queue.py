@@ -0,0 +1,455 @@
+"""
+Event queue module.
+
+Hands over events received by the XmlRPC-Server thread
+to the event loop of the central.
+Events are drained by priority lane, and above the high water mark
+the overload policy of the central config is applied.
+"""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Final
+
+from hahomematic import central as hmcu
+from hahomematic.const import (
+    AVAILABILITY_EVENTS,
+    CLICK_EVENTS,
+    EVENT_COALESCED_EVENTS,
+    EVENT_DROPPED_EVENTS,
+    EVENT_OVERLOAD_POLICY,
+    IMPULSE_EVENTS,
+    NON_COALESCING_EVENTS,
+    TELEMETRY_EVENTS,
+    EventLane,
+    EventOverloadPolicy,
+    InterfaceEventType,
+)
+from hahomematic.support import reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Max seconds a producer is blocked by the BLOCK policy.
+_BLOCK_TIMEOUT: Final = 10.0
+# Events dispatched at once. The higher lanes are checked again after each chunk.
+_DRAIN_CHUNK_SIZE: Final = 100
+# Chunks per drain cycle, before the event loop is released to other tasks.
+_DRAIN_CHUNKS_PER_CYCLE: Final = 10
+# The depth never exceeds high water mark * factor. The oldest events of the lowest lane are dropped.
+_MAX_DEPTH_FACTOR: Final = 2
+# Min seconds between two overload reports of an ongoing overload.
+_OVERLOAD_REPORT_INTERVAL: Final = 30.0
+# Events, that are only coalesced by the COALESCE policy in case of an overload.
+_OVERLOAD_COALESCING_EVENTS: Final[tuple[str, ...]] = (*CLICK_EVENTS, *IMPULSE_EVENTS)
+# {parameter, lane}. All other events use the TELEMETRY lane.
+_EVENT_LANES: Final[Mapping[str, EventLane]] = {
+    **{parameter: EventLane.INTERACTION for parameter in _OVERLOAD_COALESCING_EVENTS},
+    **{parameter: EventLane.AVAILABILITY for parameter in AVAILABILITY_EVENTS},
+}
+
+# Upper bounds of the latency histogram buckets in seconds.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+
+class LatencyHistogram:
+    """Histogram of the latencies between receiving and dispatching events."""
+
+    def __init__(self) -> None:
+        """Init the latency histogram."""
+        # The last bucket counts the latencies above the last bound.
+        self._counts: Final[list[int]] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def buckets(self) -> dict[float, int]:
+        """Return the number of latencies per upper bound in seconds."""
+        return dict(zip((*LATENCY_BUCKETS, float("inf")), self._counts, strict=True))
+
+    @property
+    def count(self) -> int:
+        """Return the number of latencies."""
+        return self._count
+
+    @property
+    def max(self) -> float:
+        """Return the max latency in seconds."""
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """Return the mean latency in seconds."""
+        return self._sum / self._count if self._count else 0.0
+
+    def observe(self, latency: float) -> None:
+        """Add a latency in seconds."""
+        self._counts[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self._count += 1
+        self._sum += latency
+        if latency > self._max:
+            self._max = latency
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket, that contains the percentile."""
+        if not self._count:
+            return 0.0
+        threshold = self._count * percent / 100
+        total = 0
+        for bound, count in self.buckets.items():
+            total += count
+            if total >= threshold:
+                return bound
+        return float("inf")  # pragma: no cover
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EventQueueStatistics:
+    """Statistics of the event queue."""
+
+    depth: int
+    max_depth: int
+    received: int
+    coalesced: int
+    dropped: int
+    drained: int
+    drain_cycles: int
+
+
+class EventQueue:
+    """
+    Thread-safe queue for events (interface_id, channel_address, parameter, value).
+
+    Events are drained in batches on the event loop. Events for the same
+    channel_address and parameter within one drain cycle are coalesced
+    to the latest value, except for NON_COALESCING_EVENTS.
+
+    Events are queued in priority lanes (availability, interaction, telemetry).
+    Higher lanes are drained first in chunks, so a burst of telemetry events
+    doesn't delay events of higher lanes. The latency between receiving and
+    dispatching an event is recorded per lane, coalesced events keep their first
+    receive time.
+
+    If the depth reaches the high water mark, the overload policy is applied:
+    - COALESCE: Also click and impulse events are coalesced to the latest value.
+    - SHED_TELEMETRY: Telemetry events, that can not be coalesced, are dropped.
+    - BLOCK: The producer thread is blocked, until the queue has been drained.
+    Independent of the policy, the oldest events of the lowest lane are dropped
+    at twice the high water mark.
+    Dropped and coalesced events are reported per interface as interface event.
+    """
+
+    def __init__(
+        self,
+        central: hmcu.CentralUnit,
+        loop: asyncio.AbstractEventLoop,
+        high_water_mark: int,
+        overload_policy: EventOverloadPolicy,
+    ) -> None:
+        """Init the event queue."""
+        self._central: Final = central
+        self._loop: Final = loop
+        self._loop_thread_id: Final = threading.get_ident()
+        self._high_water_mark: Final = high_water_mark
+        self._max_queue_depth: Final = high_water_mark * _MAX_DEPTH_FACTOR
+        self._overload_policy: Final = overload_policy
+        self._lock: Final = threading.Lock()
+        self._drained_condition: Final = threading.Condition(self._lock)
+        # [lane, [(interface_id, channel_address, parameter, value, received)]]
+        self._lanes: list[list[tuple[str, str, str, Any, float]]] = [[] for _ in EventLane]
+        # [lane, position of the first event, that has not been drained]
+        self._lane_starts: list[int] = [0 for _ in EventLane]
+        self._depth: int = 0
+        # {(interface_id, channel_address, parameter), position in the lane}
+        self._positions: dict[tuple[str, str, str], int] = {}
+        self._drain_scheduled: bool = False
+        self._max_depth: int = 0
+        self._received: int = 0
+        self._coalesced: int = 0
+        self._dropped: int = 0
+        self._drained: int = 0
+        self._drain_cycles: int = 0
+        # {interface_id, number of events} since the last overload report
+        self._overload_dropped: dict[str, int] = {}
+        self._overload_coalesced: dict[str, int] = {}
+        self._last_overload_report: float | None = None
+        self._latencies: Final[dict[EventLane, LatencyHistogram]] = {
+            lane: LatencyHistogram() for lane in EventLane
+        }
+
+    @property
+    def depth(self) -> int:
+        """Return the number of events waiting to be drained."""
+        return self._depth
+
+    @property
+    def latencies(self) -> Mapping[EventLane, LatencyHistogram]:
+        """Return the latency histograms by lane."""
+        return self._latencies
+
+    @property
+    def statistics(self) -> EventQueueStatistics:
+        """Return the statistics of the event queue."""
+        with self._lock:
+            return EventQueueStatistics(
+                depth=self._depth,
+                max_depth=self._max_depth,
+                received=self._received,
+                coalesced=self._coalesced,
+                dropped=self._dropped,
+                drained=self._drained,
+                drain_cycles=self._drain_cycles,
+            )
+
+    def put(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
+        """Put an event into the queue. Can be called from any thread."""
+        self.put_batch(interface_id=interface_id, events=((channel_address, parameter, value),))
+
+    def put_batch(self, interface_id: str, events: tuple[tuple[str, str, Any], ...]) -> None:
+        """Put a batch of events (channel_address, parameter, value) into the queue."""
+        with self._lock:
+            if (
+                self._overload_policy == EventOverloadPolicy.BLOCK
+                and self._depth >= self._high_water_mark
+                and threading.get_ident() != self._loop_thread_id
+            ):
+                self._drained_condition.wait_for(
+                    lambda: self._depth < self._high_water_mark, timeout=_BLOCK_TIMEOUT
+                )
+            received = time.monotonic()
+            for channel_address, parameter, value in events:
+                self._received += 1
+                key = (interface_id, channel_address, parameter)
+                lane = self._lanes[_EVENT_LANES.get(parameter, EventLane.TELEMETRY)]
+                overloaded = self._depth >= self._high_water_mark
+                if (
+                    parameter not in NON_COALESCING_EVENTS
+                    or (
+                        overloaded
+                        and self._overload_policy == EventOverloadPolicy.COALESCE
+                        and parameter in _OVERLOAD_COALESCING_EVENTS
+                    )
+                ) and (position := self._positions.get(key)) is not None:
+                    # The first receive time is kept for the latency.
+                    lane[position] = (
+                        interface_id,
+                        channel_address,
+                        parameter,
+                        value,
+                        lane[position][4],
+                    )
+                    self._coalesced += 1
+                    if overloaded:
+                        self._overload_coalesced[interface_id] = (
+                            self._overload_coalesced.get(interface_id, 0) + 1
+                        )
+                    continue
+                if (
+                    overloaded
+                    and self._overload_policy == EventOverloadPolicy.SHED_TELEMETRY
+                    and parameter in TELEMETRY_EVENTS
+                ):
+                    self._dropped += 1
+                    self._overload_dropped[interface_id] = (
+                        self._overload_dropped.get(interface_id, 0) + 1
+                    )
+                    continue
+                if self._depth >= self._max_queue_depth:
+                    self._drop_oldest_event()
+                    lane = self._lanes[_EVENT_LANES.get(parameter, EventLane.TELEMETRY)]
+                self._positions[key] = len(lane)
+                lane.append((interface_id, channel_address, parameter, value, received))
+                self._depth += 1
+            self._max_depth = max(self._max_depth, self._depth)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError as rte:
+            _LOGGER.debug(
+                "EVENT_QUEUE: Unable to schedule drain [%s]. Dropping queued events",
+                reduce_args(args=rte.args),
+            )
+            self.clear()
+
+    def clear(self) -> None:
+        """Remove all queued events."""
+        with self._lock:
+            self._lanes = [[] for _ in EventLane]
+            self._lane_starts = [0 for _ in EventLane]
+            self._depth = 0
+            self._positions = {}
+            self._drain_scheduled = False
+            self._drained_condition.notify_all()
+
+    def _drop_oldest_event(self) -> None:
+        """Drop the oldest event of the lowest lane. Must be called with the lock."""
+        for lane in reversed(EventLane):
+            if events := self._take_events(lane=lane, count=1):
+                interface_id = events[0][0]
+                self._dropped += 1
+                self._overload_dropped[interface_id] = (
+                    self._overload_dropped.get(interface_id, 0) + 1
+                )
+                return
+
+    def _take_events(self, lane: EventLane, count: int) -> list[tuple[str, str, str, Any, float]]:
+        """Take the oldest events of a lane. Must be called with the lock."""
+        lane_events = self._lanes[lane]
+        start = self._lane_starts[lane]
+        events = lane_events[start : start + count]
+        for position, event in enumerate(events, start):
+            key = (event[0], event[1], event[2])
+            if self._positions.get(key) == position:
+                del self._positions[key]
+        start += len(events)
+        self._depth -= len(events)
+        if start >= len(lane_events):
+            self._lanes[lane] = []
+            start = 0
+        elif start >= _DRAIN_CHUNK_SIZE and start * 2 >= len(lane_events):
+            # Remove the drained events, the positions of the remaining events move.
+            remaining = lane_events[start:]
+            for position, event in enumerate(remaining):
+                key = (event[0], event[1], event[2])
+                if self._positions.get(key) == position + start:
+                    self._positions[key] = position
+            self._lanes[lane] = remaining
+            start = 0
+        self._lane_starts[lane] = start
+        return events
+
+    def _drain(self) -> None:
+        """Drain the queue in chunks, highest lane first. Must be run in the event loop."""
+        with self._lock:
+            self._drain_cycles += 1
+            overloaded = self._depth >= self._high_water_mark
+            has_overload_counters = bool(self._overload_dropped or self._overload_coalesced)
+
+        if has_overload_counters:
+            self._report_overload(overloaded=overloaded)
+
+        drained = False
+        try:
+            for _ in range(_DRAIN_CHUNKS_PER_CYCLE):
+                with self._lock:
+                    if self._depth == 0:
+                        self._drain_scheduled = False
+                        self._drained_condition.notify_all()
+                        drained = True
+                        return
+                    # The lanes are checked again for each chunk.
+                    lane = next(lane for lane in EventLane if self._lanes[lane])
+                    events = self._take_events(lane=lane, count=_DRAIN_CHUNK_SIZE)
+                    self._drained += len(events)
+                    if self._depth < self._high_water_mark:
+                        self._drained_condition.notify_all()
+                self._dispatch(events=events, latencies=self._latencies[lane])
+        finally:
+            # Release the event loop, before the next chunks are drained.
+            # This also keeps the drain running, if a dispatch failed.
+            if not drained:
+                self._loop.call_soon(self._drain)
+
+    def _dispatch(
+        self,
+        events: list[tuple[str, str, str, Any, float]],
+        latencies: LatencyHistogram,
+    ) -> None:
+        """Dispatch the events of a lane grouped by interface to the central."""
+        batch: list[tuple[str, str, Any]] = []
+        batch_received: list[float] = []
+        batch_interface_id = ""
+        for interface_id, channel_address, parameter, value, received in events:
+            if batch and interface_id != batch_interface_id:
+                self._dispatch_batch(
+                    interface_id=batch_interface_id,
+                    batch=batch,
+                    batch_received=batch_received,
+                    latencies=latencies,
+                )
+                batch = []
+                batch_received = []
+            batch_interface_id = interface_id
+            batch.append((channel_address, parameter, value))
+            batch_received.append(received)
+        if batch:
+            self._dispatch_batch(
+                interface_id=batch_interface_id,
+                batch=batch,
+                batch_received=batch_received,
+                latencies=latencies,
+            )
+
+    def _dispatch_batch(
+        self,
+        interface_id: str,
+        batch: list[tuple[str, str, Any]],
+        batch_received: list[float],
+        latencies: LatencyHistogram,
+    ) -> None:
+        """Dispatch a batch of events and record their latencies."""
+        try:
+            self._central.event_batch(interface_id=interface_id, events=batch)
+        except Exception as ex:
+            _LOGGER.warning(
+                "EVENT_QUEUE: Failed to dispatch %i events for %s: %s [%s]",
+                len(batch),
+                interface_id,
+                type(ex).__name__,
+                reduce_args(args=ex.args),
+            )
+        dispatched = time.monotonic()
+        for received in batch_received:
+            latencies.observe(dispatched - received)
+
+    def _report_overload(self, overloaded: bool) -> None:
+        """Report the dropped and coalesced events per interface. Must be run in the event loop."""
+        now = self._loop.time()
+        if (
+            overloaded
+            and self._last_overload_report is not None
+            and now - self._last_overload_report < _OVERLOAD_REPORT_INTERVAL
+        ):
+            return
+        self._last_overload_report = now
+        with self._lock:
+            dropped = self._overload_dropped
+            coalesced = self._overload_coalesced
+            self._overload_dropped = {}
+            self._overload_coalesced = {}
+
+        for interface_id in sorted(dropped.keys() | coalesced.keys()):
+            _LOGGER.warning(
+                "EVENT_QUEUE: Overload of the event queue for %s. "
+                "Dropped %i and coalesced %i events with policy %s",
+                interface_id,
+                dropped.get(interface_id, 0),
+                coalesced.get(interface_id, 0),
+                self._overload_policy,
+            )
+            self._central.fire_interface_event(
+                interface_id=interface_id,
+                interface_event_type=InterfaceEventType.EVENT_OVERLOAD,
+                data={
+                    EVENT_DROPPED_EVENTS: dropped.get(interface_id, 0),
+                    EVENT_COALESCED_EVENTS: coalesced.get(interface_id, 0),
+                    EVENT_OVERLOAD_POLICY: str(self._overload_policy),
+                },
+            )
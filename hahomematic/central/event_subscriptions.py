@@ -0,0 +1,116 @@
+"""
+Event subscription module.
+
+Keeps the handlers that are subscribed to events of a channel_address and parameter.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from itertools import count
+import logging
+from typing import Any, Final
+import weakref
+
+from hahomematic.support import get_device_address
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any], None]
+
+
+class EventSubscriptions:
+    """
+    Registry for event handlers.
+
+    Handlers are indexed by device_address, channel_address and parameter.
+    Every subscription returns a token, that is used to unsubscribe.
+    With use_weak_references the registry does not keep the handlers alive.
+    """
+
+    def __init__(self, use_weak_references: bool = False) -> None:
+        """Init the event subscriptions."""
+        self._use_weak_references: Final = use_weak_references
+        self._token_counter: Final = count(1)
+        # {device_address, {channel_address, {parameter, {token, handler}}}}
+        self._devices: Final[dict[str, dict[str, dict[str, dict[int, Any]]]]] = {}
+        # {(channel_address, parameter), {token, handler}}
+        self._handlers: Final[dict[tuple[str, str], dict[int, Any]]] = {}
+        # {token, (channel_address, parameter)}
+        self._tokens: Final[dict[int, tuple[str, str]]] = {}
+
+    @property
+    def use_weak_references(self) -> bool:
+        """Return if the handlers are stored as weak references."""
+        return self._use_weak_references
+
+    def __len__(self) -> int:
+        """Return the number of subscribed handlers."""
+        return len(self._tokens)
+
+    def subscribe(self, channel_address: str, parameter: str, handler: EventHandler) -> int:
+        """Subscribe a handler to events of a channel_address and parameter."""
+        token = next(self._token_counter)
+        if (handlers := self._handlers.get((channel_address, parameter))) is None:
+            handlers = self._handlers[(channel_address, parameter)] = {}
+            self._devices.setdefault(get_device_address(channel_address), {}).setdefault(
+                channel_address, {}
+            )[parameter] = handlers
+        handlers[token] = self._create_reference(handler) if self._use_weak_references else handler
+        self._tokens[token] = (channel_address, parameter)
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Unsubscribe the handler of a token."""
+        if (key := self._tokens.pop(token, None)) is None:
+            return
+        if (handlers := self._handlers.get(key)) is None:
+            return
+        handlers.pop(token, None)
+        if not handlers:
+            self._remove_parameter(channel_address=key[0], parameter=key[1])
+
+    def unsubscribe_device(self, device_address: str) -> None:
+        """Unsubscribe all handlers of a device."""
+        if (channels := self._devices.pop(device_address, None)) is None:
+            return
+        for channel_address, parameters in channels.items():
+            for parameter, handlers in parameters.items():
+                for token in handlers:
+                    del self._tokens[token]
+                del self._handlers[(channel_address, parameter)]
+
+    def get_handlers(self, channel_address: str, parameter: str) -> Collection[EventHandler]:
+        """Return the handlers that are subscribed to a channel_address and parameter."""
+        if (handlers := self._handlers.get((channel_address, parameter))) is None:
+            return ()
+        if not self._use_weak_references:
+            return tuple(handlers.values())
+        live_handlers: list[EventHandler] = []
+        for token, reference in tuple(handlers.items()):
+            if (handler := reference()) is None:
+                self.unsubscribe(token=token)
+                continue
+            live_handlers.append(handler)
+        return tuple(live_handlers)
+
+    def has_subscription(self, channel_address: str, parameter: str) -> bool:
+        """Return if a handler is subscribed to a channel_address and parameter."""
+        return (channel_address, parameter) in self._handlers
+
+    def _remove_parameter(self, channel_address: str, parameter: str) -> None:
+        """Remove a channel_address and parameter without handlers."""
+        del self._handlers[(channel_address, parameter)]
+        device_address = get_device_address(channel_address)
+        channels = self._devices[device_address]
+        del channels[channel_address][parameter]
+        if not channels[channel_address]:
+            del channels[channel_address]
+        if not channels:
+            del self._devices[device_address]
+
+    @staticmethod
+    def _create_reference(handler: EventHandler) -> Callable[[], EventHandler | None]:
+        """Return a weak reference to the handler."""
+        if hasattr(handler, "__self__"):
+            return weakref.WeakMethod(handler)
+        return weakref.ref(handler)
@@ -6,15 +6,19 @@ with the CCU or Homegear.
 """
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import threading
 from typing import Any, Final
-from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+from aiohttp import web
 
 from hahomematic import central as hmcu
 from hahomematic.central.decorators import callback_system_event
 from hahomematic.const import IP_ANY_V4, PORT_ANY, SystemEvent
-from hahomematic.support import find_free_port
+from hahomematic.support import find_free_port, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -23,13 +27,25 @@ _LOGGER: Final = logging.getLogger(__name__)
 class RPCFunctions:
     """The XML-RPC functions the CCU or Homegear will expect."""
 
-    def __init__(self, xml_rpc_server: XmlRpcServer) -> None:
+    def __init__(self, xml_rpc_server: BaseXmlRpcServer) -> None:
         """Init RPCFunctions."""
         self._xml_rpc_server: Final = xml_rpc_server
 
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
+        if self._xml_rpc_server.event_recorder is not None:
+            self._xml_rpc_server.record_events(
+                interface_id=interface_id, events=((channel_address, parameter, value),)
+            )
         if central := self._xml_rpc_server.get_central(interface_id):
+            if self._xml_rpc_server.use_event_queue:
+                central.event_queue.put(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    parameter=parameter,
+                    value=value,
+                )
+                return
             central.event(
                 interface_id=interface_id,
                 channel_address=channel_address,
@@ -37,6 +53,16 @@ class RPCFunctions:
                 value=value,
             )
 
+    def event_batch(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        """Handle a batch of events (channel_address, parameter, value) of one interface."""
+        if self._xml_rpc_server.event_recorder is not None:
+            self._xml_rpc_server.record_events(interface_id=interface_id, events=tuple(events))
+        if central := self._xml_rpc_server.get_central(interface_id):
+            if self._xml_rpc_server.use_event_queue:
+                central.event_queue.put_batch(interface_id=interface_id, events=tuple(events))
+                return
+            central.event_batch(interface_id=interface_id, events=events)
+
     @callback_system_event(system_event=SystemEvent.ERROR)
     def error(self, interface_id: str, error_code: str, msg: str) -> None:
         """When some error occurs the CCU / Homegear will send its error message here."""
@@ -126,18 +152,15 @@ class RequestHandler(SimpleXMLRPCRequestHandler):
     )
 
 
-class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
+class HaHomematicXMLRPCDispatcher(SimpleXMLRPCDispatcher):
     """
-    Simple XML-RPC server.
+    XML-RPC dispatcher.
 
-    Simple XML-RPC server that allows functions and a single instance
-    to be installed to handle requests. The default implementation
-    attempts to dispatch XML-RPC calls to the functions or instance
-    installed in the server. Override the _dispatch method inherited
-    from SimpleXMLRPCDispatcher to change this behavior.
+    Dispatches XML-RPC calls to the registered RPCFunctions.
 
     This implementation adds an additional method:
     system_listMethods(self, interface_id: str.
+    and handles bundles of events within a system.multicall as a batch.
     """
 
     def system_listMethods(self, interface_id: str | None = None) -> list[str]:
@@ -147,14 +170,145 @@ class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
         system.listMethods() => ['add', 'subtract', 'multiple']
         Required for HomeMatic CCU usage.
         """
-        return SimpleXMLRPCServer.system_listMethods(self)
+        return SimpleXMLRPCDispatcher.system_listMethods(self)
+
+    def system_multicall(self, call_list: list[dict[str, Any]]) -> list[Any]:
+        """
+        Dispatch multiple calls in a single request.
+
+        Consecutive event calls of the same interface are handed over
+        as one batch, all other calls are dispatched one by one.
+        """
+        if not isinstance(rpc_functions := self.instance, RPCFunctions):
+            return SimpleXMLRPCDispatcher.system_multicall(self, call_list)
+
+        results: list[Any] = []
+        batch: list[tuple[str, str, Any]] = []
+        batch_interface_id = ""
+        for call in call_list:
+            if call.get("methodName") == "event" and len(params := call.get("params", ())) == 4:
+                interface_id, channel_address, parameter, value = params
+                if batch and interface_id != batch_interface_id:
+                    results.extend(
+                        _dispatch_event_batch(
+                            rpc_functions=rpc_functions,
+                            interface_id=batch_interface_id,
+                            events=batch,
+                        )
+                    )
+                    batch = []
+                batch_interface_id = interface_id
+                batch.append((channel_address, parameter, value))
+                continue
+            if batch:
+                results.extend(
+                    _dispatch_event_batch(
+                        rpc_functions=rpc_functions, interface_id=batch_interface_id, events=batch
+                    )
+                )
+                batch = []
+            results.extend(SimpleXMLRPCDispatcher.system_multicall(self, [call]))
+        if batch:
+            results.extend(
+                _dispatch_event_batch(
+                    rpc_functions=rpc_functions, interface_id=batch_interface_id, events=batch
+                )
+            )
+        return results
+
+
+class HaHomematicXMLRPCServer(SimpleXMLRPCServer, HaHomematicXMLRPCDispatcher):
+    """
+    Simple XML-RPC server.
+
+    Simple XML-RPC server that allows functions and a single instance
+    to be installed to handle requests. The dispatching is done
+    by the HaHomematicXMLRPCDispatcher.
+    """
+
+
+def _dispatch_event_batch(
+    rpc_functions: RPCFunctions, interface_id: str, events: list[tuple[str, str, Any]]
+) -> list[Any]:
+    """Dispatch a batch of events and return the multicall results."""
+    try:
+        rpc_functions.event_batch(interface_id=interface_id, events=events)
+    except Exception as ex:
+        _LOGGER.warning(
+            "EVENT_BATCH failed: interface_id = %s, event_count = %i [%s]",
+            interface_id,
+            len(events),
+            reduce_args(args=ex.args),
+        )
+        return [{"faultCode": 1, "faultString": f"{type(ex)}:{ex}"}] * len(events)
+    return [[None]] * len(events)
+
+
+def _record_events(
+    event_recorder: Callable[[str, str, str, Any], None],
+    interface_id: str,
+    events: tuple[tuple[str, str, Any], ...],
+) -> None:
+    """Record events. Failures of the recorder must not stop the delivery of events."""
+    try:
+        for channel_address, parameter, value in events:
+            event_recorder(interface_id, channel_address, parameter, value)
+    except Exception as ex:
+        _LOGGER.warning(
+            "RECORD_EVENTS failed: %s [%s] for %s",
+            type(ex).__name__,
+            reduce_args(args=ex.args),
+            interface_id,
+        )
+
+
+class BaseXmlRpcServer:
+    """Base class for XML-RPC servers that handle messages from CCU / Homegear."""
+
+    # Events are handed over to the event loop by the event queue of the central
+    use_event_queue: bool = False
+
+    def __init__(self) -> None:
+        """Init the XML-RPC server base."""
+        self._centrals: Final[dict[str, hmcu.CentralUnit]] = {}
+        # Signature: (interface_id, channel_address, parameter, value)
+        # Receives every incoming event, e.g. to record the event stream.
+        self.event_recorder: Callable[[str, str, str, Any], None] | None = None
+
+    def record_events(self, interface_id: str, events: tuple[tuple[str, str, Any], ...]) -> None:
+        """Pass events (channel_address, parameter, value) to the event recorder."""
+        if (event_recorder := self.event_recorder) is not None:
+            _record_events(event_recorder=event_recorder, interface_id=interface_id, events=events)
+
+    def register_central(self, central: hmcu.CentralUnit) -> None:
+        """Register a central in the XmlRPC-Server."""
+        if not self._centrals.get(central.name):
+            self._centrals[central.name] = central
+
+    def un_register_central(self, central: hmcu.CentralUnit) -> None:
+        """Unregister a central from XmlRPC-Server."""
+        if self._centrals.get(central.name):
+            del self._centrals[central.name]
+
+    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
+        """Return a central by interface_id."""
+        if (instance := hmcu.INTERFACE_INSTANCES.get(interface_id)) is None:
+            return None
+        central = instance[0]
+        return central if self._centrals.get(central.name) is central else None
+
+    @property
+    def no_central_registered(self) -> bool:
+        """Return if no central is registered."""
+        return len(self._centrals) == 0
 
 
-class XmlRpcServer(threading.Thread):
+class XmlRpcServer(threading.Thread, BaseXmlRpcServer):
     """XML-RPC server thread to handle messages from CCU / Homegear."""
 
     _initialized: bool = False
     _instances: Final[dict[int, XmlRpcServer]] = {}
+    use_event_queue = True
 
     def __init__(
         self,
@@ -167,6 +321,7 @@ class XmlRpcServer(threading.Thread):
         self.local_port: Final[int] = find_free_port() if local_port == PORT_ANY else local_port
         self._instances[self.local_port] = self
         threading.Thread.__init__(self, name=f"XmlRpcServer on port {self.local_port}")
+        BaseXmlRpcServer.__init__(self)
         self._simple_xml_rpc_server = HaHomematicXMLRPCServer(
             (IP_ANY_V4, self.local_port),
             requestHandler=RequestHandler,
@@ -176,7 +331,6 @@ class XmlRpcServer(threading.Thread):
         self._simple_xml_rpc_server.register_introspection_functions()
         self._simple_xml_rpc_server.register_multicall_functions()
         self._simple_xml_rpc_server.register_instance(RPCFunctions(self), allow_dotted_names=True)
-        self._centrals: Final[dict[str, hmcu.CentralUnit]] = {}
 
     def __new__(cls, local_port: int) -> XmlRpcServer:
         """Create new XmlRPC server."""
@@ -205,27 +359,93 @@ class XmlRpcServer(threading.Thread):
         """Return if thread is active."""
         return self._started.is_set() is True  # type: ignore[attr-defined]
 
-    def register_central(self, central: hmcu.CentralUnit) -> None:
-        """Register a central in the XmlRPC-Server."""
-        if not self._centrals.get(central.name):
-            self._centrals[central.name] = central
 
-    def un_register_central(self, central: hmcu.CentralUnit) -> None:
-        """Unregister a central from XmlRPC-Server."""
-        if self._centrals.get(central.name):
-            del self._centrals[central.name]
+class AsyncXmlRpcServer(BaseXmlRpcServer):
+    """
+    Asyncio XML-RPC server to handle messages from CCU / Homegear.
 
-    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
-        """Return a central by interface_id."""
-        for central in self._centrals.values():
-            if central.has_client(interface_id=interface_id):
-                return central
-        return None
+    Runs on the event loop of the central, so requests of several
+    backends are handled concurrently without a thread hop.
+    """
+
+    _initialized: bool = False
+    _instances: Final[dict[int, AsyncXmlRpcServer]] = {}
+
+    def __init__(
+        self,
+        local_port: int = PORT_ANY,
+    ) -> None:
+        """Init async XmlRPC server."""
+        if self._initialized:
+            return
+        self._initialized = True
+        super().__init__()
+        self.local_port: Final[int] = find_free_port() if local_port == PORT_ANY else local_port
+        self._instances[self.local_port] = self
+        self._dispatcher: Final = HaHomematicXMLRPCDispatcher(allow_none=True, encoding=None)
+        self._dispatcher.register_introspection_functions()
+        self._dispatcher.register_multicall_functions()
+        self._dispatcher.register_instance(RPCFunctions(self), allow_dotted_names=True)
+        self._app: Final = web.Application()
+        for rpc_path in RequestHandler.rpc_paths:
+            self._app.router.add_post(rpc_path, self._handle_request)
+        self._runner: web.AppRunner | None = None
+        # One worker keeps the order of the recorded events.
+        self._record_executor: ThreadPoolExecutor | None = None
+
+    def __new__(cls, local_port: int) -> AsyncXmlRpcServer:
+        """Create new async XmlRPC server."""
+        if (xml_rpc := cls._instances.get(local_port)) is None:
+            _LOGGER.debug("Creating async XmlRpc server")
+            return super().__new__(cls)
+        return xml_rpc
+
+    async def start(self) -> None:
+        """Start the async XmlRPC-Server."""
+        if self._runner is not None:
+            return
+        _LOGGER.debug(
+            "START: Starting async XmlRPC-Server at http://%s:%i", IP_ANY_V4, self.local_port
+        )
+        runner = web.AppRunner(self._app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host=IP_ANY_V4, port=self.local_port, reuse_address=True).start()
+        self._runner = runner
+
+    async def stop(self) -> None:
+        """Stop the async XmlRPC-Server."""
+        _LOGGER.debug("STOP: Shutting down async XmlRPC-Server")
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._record_executor is not None:
+            self._record_executor.shutdown(wait=False)
+            self._record_executor = None
+        _LOGGER.debug("STOP: Async XmlRPC-Server stopped")
+        if self.local_port in self._instances:
+            del self._instances[self.local_port]
 
     @property
-    def no_central_registered(self) -> bool:
-        """Return if no central is registered."""
-        return len(self._centrals) == 0
+    def started(self) -> bool:
+        """Return if the server is serving."""
+        return self._runner is not None
+
+    def record_events(self, interface_id: str, events: tuple[tuple[str, str, Any], ...]) -> None:
+        """Record events in the executor, file writes must not block the event loop."""
+        if (event_recorder := self.event_recorder) is None:
+            return
+        if self._record_executor is None:
+            self._record_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="EventRecorder"
+            )
+        self._record_executor.submit(_record_events, event_recorder, interface_id, events)
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Dispatch a XML-RPC request to the RPCFunctions."""
+        data = await request.read()
+        # pylint: disable=protected-access
+        response = self._dispatcher._marshaled_dispatch(data)  # type: ignore[arg-type]
+        return web.Response(body=response, content_type="text/xml")
 
 
 def register_xml_rpc_server(local_port: int = PORT_ANY) -> XmlRpcServer:
@@ -235,3 +455,8 @@ def register_xml_rpc_server(local_port: int = PORT_ANY) -> XmlRpcServer:
         xml_rpc.start()
         _LOGGER.debug("REGISTER_XML_RPC_SERVER: Starting XmlRPC-Server")
     return xml_rpc
+
+
+def register_async_xml_rpc_server(local_port: int = PORT_ANY) -> AsyncXmlRpcServer:
+    """Register the async xml rpc server. It is started with the central."""
+    return AsyncXmlRpcServer(local_port=local_port)
@@ -3,23 +3,39 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Collection, Iterable, Mapping
 from datetime import datetime
+from functools import partial
 import logging
+import math
 from typing import Any, Final, cast
+import xmlrpc.client
 
 from hahomematic import central as hmcu
 from hahomematic.caches.dynamic import PingPongCache
-from hahomematic.client.xml_rpc import XmlRpcProxy
-from hahomematic.config import CALLBACK_WARN_INTERVAL, RECONNECT_WAIT
+from hahomematic.client.circuit_breaker import CircuitBreaker
+from hahomematic.client.command_queue import CommandQueue
+from hahomematic.client.latency import LatencyTracker
+from hahomematic.client.limiter import ConcurrencyLimiter
+from hahomematic.client.write_scheduler import WriteScheduler
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, XmlRpcMethod, XmlRpcProxy
+from hahomematic.config import CALLBACK_WARN_INTERVAL, RECONNECT_WAIT, TIMEOUT
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
+    DEFAULT_CIRCUIT_BREAKER_BASE_DELAY,
+    DEFAULT_CIRCUIT_BREAKER_MAX_DELAY,
     EVENT_AVAILABLE,
+    EVENT_CIRCUIT_STATE,
+    EVENT_RETRY_IN,
     EVENT_SECONDS_SINCE_LAST_EVENT,
     HOMEGEAR_SERIAL,
     INIT_DATETIME,
+    NO_CACHE_ENTRY,
     VIRTUAL_REMOTE_TYPES,
     Backend,
     CallSource,
+    CircuitState,
+    CommandPriority,
     Description,
     ForcedDeviceAvailability,
     InterfaceEventType,
@@ -28,22 +44,35 @@ from hahomematic.const import (
     ProductGroup,
     ProgramData,
     ProxyInitState,
+    StartupMetadata,
+    SystemEvent,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
 )
 from hahomematic.exceptions import BaseHomematicException, NoConnection
 from hahomematic.performance import measure_execution_time
 from hahomematic.platforms.device import HmDevice
-from hahomematic.support import build_headers, build_xml_rpc_uri, get_channel_no, reduce_args
+from hahomematic.support import (
+    build_headers,
+    build_xml_rpc_uri,
+    get_channel_no,
+    monotonic_to_datetime,
+    reduce_args,
+)
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 _ADDRESS: Final = "address"
 _CHANNELS: Final = "channels"
+_DUTY_CYCLE: Final = "DUTY_CYCLE"
 _ID: Final = "id"
 _INTERFACE: Final = "interface"
 _NAME: Final = "name"
 
+# Max calls per system.multicall request.
+_MULTICALL_CHUNK_SIZE: Final = 100
+
 
 class Client(ABC):
     """Client object to access the backends via XML-RPC or JSON-RPC."""
@@ -61,23 +90,79 @@ class Client(ABC):
         self._available: bool = True
         self._connection_error_count: int = 0
         self._is_callback_alive: bool = True
-        self.last_updated: datetime = INIT_DATETIME
+        self._last_updated: datetime = INIT_DATETIME
+        # time.monotonic of the last event, only converted to a datetime on read
+        self.last_event_timestamp: float | None = None
         self._ping_pong_cache: Final = PingPongCache(
             central=client_config.central, interface_id=client_config.interface_id
         )
 
-        self._proxy: XmlRpcProxy
-        self._proxy_read: XmlRpcProxy
+        central_config = client_config.central.config
+        # Limits the parallel reads.
+        self._read_concurrency_limiter: Final = ConcurrencyLimiter(
+            name=client_config.interface_id,
+            max_limit=central_config.max_read_workers,
+            adaptive=central_config.adaptive_read_concurrency,
+            ignored_exceptions=(xmlrpc.client.Fault,),
+        )
+        # Limits the radio commands by the duty cycle budget of the interface.
+        self._command_queue: Final = (
+            CommandQueue(
+                name=client_config.interface_id,
+                rate=central_config.command_queue_rate,
+                size=central_config.command_queue_size,
+            )
+            if central_config.command_queue_rate > 0
+            else None
+        )
+        # Writes use _proxy one at a time to keep their order.
+        # The write scheduler keeps the order per channel, so channels can be written in parallel.
+        self._write_scheduler: Final = (
+            WriteScheduler(client=self, window=central_config.write_coalescing_window)
+            if central_config.write_coalescing_window > 0
+            else None
+        )
+        self._write_concurrency_limiter: Final = ConcurrencyLimiter(
+            name=client_config.interface_id,
+            max_limit=central_config.max_read_workers if self._write_scheduler else 1,
+        )
+        # Fails fast, while the interface is not reachable.
+        self._circuit_breaker: Final = (
+            CircuitBreaker(
+                name=client_config.interface_id,
+                failure_threshold=central_config.circuit_breaker_threshold,
+                base_delay=DEFAULT_CIRCUIT_BREAKER_BASE_DELAY,
+                max_delay=DEFAULT_CIRCUIT_BREAKER_MAX_DELAY,
+                state_changed_callback=self._fire_circuit_breaker_event,
+            )
+            if central_config.circuit_breaker_threshold > 0
+            else None
+        )
+        # Measures the latencies of the rpc methods, and derives their timeouts.
+        self._latency_tracker: Final = LatencyTracker(
+            name=client_config.interface_id,
+            adaptive=central_config.adaptive_timeouts,
+            min_timeout=central_config.adaptive_timeout_min,
+            max_timeout=TIMEOUT,
+        )
+        self._proxy: XmlRpcProxy | AsyncXmlRpcProxy
+        self._proxy_read: XmlRpcProxy | AsyncXmlRpcProxy
         self.system_information: SystemInformation
 
     async def init_client(self) -> None:
         """Init the client."""
         self.system_information = await self._get_system_information()
         self._proxy = await self._config.get_xml_rpc_proxy(
-            auth_enabled=self.system_information.auth_enabled
+            auth_enabled=self.system_information.auth_enabled,
+            concurrency_limiter=self._write_concurrency_limiter,
+            circuit_breaker=self._circuit_breaker,
+            latency_tracker=self._latency_tracker,
         )
         self._proxy_read = await self._config.get_xml_rpc_proxy(
-            auth_enabled=self.system_information.auth_enabled
+            auth_enabled=self.system_information.auth_enabled,
+            concurrency_limiter=self._read_concurrency_limiter,
+            circuit_breaker=self._circuit_breaker,
+            latency_tracker=self._latency_tracker,
         )
 
     @property
@@ -85,6 +170,44 @@ class Client(ABC):
         """Return the availability of the client."""
         return self._available
 
+    @property
+    def last_updated(self) -> datetime:
+        """Return the datetime of the last update of the client."""
+        if self.last_event_timestamp is not None:
+            return monotonic_to_datetime(timestamp=self.last_event_timestamp)
+        return self._last_updated
+
+    @last_updated.setter
+    def last_updated(self, last_updated: datetime) -> None:
+        """Set the datetime of the last update of the client."""
+        self._last_updated = last_updated
+        self.last_event_timestamp = None
+
+    @property
+    def read_concurrency_limiter(self) -> ConcurrencyLimiter:
+        """Return the concurrency limiter for reads."""
+        return self._read_concurrency_limiter
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Return the circuit breaker, if enabled."""
+        return self._circuit_breaker
+
+    @property
+    def latency_tracker(self) -> LatencyTracker:
+        """Return the latency tracker of the rpc methods."""
+        return self._latency_tracker
+
+    @property
+    def command_queue(self) -> CommandQueue | None:
+        """Return the command queue, if enabled."""
+        return self._command_queue
+
+    @property
+    def write_scheduler(self) -> WriteScheduler | None:
+        """Return the write scheduler, if write coalescing is enabled."""
+        return self._write_scheduler
+
     @property
     @abstractmethod
     def model(self) -> str:
@@ -188,6 +311,14 @@ class Client(ABC):
             data={EVENT_AVAILABLE: available},
         )
 
+    def _fire_circuit_breaker_event(self, state: CircuitState, retry_in: float) -> None:
+        """Fire an interface event about the state of the circuit breaker."""
+        self.central.fire_interface_event(
+            interface_id=self.interface_id,
+            interface_event_type=InterfaceEventType.CIRCUIT_BREAKER,
+            data={EVENT_CIRCUIT_STATE: str(state), EVENT_RETRY_IN: math.ceil(retry_in)},
+        )
+
     async def reconnect(self) -> bool:
         """re-init all RPC clients."""
         if await self.is_connected():
@@ -215,10 +346,18 @@ class Client(ABC):
     async def fetch_all_device_data(self) -> None:
         """Fetch all device data from CCU."""
 
+    @abstractmethod
+    async def fetch_device_data(self, addresses: Collection[str] = ()) -> None:
+        """Fetch the device data of the interface. Optionally only of some devices or channels."""
+
     @abstractmethod
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
 
+    @abstractmethod
+    async def fetch_startup_metadata(self) -> StartupMetadata | None:
+        """Fetch the device details, rooms, functions, system variables and programs together."""
+
     async def is_connected(self) -> bool:
         """
         Perform actions required for connectivity check.
@@ -298,6 +437,12 @@ class Client(ABC):
     ) -> tuple[SystemVariableData, ...]:
         """Get all system variables from CCU / Homegear."""
 
+    @abstractmethod
+    async def get_system_variable_changes(
+        self, include_internal: bool
+    ) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the last call, if supported."""
+
     @abstractmethod
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
@@ -391,6 +536,7 @@ class Client(ABC):
                 paramset_key,
                 call_source,
             )
+            await self._wait_for_command_queue(priority=CommandPriority.BACKGROUND)
             if paramset_key == ParamsetKey.VALUES:
                 return await self._proxy_read.getValue(channel_address, parameter)
             paramset = (
@@ -408,6 +554,137 @@ class Client(ABC):
             )
             raise
 
+    async def update_duty_cycle_level(self) -> None:
+        """Update the duty cycle level of the command queue by the rf modules of BidCos-RF."""
+        if (
+            not self._command_queue
+            or self.interface != InterfaceName.BIDCOS_RF
+            or XmlRpcMethod.LIST_BIDCOS_INTERFACES not in self._proxy.supported_methods
+        ):
+            return
+        try:
+            bidcos_interfaces = await self._proxy.listBidcosInterfaces()
+        except BaseHomematicException as ex:
+            _LOGGER.debug(
+                "UPDATE_DUTY_CYCLE_LEVEL failed: %s [%s] for %s",
+                ex.name,
+                reduce_args(args=ex.args),
+                self.interface_id,
+            )
+            return
+        for bidcos_interface in bidcos_interfaces:
+            if (duty_cycle := bidcos_interface.get(_DUTY_CYCLE)) is not None:
+                self._command_queue.set_duty_cycle_level(
+                    channel_address=bidcos_interface[Description.ADDRESS], value=duty_cycle
+                )
+
+    async def _wait_for_command_queue(self, priority: CommandPriority) -> None:
+        """Wait for the command queue, if enabled."""
+        if self._command_queue:
+            await self._command_queue.acquire(priority=priority)
+
+    async def get_values(
+        self,
+        values: Iterable[tuple[str, str, str]],
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[tuple[str, str, str], Any]:
+        """
+        Return values from CCU.
+
+        values are tuples of (channel_address, paramset_key, parameter).
+        The requests are bundled by system.multicall, if supported by the backend.
+        Values, that could not be loaded, are returned as NO_CACHE_ENTRY.
+        """
+        keys = tuple(dict.fromkeys(values))
+        if not self._supports_multicall:
+            result: dict[tuple[str, str, str], Any] = {}
+            for channel_address, paramset_key, parameter in keys:
+                try:
+                    result[(channel_address, paramset_key, parameter)] = await self.get_value(
+                        channel_address=channel_address,
+                        paramset_key=paramset_key,
+                        parameter=parameter,
+                        call_source=call_source,
+                    )
+                except BaseHomematicException:
+                    result[(channel_address, paramset_key, parameter)] = NO_CACHE_ENTRY
+            return result
+
+        # The MASTER paramset is loaded once per channel.
+        calls: dict[tuple[str, str, str], dict[str, Any]] = {}
+        for channel_address, paramset_key, parameter in keys:
+            if paramset_key == ParamsetKey.VALUES:
+                calls[(channel_address, paramset_key, parameter)] = {
+                    "methodName": "getValue",
+                    "params": [channel_address, parameter],
+                }
+            else:
+                calls[(channel_address, paramset_key, "")] = {
+                    "methodName": "getParamset",
+                    "params": [channel_address, str(ParamsetKey.MASTER)],
+                }
+
+        call_keys = tuple(calls)
+        call_results: dict[tuple[str, str, str], Any] = {}
+        for i in range(0, len(call_keys), _MULTICALL_CHUNK_SIZE):
+            chunk = call_keys[i : i + _MULTICALL_CHUNK_SIZE]
+            _LOGGER.debug("GET_VALUES: %i calls by multicall, source:%s", len(chunk), call_source)
+            call_results.update(
+                zip(
+                    chunk,
+                    await self._multicall(calls=tuple(calls[call_key] for call_key in chunk)),
+                    strict=True,
+                )
+            )
+
+        result = {}
+        for channel_address, paramset_key, parameter in keys:
+            if paramset_key == ParamsetKey.VALUES:
+                value = call_results[(channel_address, paramset_key, parameter)]
+            elif (paramset := call_results[(channel_address, paramset_key, "")]) == NO_CACHE_ENTRY:
+                value = NO_CACHE_ENTRY
+            else:
+                value = (paramset or {}).get(parameter)
+            result[(channel_address, paramset_key, parameter)] = value
+        return result
+
+    @property
+    def _supports_multicall(self) -> bool:
+        """Return if the backend supports system.multicall."""
+        return XmlRpcMethod.SYSTEM_MULTICALL in self._proxy_read.supported_methods
+
+    async def _multicall(self, calls: tuple[dict[str, Any], ...]) -> list[Any]:
+        """
+        Bundle calls by system.multicall.
+
+        The results are in the order of the calls. Faults are returned as NO_CACHE_ENTRY.
+        """
+        try:
+            await self._wait_for_command_queue(priority=CommandPriority.BACKGROUND)
+            results = await self._proxy_read.system.multicall(list(calls))
+        except BaseHomematicException as ex:
+            _LOGGER.debug(
+                "MULTICALL failed with %s [%s]: %i calls",
+                ex.name,
+                reduce_args(args=ex.args),
+                len(calls),
+            )
+            raise
+        call_results: list[Any] = []
+        for call, result in zip(calls, results, strict=True):
+            # A fault is returned as dict, a result is wrapped in a list.
+            if isinstance(result, dict):
+                _LOGGER.debug(
+                    "MULTICALL: Fault %s %s for %s",
+                    result.get("faultCode"),
+                    result.get("faultString"),
+                    call,
+                )
+                call_results.append(NO_CACHE_ENTRY)
+            else:
+                call_results.append(result[0])
+        return call_results
+
     @measure_execution_time
     async def _set_value(
         self,
@@ -419,6 +696,7 @@ class Client(ABC):
         """Set single value on paramset VALUES."""
         try:
             _LOGGER.debug("SET_VALUE: %s, %s, %s", channel_address, parameter, value)
+            await self._wait_for_command_queue(priority=CommandPriority.USER)
             if rx_mode:
                 await self._proxy.setValue(channel_address, parameter, value, rx_mode)
             else:
@@ -445,12 +723,22 @@ class Client(ABC):
     ) -> bool:
         """Set single value on paramset VALUES."""
         if paramset_key == ParamsetKey.VALUES:
-            return await self._set_value(
+            if self._write_scheduler and rx_mode is None:
+                return await self._write_scheduler.write(
+                    channel_address=channel_address, paramset={parameter: value}
+                )
+            send_value = partial(
+                self._set_value,
                 channel_address=channel_address,
                 parameter=parameter,
                 value=value,
                 rx_mode=rx_mode,
             )
+            if self._write_scheduler:
+                return await self._write_scheduler.write_direct(
+                    channel_address=channel_address, send=send_value
+                )
+            return await send_value()
         return await self.put_paramset(
             address=channel_address,
             paramset_key=paramset_key,
@@ -471,6 +759,7 @@ class Client(ABC):
                 address,
                 paramset_key,
             )
+            await self._wait_for_command_queue(priority=CommandPriority.BACKGROUND)
             return await self._proxy_read.getParamset(address, paramset_key)  # type: ignore[no-any-return]
         except BaseHomematicException as ex:
             _LOGGER.debug(
@@ -482,7 +771,6 @@ class Client(ABC):
             )
             raise
 
-    @measure_execution_time
     async def put_paramset(
         self,
         address: str,
@@ -496,8 +784,38 @@ class Client(ABC):
         Address is usually the channel_address,
         but for bidcos devices there is a master paramset at the device.
         """
+        if self._write_scheduler and paramset_key == ParamsetKey.VALUES and rx_mode is None:
+            return await self._write_scheduler.write(channel_address=address, paramset=value)
+        send_paramset = partial(
+            self._put_paramset,
+            address=address,
+            paramset_key=paramset_key,
+            value=value,
+            rx_mode=rx_mode,
+        )
+        if self._write_scheduler:
+            # MASTER writes and writes with rx_mode must not overtake pending writes.
+            return await self._write_scheduler.write_direct(
+                channel_address=address, send=send_paramset
+            )
+        return await send_paramset()
+
+    @measure_execution_time
+    async def _put_paramset(
+        self,
+        address: str,
+        paramset_key: str,
+        value: Any,
+        rx_mode: str | None = None,
+    ) -> bool:
+        """Set paramsets."""
         try:
             _LOGGER.debug("PUT_PARAMSET: %s, %s, %s", address, paramset_key, value)
+            await self._wait_for_command_queue(
+                priority=CommandPriority.USER
+                if paramset_key == ParamsetKey.VALUES
+                else CommandPriority.MASTER
+            )
             if rx_mode:
                 await self._proxy.putParamset(address, paramset_key, value, rx_mode)
             else:
@@ -535,46 +853,127 @@ class Client(ABC):
 
     async def fetch_paramset_descriptions(self, device_description: dict[str, Any]) -> None:
         """Fetch paramsets for provided device description."""
-        data = await self.get_paramset_descriptions(device_description=device_description)
-        for address, paramsets in data.items():
-            _LOGGER.debug("FETCH_PARAMSET_DESCRIPTIONS for %s", address)
-            for paramset_key, paramset_description in paramsets.items():
-                self.central.paramset_descriptions.add(
-                    interface_id=self.interface_id,
-                    channel_address=address,
-                    paramset_key=paramset_key,
-                    paramset_description=paramset_description,
-                )
+        await self.fetch_all_paramset_descriptions(device_descriptions=(device_description,))
+
+    async def fetch_all_paramset_descriptions(
+        self, device_descriptions: tuple[dict[str, Any], ...], report_progress: bool = False
+    ) -> None:
+        """
+        Fetch paramsets for provided device descriptions and add them to the cache.
+
+        The progress is reported for the bulk fetch of all devices of the interface.
+        """
+        data = await self.get_all_paramset_descriptions(
+            device_descriptions=device_descriptions,
+            only_relevant=True,
+            report_progress=report_progress,
+        )
+        _LOGGER.debug("FETCH_ALL_PARAMSET_DESCRIPTIONS for %i addresses", len(data))
+        self.central.paramset_descriptions.add_all(
+            interface_id=self.interface_id, paramset_descriptions=data
+        )
 
     async def get_paramset_descriptions(
         self, device_description: dict[str, Any], only_relevant: bool = True
     ) -> dict[str, dict[str, Any]]:
         """Get paramsets for provided device description."""
-        if not device_description:
-            return {}
+        return await self.get_all_paramset_descriptions(
+            device_descriptions=(device_description,), only_relevant=only_relevant
+        )
+
+    async def get_all_paramset_descriptions(
+        self,
+        device_descriptions: tuple[dict[str, Any], ...],
+        only_relevant: bool = False,
+        report_progress: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get all paramset descriptions for provided device descriptions.
+
+        The requests are bundled by system.multicall, if supported by the backend,
+        and run with the concurrency of the read proxy.
+        """
         paramsets: dict[str, dict[str, Any]] = {}
-        address = device_description[Description.ADDRESS]
-        paramsets[address] = {}
-        _LOGGER.debug("GET_PARAMSET_DESCRIPTIONS for %s", address)
-        for paramset_key in device_description.get(Description.PARAMSETS, []):
+        requests: list[tuple[str, str]] = []
+        for device_description in device_descriptions:
+            if not device_description:
+                continue
+            address = device_description[Description.ADDRESS]
+            paramsets[address] = {}
             channel_no = get_channel_no(address)
             device_type = (
                 device_description[Description.TYPE]
                 if channel_no is None
                 else device_description[Description.PARENT_TYPE]
             )
-            if only_relevant and not self.central.parameter_visibility.is_relevant_paramset(
-                device_type=device_type,
-                channel_no=channel_no,
-                paramset_key=paramset_key,
-            ):
-                continue
-            if paramset_description := await self._get_paramset_description(
-                address=address, paramset_key=paramset_key
-            ):
-                paramsets[address][paramset_key] = paramset_description
+            for paramset_key in device_description.get(Description.PARAMSETS, []):
+                if only_relevant and not self.central.parameter_visibility.is_relevant_paramset(
+                    device_type=device_type,
+                    channel_no=channel_no,
+                    paramset_key=paramset_key,
+                ):
+                    continue
+                requests.append((address, paramset_key))
+
+        chunk_size = _MULTICALL_CHUNK_SIZE if self._supports_multicall else 1
+        chunks = iter(
+            tuple(requests[i : i + chunk_size]) for i in range(0, len(requests), chunk_size)
+        )
+        fetched = reported = 0
+
+        async def _fetch_chunks() -> None:
+            """Fetch chunks until all are done. The iterator is shared by all workers."""
+            nonlocal fetched, reported
+            for chunk in chunks:
+                for (address, paramset_key), paramset_description in zip(
+                    chunk,
+                    await self._get_paramset_description_chunk(chunk=chunk),
+                    strict=True,
+                ):
+                    if paramset_description:
+                        paramsets[address][paramset_key] = paramset_description
+                fetched += len(chunk)
+                if report_progress and (
+                    fetched == len(requests) or fetched - reported >= _MULTICALL_CHUNK_SIZE
+                ):
+                    reported = fetched
+                    self.central.fire_system_event_callback(
+                        system_event=SystemEvent.PARAMSET_DESCRIPTIONS_PROGRESS,
+                        interface_id=self.interface_id,
+                        fetched=fetched,
+                        total=len(requests),
+                    )
+
+        _LOGGER.debug(
+            "GET_ALL_PARAMSET_DESCRIPTIONS: %i paramset descriptions for %i addresses",
+            len(requests),
+            len(paramsets),
+        )
+        await asyncio.gather(
+            *(_fetch_chunks() for _ in range(self._read_concurrency_limiter.max_limit))
+        )
         return paramsets
 
+    async def _get_paramset_description_chunk(
+        self, chunk: tuple[tuple[str, str], ...]
+    ) -> list[dict[str, Any] | None]:
+        """Get paramset descriptions for a chunk of (address, paramset_key)."""
+        if len(chunk) == 1:
+            address, paramset_key = chunk[0]
+            return [
+                await self._get_paramset_description(address=address, paramset_key=paramset_key)
+            ]
+        try:
+            results = await self._multicall(
+                calls=tuple(
+                    {"methodName": "getParamsetDescription", "params": [address, paramset_key]}
+                    for address, paramset_key in chunk
+                )
+            )
+        except BaseHomematicException:
+            return [None] * len(chunk)
+        return [None if result == NO_CACHE_ENTRY else result for result in results]
+
     async def _get_paramset_description(
         self, address: str, paramset_key: str
     ) -> dict[str, Any] | None:
@@ -591,19 +990,6 @@ class Client(ABC):
             )
         return None
 
-    async def get_all_paramset_descriptions(
-        self, device_descriptions: tuple[dict[str, Any], ...]
-    ) -> dict[str, dict[str, Any]]:
-        """Get all paramset descriptions for provided device descriptions."""
-        all_paramsets: dict[str, dict[str, Any]] = {}
-        for device_description in device_descriptions:
-            all_paramsets.update(
-                await self.get_paramset_descriptions(
-                    device_description=device_description, only_relevant=False
-                )
-            )
-        return all_paramsets
-
     async def update_device_firmware(self, device_address: str) -> bool:
         """Update the firmware of a homematic device."""
         if device := self.central.get_device(address=device_address):
@@ -686,26 +1072,45 @@ class ClientCCU(Client):
     @measure_execution_time
     async def fetch_device_details(self) -> None:
         """Get all names via JSON-RPS and store in data.NAMES."""
-        if json_result := await self._json_rpc_client.get_device_details():
-            for device in json_result:
-                device_address = device[_ADDRESS]
-                self.central.device_details.add_name(address=device_address, name=device[_NAME])
+        self._add_device_details(device_details=await self._json_rpc_client.get_device_details())
+
+    @measure_execution_time
+    async def fetch_startup_metadata(self) -> StartupMetadata | None:
+        """Fetch the device details, rooms, functions, system variables and programs together."""
+        if (
+            metadata := await self._json_rpc_client.fetch_startup_metadata(
+                include_internal_sysvars=True, include_internal_programs=False
+            )
+        ) is None:
+            return None
+        self.central.device_details.clear()
+        self._add_device_details(device_details=metadata.device_details)
+        self.central.device_details.set_rooms_and_functions(
+            rooms=self._get_by_address(channel_ids_names=metadata.channel_ids_room),
+            functions=self._get_by_address(channel_ids_names=metadata.channel_ids_function),
+        )
+        return metadata
+
+    def _add_device_details(self, device_details: tuple[dict[str, Any], ...]) -> None:
+        """Add the device details of the backend to the device details cache."""
+        if not device_details:
+            _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
+            return
+        for device in device_details:
+            device_address = device[_ADDRESS]
+            self.central.device_details.add_name(address=device_address, name=device[_NAME])
+            self.central.device_details.add_device_channel_id(
+                address=device_address, channel_id=device[_ID]
+            )
+            for channel in device.get(_CHANNELS, []):
+                channel_address = channel[_ADDRESS]
+                self.central.device_details.add_name(address=channel_address, name=channel[_NAME])
                 self.central.device_details.add_device_channel_id(
-                    address=device_address, channel_id=device[_ID]
+                    address=channel_address, channel_id=channel[_ID]
                 )
-                for channel in device.get(_CHANNELS, []):
-                    channel_address = channel[_ADDRESS]
-                    self.central.device_details.add_name(
-                        address=channel_address, name=channel[_NAME]
-                    )
-                    self.central.device_details.add_device_channel_id(
-                        address=channel_address, channel_id=channel[_ID]
-                    )
-                self.central.device_details.add_interface(
-                    address=device_address, interface=device[_INTERFACE]
-                )
-        else:
-            _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
+            self.central.device_details.add_interface(
+                address=device_address, interface=device[_INTERFACE]
+            )
 
     @measure_execution_time
     async def fetch_all_device_data(self) -> None:
@@ -716,13 +1121,38 @@ class ClientCCU(Client):
             _LOGGER.debug(
                 "FETCH_ALL_DEVICE_DATA: Fetched all device data for interface %s", self.interface
             )
-            self.central.data_cache.add_data(all_device_data=all_device_data)
+            self.central.data_cache.add_data(
+                interface=self.interface, all_device_data=all_device_data
+            )
         else:
             _LOGGER.debug(
                 "FETCH_ALL_DEVICE_DATA: Unable to get all device data via JSON-RPC RegaScript for interface %s",
                 self.interface,
             )
 
+    @measure_execution_time
+    async def fetch_device_data(self, addresses: Collection[str] = ()) -> None:
+        """Fetch the device data of the interface. Optionally only of some devices or channels."""
+        if device_data := await self._json_rpc_client.get_all_device_data(
+            interface=self.interface, addresses=addresses
+        ):
+            _LOGGER.debug(
+                "FETCH_DEVICE_DATA: Fetched device data for interface %s", self.interface
+            )
+            if addresses:
+                self.central.data_cache.update_data(
+                    interface=self.interface, device_data=device_data
+                )
+            else:
+                self.central.data_cache.add_data(
+                    interface=self.interface, all_device_data=device_data
+                )
+        else:
+            _LOGGER.debug(
+                "FETCH_DEVICE_DATA: Unable to get device data via JSON-RPC RegaScript for interface %s",
+                self.interface,
+            )
+
     async def check_connection_availability(self, handle_ping_pong: bool) -> bool:
         """Check if _proxy is still initialized."""
         try:
@@ -771,31 +1201,39 @@ class ClientCCU(Client):
             include_internal=include_internal
         )
 
+    async def get_system_variable_changes(
+        self, include_internal: bool
+    ) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the last call."""
+        return await self._json_rpc_client.get_system_variable_changes(
+            include_internal=include_internal
+        )
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return await self._json_rpc_client.get_all_programs(include_internal=include_internal)
 
     async def get_all_rooms(self) -> dict[str, set[str]]:
         """Get all rooms from CCU."""
-        rooms: dict[str, set[str]] = {}
-        channel_ids_room = await self._json_rpc_client.get_all_channel_ids_room()
-        for address, channel_id in self.central.device_details.device_channel_ids.items():
-            if names := channel_ids_room.get(channel_id):
-                if address not in rooms:
-                    rooms[address] = set()
-                rooms[address].update(names)
-        return rooms
+        return self._get_by_address(
+            channel_ids_names=await self._json_rpc_client.get_all_channel_ids_room()
+        )
 
     async def get_all_functions(self) -> dict[str, set[str]]:
         """Get all functions from CCU."""
-        functions: dict[str, set[str]] = {}
-        channel_ids_function = await self._json_rpc_client.get_all_channel_ids_function()
+        return self._get_by_address(
+            channel_ids_names=await self._json_rpc_client.get_all_channel_ids_function()
+        )
+
+    def _get_by_address(self, channel_ids_names: Mapping[str, set[str]]) -> dict[str, set[str]]:
+        """Map the names by channel id of the backend to the addresses."""
+        names_by_address: dict[str, set[str]] = {}
         for address, channel_id in self.central.device_details.device_channel_ids.items():
-            if sections := channel_ids_function.get(channel_id):
-                if address not in functions:
-                    functions[address] = set()
-                functions[address].update(sections)
-        return functions
+            if names := channel_ids_names.get(channel_id):
+                if address not in names_by_address:
+                    names_by_address[address] = set()
+                names_by_address[address].update(names)
+        return names_by_address
 
     async def _get_system_information(self) -> SystemInformation:
         """Get system information of the backend."""
@@ -826,6 +1264,10 @@ class ClientHomegear(Client):
         """Fetch all device data from CCU."""
         return
 
+    async def fetch_device_data(self, addresses: Collection[str] = ()) -> None:
+        """Fetch the device data of the interface. Optionally only of some devices or channels."""
+        return
+
     @measure_execution_time
     async def fetch_device_details(self) -> None:
         """Get all names from metadata (Homegear)."""
@@ -846,6 +1288,10 @@ class ClientHomegear(Client):
                     address,
                 )
 
+    async def fetch_startup_metadata(self) -> StartupMetadata | None:
+        """Fetch the startup metadata. Not supported by Homegear."""
+        return None
+
     async def check_connection_availability(self, handle_ping_pong: bool) -> bool:
         """Check if proxy is still initialized."""
         try:
@@ -912,6 +1358,12 @@ class ClientHomegear(Client):
             )
         return tuple(variables)
 
+    async def get_system_variable_changes(
+        self, include_internal: bool
+    ) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the last call. Not supported by Homegear."""
+        return None
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return ()
@@ -987,8 +1439,16 @@ class _ClientConfig:
             raise
         except Exception as exc:
             raise NoConnection(f"Unable to connect {reduce_args(args=exc.args)}.") from exc
+        finally:
+            check_proxy.stop()
 
-    async def get_xml_rpc_proxy(self, auth_enabled: bool | None = None) -> XmlRpcProxy:
+    async def get_xml_rpc_proxy(
+        self,
+        auth_enabled: bool | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        latency_tracker: LatencyTracker | None = None,
+    ) -> XmlRpcProxy | AsyncXmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
         central_config = self.central.config
         xml_rpc_headers = (
@@ -999,34 +1459,60 @@ class _ClientConfig:
             if auth_enabled
             else []
         )
-        xml_proxy = XmlRpcProxy(
-            max_workers=1,
-            interface_id=self.interface_id,
-            connection_state=central_config.connection_state,
-            uri=self.xml_rpc_uri,
-            headers=xml_rpc_headers,
-            tls=central_config.tls,
-            verify_tls=central_config.verify_tls,
+        return await self._create_xml_rpc_proxy(
+            max_workers=concurrency_limiter.max_limit if concurrency_limiter else 1,
+            xml_rpc_headers=xml_rpc_headers,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breaker=circuit_breaker,
+            latency_tracker=latency_tracker,
         )
-        await xml_proxy.do_init()
-        return xml_proxy
 
-    async def _get_simple_xml_rpc_proxy(self) -> XmlRpcProxy:
+    async def _get_simple_xml_rpc_proxy(self) -> XmlRpcProxy | AsyncXmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
         central_config = self.central.config
         xml_rpc_headers = build_headers(
             username=central_config.username,
             password=central_config.password,
         )
-        xml_proxy = XmlRpcProxy(
-            max_workers=0,
-            interface_id=self.interface_id,
-            connection_state=central_config.connection_state,
-            uri=self.xml_rpc_uri,
-            headers=xml_rpc_headers,
-            tls=central_config.tls,
-            verify_tls=central_config.verify_tls,
-        )
+        return await self._create_xml_rpc_proxy(max_workers=0, xml_rpc_headers=xml_rpc_headers)
+
+    async def _create_xml_rpc_proxy(
+        self,
+        max_workers: int,
+        xml_rpc_headers: list[tuple[str, str]],
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        latency_tracker: LatencyTracker | None = None,
+    ) -> XmlRpcProxy | AsyncXmlRpcProxy:
+        """Create and init a XmlRPC proxy. The AsyncXmlRpcProxy runs on the loop."""
+        central_config = self.central.config
+        xml_proxy: XmlRpcProxy | AsyncXmlRpcProxy
+        if central_config.async_xml_rpc_proxy:
+            xml_proxy = AsyncXmlRpcProxy(
+                interface_id=self.interface_id,
+                connection_state=central_config.connection_state,
+                uri=self.xml_rpc_uri,
+                headers=xml_rpc_headers,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+                client_session=central_config.client_session,
+                concurrency_limiter=concurrency_limiter,
+                circuit_breaker=circuit_breaker,
+                latency_tracker=latency_tracker,
+            )
+        else:
+            xml_proxy = XmlRpcProxy(
+                max_workers=max_workers,
+                interface_id=self.interface_id,
+                connection_state=central_config.connection_state,
+                uri=self.xml_rpc_uri,
+                headers=xml_rpc_headers,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+                concurrency_limiter=concurrency_limiter,
+                circuit_breaker=circuit_breaker,
+                latency_tracker=latency_tracker,
+            )
         await xml_proxy.do_init()
         return xml_proxy
 
@@ -1071,7 +1557,6 @@ async def create_client(
 
 def get_client(interface_id: str) -> Client | None:
     """Return client by interface_id."""
-    for central in hmcu.CENTRAL_INSTANCES.values():
-        if central.has_client(interface_id=interface_id):
-            return central.get_client(interface_id=interface_id)
+    if instance := hmcu.INTERFACE_INSTANCES.get(interface_id):
+        return instance[1]
     return None
@@ -0,0 +1,105 @@
+"""
+Circuit breaker for the connection to an interface.
+
+After consecutive connection failures the circuit opens, and requests fail
+without I/O. Recovery is probed by a single request, the delay between the probes
+grows exponentially and is randomized, so that several clients of one backend
+don't reconnect at the same time.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import random
+import time
+from typing import Final
+
+from hahomematic.const import CircuitState
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Circuit breaker with closed, open and half open state."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        base_delay: float,
+        max_delay: float,
+        state_changed_callback: Callable[[CircuitState, float], None] | None = None,
+    ) -> None:
+        """Init the circuit breaker."""
+        self._name: Final = name
+        self._failure_threshold: Final = max(1, failure_threshold)
+        self._base_delay: Final = base_delay
+        self._max_delay: Final = max_delay
+        self._state_changed_callback: Final = state_changed_callback
+        self._state: CircuitState = CircuitState.CLOSED
+        self._failures: int = 0
+        # The number of failed probes, that increases the delay.
+        self._attempts: int = 0
+        self._probe_at: float = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the circuit."""
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next recovery probe of an open circuit."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._probe_at - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return if a request may be sent. An open circuit lets one probe pass, when due."""
+        if self._state == CircuitState.CLOSED:
+            return True
+        if self._state == CircuitState.OPEN and time.monotonic() >= self._probe_at:
+            self._set_state(state=CircuitState.HALF_OPEN)
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a request, that reached the backend."""
+        self._failures = 0
+        self._attempts = 0
+        if self._state != CircuitState.CLOSED:
+            self._set_state(state=CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a connection failure."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._attempts += 1
+            self._open()
+            return
+        self._failures += 1
+        if self._state == CircuitState.CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def release_probe(self) -> None:
+        """Release the probe of a request, that neither failed nor reached the backend."""
+        if self._state == CircuitState.HALF_OPEN:
+            # The next request probes again without a delay.
+            self._probe_at = time.monotonic()
+            self._set_state(state=CircuitState.OPEN)
+
+    def _open(self) -> None:
+        """Open the circuit until the next probe."""
+        delay = min(self._max_delay, self._base_delay * 2**self._attempts)
+        # Half of the delay is random, so that clients don't probe in lockstep.
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self._probe_at = time.monotonic() + delay
+        self._set_state(state=CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Set the state and inform about the change."""
+        self._state = state
+        _LOGGER.debug(
+            "CIRCUIT_BREAKER: %s is %s, retry in %.1fs", self._name, state, self.retry_in
+        )
+        if self._state_changed_callback:
+            self._state_changed_callback(state, self.retry_in)
@@ -0,0 +1,154 @@
+"""
+Duty cycle aware command queue for outgoing commands.
+
+Radio commands consume the duty cycle budget (1% airtime) of the interface.
+A token bucket limits the commands per second, and its refill rate is reduced,
+when the access points or rf modules of the interface report a rising duty cycle level.
+The duty cycle flags of single devices don't throttle the interface.
+Waiting commands are released by priority: user commands before MASTER writes.
+Background reads bypass the queue.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Final
+
+from hahomematic.central.event_queue import LatencyHistogram
+from hahomematic.const import CommandPriority
+from hahomematic.support import reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# The refill rate is never reduced below this factor, so user commands still pass.
+_MIN_RATE_FACTOR: Final = 0.1
+
+
+class CommandQueue:
+    """Token bucket with priorities for the outgoing commands of an interface."""
+
+    def __init__(self, name: str, rate: float, size: int) -> None:
+        """Init the command queue."""
+        self._name: Final = name
+        self._rate: Final = rate
+        self._size: Final = max(1, size)
+        self._tokens: float = float(self._size)
+        self._updated: float = time.monotonic()
+        # [(priority, sequence, future)]
+        self._waiters: Final[list[tuple[int, int, asyncio.Future[None]]]] = []
+        self._sequence: Final = itertools.count()
+        self._wakeup_handle: asyncio.TimerHandle | None = None
+        # {channel_address of the access point or rf module, duty cycle level in %}
+        self._duty_cycle_levels: Final[dict[str, float]] = {}
+        self._wait_times: Final = {priority: LatencyHistogram() for priority in CommandPriority}
+
+    @property
+    def depth(self) -> int:
+        """Return the number of waiting commands."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @property
+    def duty_cycle_level(self) -> float:
+        """Return the highest reported duty cycle level in %."""
+        return max(self._duty_cycle_levels.values(), default=0.0)
+
+    @property
+    def rate(self) -> float:
+        """Return the current refill rate in commands per second."""
+        return self._rate * max(_MIN_RATE_FACTOR, 1 - self.duty_cycle_level / 100)
+
+    @property
+    def tokens(self) -> float:
+        """Return the available tokens."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def wait_times(self) -> Mapping[CommandPriority, LatencyHistogram]:
+        """Return the histograms of the wait times per priority."""
+        return self._wait_times
+
+    def set_duty_cycle_level(self, channel_address: str, value: Any) -> None:
+        """
+        Update the duty cycle level of an access point or rf module.
+
+        The level is reported by DUTY_CYCLE_LEVEL events of the access points,
+        and by listBidcosInterfaces for the rf modules of BidCos-RF.
+        """
+        try:
+            level = float(value)
+        except (TypeError, ValueError) as ex:
+            _LOGGER.debug(
+                "SET_DUTY_CYCLE: Invalid duty cycle level %s of %s for %s [%s]",
+                value,
+                channel_address,
+                self._name,
+                reduce_args(args=ex.args),
+            )
+            return
+        self._refill()
+        if level != self._duty_cycle_levels.get(channel_address, 0.0):
+            _LOGGER.debug(
+                "SET_DUTY_CYCLE: %s reports duty cycle level %.1f%% for %s",
+                channel_address,
+                level,
+                self._name,
+            )
+        self._duty_cycle_levels[channel_address] = level
+        self._dispatch()
+
+    async def acquire(self, priority: CommandPriority) -> None:
+        """Wait until the command can be sent. Background reads don't wait."""
+        if priority == CommandPriority.BACKGROUND:
+            self._wait_times[priority].observe(0.0)
+            return
+        start = time.monotonic()
+        if not self.depth and self._take():
+            self._wait_times[priority].observe(0.0)
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        finally:
+            if not future.done():
+                future.cancel()
+            self._dispatch()
+        self._wait_times[priority].observe(time.monotonic() - start)
+
+    def _dispatch(self) -> None:
+        """Release the waiting commands in order of their priority, as long as tokens are left."""
+        if self._wakeup_handle:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        while self._waiters:
+            _, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take():
+                self._wakeup_handle = asyncio.get_running_loop().call_later(
+                    (1 - self._tokens) / self.rate, self._dispatch
+                )
+                return
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+    def _take(self) -> bool:
+        """Take a token for a command."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _refill(self) -> None:
+        """Add the tokens of the elapsed time."""
+        now = time.monotonic()
+        self._tokens = min(float(self._size), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
@@ -1,19 +1,30 @@
 """Implementation of an async json-rpc client."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import Collection
+from contextlib import nullcontext
 from enum import StrEnum
 from json import JSONDecodeError
 import logging
 import os
 from pathlib import Path
 import re
-from typing import Any, Final
-
-from aiohttp import ClientConnectorCertificateError, ClientError, ClientResponse, ClientSession
+from typing import Any, Final, cast
+from urllib.parse import unquote
+
+from aiohttp import (
+    ClientConnectorCertificateError,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+)
 import orjson
 
 from hahomematic import central as hmcu, config
+from hahomematic.client.json_session import JsonSessionKeeper
+from hahomematic.client.latency import LatencyTracker
 from hahomematic.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
@@ -23,9 +34,12 @@ from hahomematic.const import (
     REGA_SCRIPT_GET_SERIAL,
     REGA_SCRIPT_PATH,
     REGA_SCRIPT_SET_SYSTEM_VARIABLE,
+    REGA_SCRIPT_SYSTEM_VARIABLES_CHANGES,
     REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER,
     ProgramData,
+    StartupMetadata,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
     SysvarType,
 )
@@ -41,9 +55,12 @@ from hahomematic.support import get_tls_context, parse_sys_var, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_ADDRESSES: Final = "addresses"
+_CHANGED: Final = "changed"
 _CHANNEL_IDS: Final = "channelIds"
 _HAS_EXT_MARKER: Final = "hasExtMarker"
 _ID: Final = "id"
+_IDS: Final = "ids"
 _IS_ACTIVE: Final = "isActive"
 _IS_INTERNAL: Final = "isInternal"
 _LAST_EXECUTE_TIME: Final = "lastExecuteTime"
@@ -56,6 +73,8 @@ _P_MESSAGE: Final = "message"
 _P_RESULT: Final = "result"
 _SESSION_ID: Final = "_session_id_"
 _SERIAL: Final = "serial"
+_SINCE: Final = "since"
+_TIMESTAMP: Final = "timestamp"
 _TYPE: Final = "type"
 _UNIT: Final = "unit"
 _VALUE: Final = "value"
@@ -97,6 +116,7 @@ class JsonRpcAioHttpClient:
         client_session: ClientSession | None = None,
         tls: bool = False,
         verify_tls: bool = False,
+        latency_tracker: LatencyTracker | None = None,
     ) -> None:
         """Session setup."""
         self._client_session: Final = client_session
@@ -107,52 +127,46 @@ class JsonRpcAioHttpClient:
         self._tls_context: Final = get_tls_context(verify_tls) if tls else None
         self._url: Final = f"{device_url}{PATH_JSON_RPC}"
         self._script_cache: Final[dict[str, str]] = {}
-        self._last_session_id_refresh: datetime | None = None
-        self._session_id: str | None = None
+        self._session_keeper: Final = JsonSessionKeeper(
+            name=device_url,
+            login=self._do_login,
+            renew=self._do_renew,
+            renew_interval=config.JSON_SESSION_AGE,
+        )
         self._supported_methods: tuple[str, ...] | None = None
+        self._latency_tracker: Final = latency_tracker
+        self._sysvar_timestamp: int = 0
+        # {id, name} of all system variables of the last poll
+        self._sysvar_names: Final[dict[str, str]] = {}
+        # {id, has ext marker} of all system variables, until the ids change
+        self._sysvar_ext_markers: dict[str, Any] = {}
+
+    @property
+    def latency_tracker(self) -> LatencyTracker | None:
+        """Return the latency tracker of the JSON-RPC methods."""
+        return self._latency_tracker
 
     @property
     def is_activated(self) -> bool:
         """If session exists, then it is activated."""
-        return self._session_id is not None
-
-    async def _login_or_renew(self) -> bool:
-        """Renew JSON-RPC session or perform login."""
-        if not self.is_activated:
-            self._session_id = await self._do_login()
-            self._last_session_id_refresh = datetime.now()
-            return self._session_id is not None
-        if self._session_id:
-            self._session_id = await self._do_renew_login(self._session_id)
-        return self._session_id is not None
-
-    async def _do_renew_login(self, session_id: str) -> str | None:
-        """Renew JSON-RPC session or perform login."""
-        if self._updated_within_seconds:
-            return session_id
+        return self._session_keeper.session_id is not None
+
+    async def _get_session_id(self) -> str:
+        """Return the session id of the session keeper."""
+        if not (session_id := await self._session_keeper.get_session_id()):
+            raise ClientException("Error while logging in")
+        return session_id
+
+    async def _do_renew(self, session_id: str) -> bool:
+        """Renew JSON-RPC session."""
         method = JsonRpcMethod.SESSION_RENEW
         response = await self._do_post(
             session_id=session_id,
             method=method,
             extra_params={_SESSION_ID: session_id},
         )
-
-        if response[_P_RESULT] and response[_P_RESULT] is True:
-            self._last_session_id_refresh = datetime.now()
-            _LOGGER.debug("DO_RENEW_LOGIN: method: %s [%s]", method, session_id)
-            return session_id
-
-        return await self._do_login()
-
-    @property
-    def _updated_within_seconds(self) -> bool:
-        """Check if session id has been updated within 90 seconds."""
-        if self._last_session_id_refresh is None:
-            return False
-        delta = datetime.now() - self._last_session_id_refresh
-        if delta.seconds < config.JSON_SESSION_AGE:
-            return True
-        return False
+        _LOGGER.debug("DO_RENEW: method: %s [%s]", method, session_id)
+        return response[_P_RESULT] is True
 
     async def _do_login(self) -> str | None:
         """Login to CCU and return session."""
@@ -189,20 +203,11 @@ class JsonRpcAioHttpClient:
         keep_session: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
-        if keep_session:
-            await self._login_or_renew()
-            session_id = self._session_id
-        else:
-            session_id = await self._do_login()
-
-        if not session_id:
-            raise ClientException("Error while logging in")
-
-        if self._supported_methods is None:
-            await self._check_supported_methods()
+        session_id = await self._get_post_session_id(keep_session=keep_session)
 
-        response = await self._do_post(
+        response = await self._do_post_with_session(
             session_id=session_id,
+            keep_session=keep_session,
             method=method,
             extra_params=extra_params,
             use_default_params=use_default_params,
@@ -225,17 +230,7 @@ class JsonRpcAioHttpClient:
         keep_session: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST_SCRIPT function."""
-        if keep_session:
-            await self._login_or_renew()
-            session_id = self._session_id
-        else:
-            session_id = await self._do_login()
-
-        if not session_id:
-            raise ClientException("Error while logging in")
-
-        if self._supported_methods is None:
-            await self._check_supported_methods()
+        session_id = await self._get_post_session_id(keep_session=keep_session)
 
         if (script := self._get_script(script_name=script_name)) is None:
             raise ClientException(f"Script file for {script_name} does not exist")
@@ -245,10 +240,12 @@ class JsonRpcAioHttpClient:
                 script = script.replace(f"##{variable}##", value)
 
         method = JsonRpcMethod.REGA_RUN_SCRIPT
-        response = await self._do_post(
+        response = await self._do_post_with_session(
             session_id=session_id,
+            keep_session=keep_session,
             method=method,
             extra_params={"script": script},
+            script_name=script_name,
         )
 
         _LOGGER.debug("POST_SCRIPT: method: %s [%s]", method, script_name)
@@ -261,6 +258,48 @@ class JsonRpcAioHttpClient:
 
         return response
 
+    async def _get_post_session_id(self, keep_session: bool) -> str:
+        """Return the session id for a post, and check the supported methods once."""
+        session_id = await self._get_session_id() if keep_session else await self._do_login()
+        if not session_id:
+            raise ClientException("Error while logging in")
+
+        if self._supported_methods is None:
+            await self._check_supported_methods()
+        return session_id
+
+    async def _do_post_with_session(
+        self,
+        session_id: str,
+        keep_session: bool,
+        method: JsonRpcMethod,
+        extra_params: dict[str, str] | None = None,
+        use_default_params: bool = True,
+        script_name: str | None = None,
+    ) -> dict[str, Any] | Any:
+        """Post with the session. A rejected shared session is replaced once."""
+        try:
+            return await self._do_post(
+                session_id=session_id,
+                method=method,
+                extra_params=extra_params,
+                use_default_params=use_default_params,
+                script_name=script_name,
+            )
+        except AuthFailure:
+            if not keep_session or not (
+                new_session_id := await self._session_keeper.relogin(failed_session_id=session_id)
+            ):
+                raise
+        _LOGGER.debug("POST: Session has been rejected. Retrying method %s", method)
+        return await self._do_post(
+            session_id=new_session_id,
+            method=method,
+            extra_params=extra_params,
+            use_default_params=use_default_params,
+            script_name=script_name,
+        )
+
     def _get_script(self, script_name: str) -> str | None:
         """Return a script from the script cache. Load if required."""
         if script_name in self._script_cache:
@@ -278,6 +317,7 @@ class JsonRpcAioHttpClient:
         method: JsonRpcMethod,
         extra_params: dict[str, str] | None = None,
         use_default_params: bool = True,
+        script_name: str | None = None,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
         if not self._client_session:
@@ -297,20 +337,31 @@ class JsonRpcAioHttpClient:
                 "Content-Length": str(len(payload)),
             }
 
-            if (
-                response := await self._client_session.post(
+            # The ReGa scripts differ a lot in their runtime, so each script has its own latencies.
+            tracked_method = f"{method}:{script_name}" if script_name else method
+            timeout = (
+                self._latency_tracker.get_timeout(method=tracked_method)
+                if self._latency_tracker
+                else config.TIMEOUT
+            )
+            # The latency includes the body, the embedded documents of ReGa scripts are large.
+            with (
+                self._latency_tracker.measure(method=tracked_method, timeout=timeout)
+                if self._latency_tracker
+                else nullcontext()
+            ):
+                response = await self._client_session.post(
                     self._url,
                     data=payload,
                     headers=headers,
-                    timeout=config.TIMEOUT,
+                    timeout=ClientTimeout(total=timeout),
                     ssl=self._tls_context,
                 )
-            ) is None:
-                raise ClientException("POST method failed with no response")
-
-            if response.status == 200:
+                if response is None:
+                    raise ClientException("POST method failed with no response")
                 json_response = await self._get_json_reponse(response=response)
 
+            if response.status == 200:
                 if error := json_response[_P_ERROR]:
                     error_message = error[_P_MESSAGE]
                     message = f"POST method '{method}' failed: {error_message}"
@@ -327,13 +378,11 @@ class JsonRpcAioHttpClient:
                 return json_response
 
             message = f"Status: {response.status}"
-            json_response = await self._get_json_reponse(response=response)
             if error := json_response[_P_ERROR]:
                 error_message = error[_P_MESSAGE]
                 message = f"{message}: {error_message}"
             raise ClientException(message)
         except BaseHomematicException:
-            await self.logout()
             raise
         except ClientConnectorCertificateError as cccerr:
             self.clear_session()
@@ -344,15 +393,19 @@ class JsonRpcAioHttpClient:
                     f"but this integration is not configured to use TLS"
                 )
             raise ClientException(message) from cccerr
-        except (ClientError, OSError) as err:
-            self.clear_session()
+        except (ClientError, OSError, TimeoutError) as err:
             raise NoConnection(err) from err
         except (TypeError, Exception) as ex:
-            self.clear_session()
             raise ClientException(ex) from ex
 
     async def _get_json_reponse(self, response: ClientResponse) -> dict[str, Any] | Any:
         """Return the json object from response."""
+        try:
+            # The body is read once and decoded by orjson, the embedded documents
+            # of the ReGa scripts can be several MB.
+            return orjson.loads(await response.read())
+        except orjson.JSONDecodeError:
+            _LOGGER.debug("DO_POST: Unable to parse JSON with orjson. Trying json")
         try:
             return await response.json(encoding="utf-8")
         except ValueError as ver:
@@ -367,10 +420,12 @@ class JsonRpcAioHttpClient:
         """Logout of CCU."""
         iid = "LOGOUT"
         try:
-            await self._do_logout(self._session_id)
+            await self._do_logout(self._session_keeper.session_id)
             self._connection_state.remove_issue(issuer=self, iid=iid)
         except BaseHomematicException as ex:
             self._handle_exception_log(iid=iid, exception=ex)
+        finally:
+            self.clear_session()
 
     async def _do_logout(self, session_id: str | None) -> None:
         """Logout of CCU."""
@@ -388,7 +443,8 @@ class JsonRpcAioHttpClient:
             )
             _LOGGER.debug("DO_LOGOUT: method: %s [%s]", method, session_id)
         finally:
-            self.clear_session()
+            if session_id == self._session_keeper.session_id:
+                self.clear_session()
 
     @property
     def _has_credentials(self) -> bool:
@@ -461,7 +517,7 @@ class JsonRpcAioHttpClient:
 
     def clear_session(self) -> None:
         """Clear the current session."""
-        self._session_id = None
+        self._session_keeper.clear()
 
     async def delete_system_variable(self, name: str) -> bool:
         """Delete a system variable from CCU / Homegear."""
@@ -517,63 +573,113 @@ class JsonRpcAioHttpClient:
         iid = "GET_ALL_SYSTEM_VARIABLES"
         variables: list[SystemVariableData] = []
         try:
-            response = await self._post(
-                method=JsonRpcMethod.SYSVAR_GET_ALL,
-            )
+            response = await self._post(method=JsonRpcMethod.SYSVAR_GET_ALL)
 
             _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
             if json_result := response[_P_RESULT]:
-                ext_markers = await self._get_system_variables_ext_markers()
+                ext_markers = await self._get_cached_ext_markers(
+                    ids={var[_ID] for var in json_result}
+                )
                 for var in json_result:
                     is_internal = var[_IS_INTERNAL]
                     if include_internal is False and is_internal is True:
                         continue
-                    var_id = var[_ID]
-                    name = var[_NAME]
-                    org_data_type = var[_TYPE]
-                    raw_value = var[_VALUE]
-                    if org_data_type == SysvarType.NUMBER:
-                        data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
-                    else:
-                        data_type = org_data_type
-                    extended_sysvar = ext_markers.get(var_id, False)
-                    unit = var[_UNIT]
-                    values: tuple[str, ...] | None = None
-                    if val_list := var.get(_VALUE_LIST):
-                        values = tuple(val_list.split(";"))
-                    try:
-                        value = parse_sys_var(data_type=data_type, raw_value=raw_value)
-                        max_value = None
-                        if raw_max_value := var.get(_MAX_VALUE):
-                            max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
-                        min_value = None
-                        if raw_min_value := var.get(_MIN_VALUE):
-                            min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
-                        variables.append(
-                            SystemVariableData(
-                                name=name,
-                                data_type=data_type,
-                                unit=unit,
-                                value=value,
-                                values=values,
-                                max_value=max_value,
-                                min_value=min_value,
-                                extended_sysvar=extended_sysvar,
-                            )
-                        )
-                    except ValueError as verr:
-                        _LOGGER.warning(
-                            "GET_ALL_SYSTEM_VARIABLES failed: "
-                            "ValueError [%s] Failed to parse SysVar %s ",
-                            reduce_args(args=verr.args),
-                            name,
-                        )
+                    if sysvar := _parse_system_variable(
+                        var=var, extended_sysvar=ext_markers.get(var[_ID], False)
+                    ):
+                        variables.append(sysvar)
             self._connection_state.remove_issue(issuer=self, iid=iid)
         except BaseHomematicException as ex:
             self._handle_exception_log(iid=iid, exception=ex)
 
         return tuple(variables)
 
+    async def get_system_variable_changes(
+        self, include_internal: bool
+    ) -> SystemVariableChanges | None:
+        """
+        Get the system variables, that changed since the last call, from CCU.
+
+        The first call, and every call after new system variables appeared, returns all
+        system variables and is marked as complete. The ext markers are scanned again
+        for a complete call.
+        Returns None, if the changes could not be fetched.
+        """
+        iid = "GET_SYSTEM_VARIABLE_CHANGES"
+        try:
+            since = self._sysvar_timestamp
+            json_result = await self._get_system_variable_changes(since=since)
+            all_ids = set(json_result[_IDS])
+            changed = json_result[_CHANGED]
+            changed_ids = {var[_ID] for var in changed}
+            if since and (all_ids - self._sysvar_names.keys() - changed_ids):
+                # New system variables with an older timestamp are only part of a complete poll.
+                since = 0
+                json_result = await self._get_system_variable_changes(since=since)
+                all_ids = set(json_result[_IDS])
+                changed = json_result[_CHANGED]
+            ext_markers = await self._get_cached_ext_markers(ids=all_ids, reload=since == 0)
+
+            deleted = tuple(
+                name for var_id, name in self._sysvar_names.items() if var_id not in all_ids
+            )
+            if since == 0:
+                self._sysvar_names.clear()
+            else:
+                for var_id in self._sysvar_names.keys() - all_ids:
+                    del self._sysvar_names[var_id]
+
+            variables: list[SystemVariableData] = []
+            for var in changed:
+                var[_NAME] = unquote(var[_NAME])
+                self._sysvar_names[var[_ID]] = var[_NAME]
+                if include_internal is False and var[_IS_INTERNAL] is True:
+                    continue
+                for key in (_VALUE, _UNIT, _VALUE_LIST):
+                    if key in var:
+                        var[key] = unquote(var[key])
+                if sysvar := _parse_system_variable(
+                    var=var, extended_sysvar=ext_markers.get(var[_ID], False)
+                ):
+                    variables.append(sysvar)
+            self._sysvar_timestamp = json_result[_TIMESTAMP]
+            _LOGGER.debug(
+                "GET_SYSTEM_VARIABLE_CHANGES: %i changed, %i deleted system variables",
+                len(variables),
+                len(deleted),
+            )
+            self._connection_state.remove_issue(issuer=self, iid=iid)
+            return SystemVariableChanges(
+                changed=tuple(variables),
+                deleted=() if since == 0 else deleted,
+                complete=since == 0,
+            )
+        except (BaseHomematicException, JSONDecodeError) as ex:
+            self._handle_exception_log(iid=iid, exception=ex)
+            self.reset_system_variable_changes()
+        return None
+
+    def reset_system_variable_changes(self) -> None:
+        """Reset the state of the system variable changes, so the next call is complete."""
+        self._sysvar_timestamp = 0
+        self._sysvar_names.clear()
+        self._sysvar_ext_markers.clear()
+
+    async def _get_system_variable_changes(self, since: int) -> dict[str, Any]:
+        """Run the script for the system variables, that changed since the timestamp."""
+        response = await self._post_script(
+            script_name=REGA_SCRIPT_SYSTEM_VARIABLES_CHANGES,
+            extra_params={_SINCE: str(since)},
+        )
+        _LOGGER.debug("GET_SYSTEM_VARIABLE_CHANGES: Getting system variables since %i", since)
+        return cast(dict[str, Any], response[_P_RESULT])
+
+    async def _get_cached_ext_markers(self, ids: set[str], reload: bool = False) -> dict[str, Any]:
+        """Return the ext markers. They are only scanned again, if the ids have changed."""
+        if reload or ids != self._sysvar_ext_markers.keys():
+            self._sysvar_ext_markers = await self._get_system_variables_ext_markers()
+        return self._sysvar_ext_markers
+
     async def _get_system_variables_ext_markers(self) -> dict[str, Any]:
         """Get all system variables from CCU / Homegear."""
         iid = "GET_SYSTEM_VARIABLES_EXT_MARKERS"
@@ -673,12 +779,15 @@ class JsonRpcAioHttpClient:
 
         return device_details
 
-    async def get_all_device_data(self, interface: str) -> dict[str, Any]:
-        """Get the all device data of the backend."""
+    async def get_all_device_data(
+        self, interface: str, addresses: Collection[str] = ()
+    ) -> dict[str, Any]:
+        """Get the all device data of the backend. Optionally only of some devices or channels."""
         iid = f"GET_ALL_DEVICE_DATA for {interface}"
         all_device_data: dict[str, dict[str, dict[str, Any]]] = {}
         params = {
             _INTERFACE: interface,
+            _ADDRESSES: ",".join(addresses),
         }
         try:
             response = await self._post_script(
@@ -686,7 +795,9 @@ class JsonRpcAioHttpClient:
             )
 
             _LOGGER.debug(
-                "GET_ALL_DEVICE_DATA: Getting all device data for interface %s", interface
+                "GET_ALL_DEVICE_DATA: Getting all device data for interface %s and addresses %s",
+                interface,
+                params[_ADDRESSES] or "all",
             )
             if json_result := response[_P_RESULT]:
                 all_device_data = json_result
@@ -744,14 +855,52 @@ class JsonRpcAioHttpClient:
 
         return tuple(all_programs)
 
+    async def fetch_startup_metadata(
+        self, include_internal_sysvars: bool, include_internal_programs: bool
+    ) -> StartupMetadata | None:
+        """
+        Fetch the metadata, that is required at startup, concurrently.
+
+        The session is established and the supported methods are checked once upfront,
+        so the requests run side by side on the same session.
+        Returns None, if the login or the check of the supported methods fails.
+        """
+        iid = "FETCH_STARTUP_METADATA"
+        try:
+            await self._get_session_id()
+            if not await self._check_supported_methods():
+                return None
+            self._connection_state.remove_issue(issuer=self, iid=iid)
+        except BaseHomematicException as ex:
+            self._handle_exception_log(iid=iid, exception=ex, multiple_logs=False)
+            return None
+        (
+            device_details,
+            channel_ids_room,
+            channel_ids_function,
+            system_variables,
+            programs,
+        ) = await asyncio.gather(
+            self.get_device_details(),
+            self.get_all_channel_ids_room(),
+            self.get_all_channel_ids_function(),
+            self.get_all_system_variables(include_internal=include_internal_sysvars),
+            self.get_all_programs(include_internal=include_internal_programs),
+        )
+        return StartupMetadata(
+            device_details=device_details,
+            channel_ids_room=channel_ids_room,
+            channel_ids_function=channel_ids_function,
+            system_variables=system_variables,
+            programs=programs,
+        )
+
     async def _get_supported_methods(self) -> tuple[str, ...]:
         """Get the supported methods of the backend."""
         iid = "GET_SUPPORTED_METHODS"
         supported_methods: tuple[str, ...] = ()
 
-        await self._login_or_renew()
-        if not (session_id := self._session_id):
-            raise ClientException("Error while logging in")
+        session_id = await self._get_session_id()
 
         try:
             response = await self._do_post(
@@ -881,6 +1030,46 @@ class JsonRpcAioHttpClient:
         )
 
 
+def _parse_system_variable(
+    var: dict[str, Any], extended_sysvar: bool
+) -> SystemVariableData | None:
+    """Parse a system variable of the backend."""
+    name = var[_NAME]
+    org_data_type = var[_TYPE]
+    raw_value = var[_VALUE]
+    if org_data_type == SysvarType.NUMBER:
+        data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
+    else:
+        data_type = org_data_type
+    values: tuple[str, ...] | None = None
+    if val_list := var.get(_VALUE_LIST):
+        values = tuple(val_list.split(";"))
+    try:
+        max_value = None
+        if raw_max_value := var.get(_MAX_VALUE):
+            max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
+        min_value = None
+        if raw_min_value := var.get(_MIN_VALUE):
+            min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
+        return SystemVariableData(
+            name=name,
+            data_type=data_type,
+            unit=var[_UNIT],
+            value=parse_sys_var(data_type=data_type, raw_value=raw_value),
+            values=values,
+            max_value=max_value,
+            min_value=min_value,
+            extended_sysvar=extended_sysvar,
+        )
+    except ValueError as verr:
+        _LOGGER.warning(
+            "GET_ALL_SYSTEM_VARIABLES failed: ValueError [%s] Failed to parse SysVar %s ",
+            reduce_args(args=verr.args),
+            name,
+        )
+    return None
+
+
 def _get_params(
     session_id: bool | str,
     extra_params: dict[str, Any] | None,
@@ -0,0 +1,113 @@
+"""
+Session keeper for the JSON-RPC client.
+
+The session is renewed in the background, so that callers get a valid session id
+without a renew round trip. Concurrent callers share one login, also when a session
+is rejected by the backend.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Final
+
+from hahomematic.exceptions import AuthFailure, BaseHomematicException
+from hahomematic.support import reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class JsonSessionKeeper:
+    """Keep a JSON-RPC session alive."""
+
+    def __init__(
+        self,
+        name: str,
+        login: Callable[[], Awaitable[str | None]],
+        renew: Callable[[str], Awaitable[bool]],
+        renew_interval: float,
+    ) -> None:
+        """Init the session keeper."""
+        self._name: Final = name
+        self._login: Final = login
+        self._renew: Final = renew
+        self._renew_interval: Final = renew_interval
+        self._session_id: str | None = None
+        self._login_task: asyncio.Task[str | None] | None = None
+        self._renew_task: asyncio.Task[None] | None = None
+
+    @property
+    def session_id(self) -> str | None:
+        """Return the current session id."""
+        return self._session_id
+
+    async def get_session_id(self) -> str | None:
+        """Return a session id. Only login, if there is no session."""
+        if self._session_id:
+            return self._session_id
+        return await self._shared_login()
+
+    async def relogin(self, failed_session_id: str) -> str | None:
+        """Replace a session, that has been rejected by the backend."""
+        if self._session_id and self._session_id != failed_session_id:
+            # Another caller already replaced the session.
+            return self._session_id
+        self._session_id = None
+        return await self._shared_login()
+
+    def clear(self) -> None:
+        """Clear the session and stop the renewal."""
+        self._session_id = None
+        if self._renew_task:
+            self._renew_task.cancel()
+            self._renew_task = None
+
+    async def _shared_login(self) -> str | None:
+        """Login once for all concurrent callers."""
+        if (login_task := self._login_task) is None:
+            login_task = self._login_task = asyncio.create_task(
+                self._do_login(), name=f"json_session_login_{self._name}"
+            )
+            login_task.add_done_callback(self._login_done)
+        return await asyncio.shield(login_task)
+
+    def _login_done(self, login_task: asyncio.Task[str | None]) -> None:
+        """Release the finished login."""
+        if self._login_task is login_task:
+            self._login_task = None
+
+    async def _do_login(self) -> str | None:
+        """Login and start the renewal of the session."""
+        if session_id := await self._login():
+            self._session_id = session_id
+            if self._renew_task is None or self._renew_task.done():
+                self._renew_task = asyncio.create_task(
+                    self._keep_session(), name=f"json_session_renew_{self._name}"
+                )
+        return session_id
+
+    async def _keep_session(self) -> None:
+        """Renew the session in the background, until it is cleared."""
+        while True:
+            await asyncio.sleep(self._renew_interval)
+            if (session_id := self._session_id) is None:
+                return
+            try:
+                try:
+                    renewed = await self._renew(session_id)
+                except AuthFailure:
+                    # The backend rejected the session.
+                    renewed = False
+                if renewed:
+                    _LOGGER.debug("KEEP_SESSION: Renewed session of %s", self._name)
+                    continue
+                _LOGGER.debug("KEEP_SESSION: Renew failed for %s. Login again", self._name)
+                await self.relogin(failed_session_id=session_id)
+            except BaseHomematicException as ex:
+                _LOGGER.debug(
+                    "KEEP_SESSION failed: %s [%s] for %s",
+                    ex.name,
+                    reduce_args(args=ex.args),
+                    self._name,
+                )
@@ -0,0 +1,131 @@
+"""
+Latency tracking and adaptive timeouts for RPC methods.
+
+The latencies of the last calls are kept per method. If enabled, the timeout
+of a method is derived from its p99 latency within the configured bounds,
+so that a hung call is detected in seconds instead of waiting for the max timeout.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import math
+import time
+from typing import Final
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# The number of latencies per method for the percentiles.
+_WINDOW_SIZE: Final = 200
+# Methods with less latencies use the max timeout.
+_MIN_SAMPLES: Final = 10
+# The timeout is a multiple of the p99 latency.
+_P99_FACTOR: Final = 3.0
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LatencyStatistics:
+    """Latency statistics of a method."""
+
+    count: int
+    p50: float
+    p99: float
+    timeout: float
+    timeouts: int
+
+
+class _MethodLatencies:
+    """Rolling latencies of a method."""
+
+    __slots__ = ("latencies", "count", "timeouts", "_sorted")
+
+    def __init__(self) -> None:
+        """Init the method latencies."""
+        self.latencies: Final[deque[float]] = deque(maxlen=_WINDOW_SIZE)
+        self.count: int = 0
+        self.timeouts: int = 0
+        self._sorted: list[float] | None = None
+
+    def observe(self, latency: float) -> None:
+        """Add a latency in seconds."""
+        self.latencies.append(latency)
+        self.count += 1
+        self._sorted = None
+
+    def percentile(self, percent: float) -> float:
+        """Return the percentile of the latencies in seconds."""
+        if not self.latencies:
+            return 0.0
+        if self._sorted is None:
+            self._sorted = sorted(self.latencies)
+        index = min(len(self._sorted) - 1, math.ceil(len(self._sorted) * percent / 100) - 1)
+        return self._sorted[max(0, index)]
+
+
+class LatencyTracker:
+    """Track the latencies of the RPC methods of an interface, and derive their timeouts."""
+
+    def __init__(self, name: str, adaptive: bool, min_timeout: float, max_timeout: float) -> None:
+        """Init the latency tracker."""
+        self._name: Final = name
+        self._adaptive: Final = adaptive
+        self._min_timeout: Final = min_timeout
+        self._max_timeout: Final = max(min_timeout, max_timeout)
+        # {method, latencies}
+        self._methods: Final[dict[str, _MethodLatencies]] = {}
+
+    @property
+    def adaptive(self) -> bool:
+        """Return if the timeouts are adaptive."""
+        return self._adaptive
+
+    @property
+    def statistics(self) -> Mapping[str, LatencyStatistics]:
+        """Return the latency statistics per method."""
+        return {
+            method: LatencyStatistics(
+                count=latencies.count,
+                p50=latencies.percentile(50),
+                p99=latencies.percentile(99),
+                timeout=self.get_timeout(method=method),
+                timeouts=latencies.timeouts,
+            )
+            for method, latencies in self._methods.items()
+        }
+
+    def get_timeout(self, method: str) -> float:
+        """Return the timeout of a method in seconds."""
+        if (
+            self._adaptive is False
+            or (latencies := self._methods.get(method)) is None
+            or len(latencies.latencies) < _MIN_SAMPLES
+        ):
+            return self._max_timeout
+        return min(
+            self._max_timeout,
+            max(self._min_timeout, latencies.percentile(99) * _P99_FACTOR),
+        )
+
+    @contextmanager
+    def measure(self, method: str, timeout: float) -> Iterator[None]:
+        """Measure the latency of a call, that is answered by the backend or times out."""
+        start = time.monotonic()
+        try:
+            yield
+        except TimeoutError:
+            latencies = self._get_latencies(method=method)
+            latencies.timeouts += 1
+            # The call took at least the timeout, this raises the timeout of the method.
+            latencies.observe(max(timeout, time.monotonic() - start))
+            _LOGGER.debug("MEASURE: %s of %s timed out after %.1fs", method, self._name, timeout)
+            raise
+        self._get_latencies(method=method).observe(time.monotonic() - start)
+
+    def _get_latencies(self, method: str) -> _MethodLatencies:
+        """Return the latencies of a method."""
+        if (latencies := self._methods.get(method)) is None:
+            latencies = self._methods[method] = _MethodLatencies()
+        return latencies
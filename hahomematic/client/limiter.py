@@ -0,0 +1,128 @@
+"""
+Concurrency limiter for backend requests.
+
+With adaptive mode the limit follows AIMD (additive increase, multiplicative decrease):
+The limit grows by one per limit successful requests with normal latency,
+and is halved on errors or if the latency rises above the tolerated baseline.
+The baseline is kept per method, because the methods of a backend differ in their latency.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import Final
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# A latency above baseline * tolerance is a sign of an overloaded backend.
+_LATENCY_TOLERANCE: Final = 2.0
+# Weight of a latency above the baseline, so the baseline can follow a slower backend.
+_BASELINE_DRIFT: Final = 0.05
+_DECREASE_FACTOR: Final = 0.5
+_MIN_LIMIT: Final = 1
+
+
+class ConcurrencyLimiter:
+    """Limit the number of concurrent requests to a backend."""
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        adaptive: bool = False,
+        ignored_exceptions: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        """Init the concurrency limiter."""
+        self._name: Final = name
+        self._max_limit: Final = max(_MIN_LIMIT, max_limit)
+        self._adaptive: Final = adaptive
+        # Exceptions, that are answers of the backend and no sign of an overload.
+        self._ignored_exceptions: Final = ignored_exceptions
+        self._limit: float = _MIN_LIMIT if adaptive else self._max_limit
+        self._in_flight: int = 0
+        self._condition: Final = asyncio.Condition()
+        # {method, baseline latency}
+        self._baseline_latencies: Final[dict[str, float]] = {}
+        self._last_decrease: float = 0.0
+
+    @property
+    def adaptive(self) -> bool:
+        """Return if the limit is adaptive."""
+        return self._adaptive
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of running requests."""
+        return self._in_flight
+
+    @property
+    def limit(self) -> int:
+        """Return the current limit."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Return the max limit."""
+        return self._max_limit
+
+    @asynccontextmanager
+    async def limit_request(self, method: str = "") -> AsyncIterator[None]:
+        """Wait for a free slot and run a request within the limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+        start = time.monotonic()
+        try:
+            yield
+        except self._ignored_exceptions:
+            self._on_success(method=method, start=start)
+            raise
+        except Exception:
+            self._on_failure(start=start)
+            raise
+        else:
+            self._on_success(method=method, start=start)
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _on_success(self, method: str, start: float) -> None:
+        """Adapt the limit to the latency of a successful request."""
+        if not self._adaptive:
+            return
+        latency = time.monotonic() - start
+        baseline_latency = self._baseline_latencies.get(method)
+        if baseline_latency is None or latency < baseline_latency:
+            self._baseline_latencies[method] = latency
+        elif latency > baseline_latency * _LATENCY_TOLERANCE:
+            self._baseline_latencies[method] += (latency - baseline_latency) * _BASELINE_DRIFT
+            self._decrease(start=start, reason=f"latency {latency:.3f}s of {method}")
+            return
+        if self._limit < self._max_limit:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def _on_failure(self, start: float) -> None:
+        """Decrease the limit after a failed request."""
+        if self._adaptive:
+            self._decrease(start=start, reason="error")
+
+    def _decrease(self, start: float, reason: str) -> None:
+        """Decrease the limit once per window of requests."""
+        # Requests started before the last decrease belong to the old limit.
+        if start < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        limit = max(_MIN_LIMIT, self._limit * _DECREASE_FACTOR)
+        if int(limit) < int(self._limit):
+            _LOGGER.debug(
+                "DECREASE: Concurrency limit of %s decreased from %i to %i because of %s",
+                self._name,
+                self._limit,
+                limit,
+                reason,
+            )
+        self._limit = limit
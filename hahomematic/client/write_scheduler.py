@@ -0,0 +1,144 @@
+"""
+Write scheduler for backend writes.
+
+Writes to the same channel within a short window are merged into one putParamset.
+Writes to different channels are sent in parallel, writes to the same channel in order.
+Writes, that can't be merged, are sent after the pending write of their channel.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING, Any, Final
+
+from hahomematic.const import ParamsetKey
+from hahomematic.support import reduce_args
+
+if TYPE_CHECKING:
+    from hahomematic import client as hmcl
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """Writes to a channel, that are collected within the window."""
+
+    future: asyncio.Future[bool]
+    paramset: dict[str, Any] = field(default_factory=dict)
+    use_put_paramset: bool = True
+
+
+class WriteScheduler:
+    """Merge writes to the same channel within a window."""
+
+    def __init__(self, client: hmcl.Client, window: float) -> None:
+        """Init the write scheduler."""
+        self._client: Final = client
+        self._window: Final = window
+        # {channel_address, pending write}
+        self._pending: Final[dict[str, _PendingWrite]] = {}
+        # {channel_address, lock}, keeps the order of writes to a channel.
+        self._channel_locks: Final[dict[str, asyncio.Lock]] = {}
+        self._tasks: Final[set[asyncio.Task[None]]] = set()
+
+    @property
+    def window(self) -> float:
+        """Return the window in seconds."""
+        return self._window
+
+    async def write(
+        self, channel_address: str, paramset: dict[str, Any], use_put_paramset: bool = True
+    ) -> bool:
+        """Add values to the pending write of the channel and wait for the result."""
+        if (pending := self._pending.get(channel_address)) is None:
+            pending = _PendingWrite(future=asyncio.get_running_loop().create_future())
+            self._pending[channel_address] = pending
+            task = asyncio.create_task(
+                self._send_after_window(channel_address=channel_address, pending=pending),
+                name=f"write_scheduler_{channel_address}",
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(
+                lambda _: self._window_done(channel_address=channel_address, pending=pending)
+            )
+        pending.paramset.update(paramset)
+        if use_put_paramset is False:
+            pending.use_put_paramset = False
+        return await asyncio.shield(pending.future)
+
+    async def write_direct(
+        self, channel_address: str, send: Callable[[], Awaitable[bool]]
+    ) -> bool:
+        """Send a write, that can't be merged, after the pending write of the channel."""
+        # Taken before waiting for the lock, so the older pending write can't be sent later.
+        pending = self._pending.pop(channel_address, None)
+        async with self._get_channel_lock(channel_address=channel_address):
+            if pending is not None:
+                try:
+                    await self._send_pending(channel_address=channel_address, pending=pending)
+                finally:
+                    if not pending.future.done():
+                        pending.future.cancel()
+            return await send()
+
+    async def _send_after_window(self, channel_address: str, pending: _PendingWrite) -> None:
+        """Send the pending write after the window has passed."""
+        await asyncio.sleep(self._window)
+        if self._pending.get(channel_address) is not pending:
+            # A direct write to the channel has already sent the pending write.
+            return
+        del self._pending[channel_address]
+        try:
+            async with self._get_channel_lock(channel_address=channel_address):
+                await self._send_pending(channel_address=channel_address, pending=pending)
+        finally:
+            # The waiters must not hang, if the task is cancelled.
+            if not pending.future.done():
+                pending.future.cancel()
+
+    def _window_done(self, channel_address: str, pending: _PendingWrite) -> None:
+        """Release the waiters of a pending write, if the task has been cancelled before."""
+        if self._pending.get(channel_address) is pending:
+            del self._pending[channel_address]
+            if not pending.future.done():
+                pending.future.cancel()
+
+    async def _send_pending(self, channel_address: str, pending: _PendingWrite) -> None:
+        """Send the pending write and pass the result to the waiters."""
+        try:
+            pending.future.set_result(
+                await self._send(channel_address=channel_address, pending=pending)
+            )
+        except Exception as ex:
+            _LOGGER.warning(
+                "WRITE_SCHEDULER failed: %s [%s] %s, %s",
+                type(ex).__name__,
+                reduce_args(args=ex.args),
+                channel_address,
+                pending.paramset,
+            )
+            pending.future.set_exception(ex)
+
+    def _get_channel_lock(self, channel_address: str) -> asyncio.Lock:
+        """Return the lock, that keeps the order of the writes to a channel."""
+        if (lock := self._channel_locks.get(channel_address)) is None:
+            lock = self._channel_locks[channel_address] = asyncio.Lock()
+        return lock
+
+    async def _send(self, channel_address: str, pending: _PendingWrite) -> bool:
+        """Send the merged values of a channel to the backend."""
+        # pylint: disable=protected-access
+        if len(pending.paramset) == 1 or pending.use_put_paramset is False:
+            for parameter, value in pending.paramset.items():
+                if not await self._client._set_value(
+                    channel_address=channel_address, parameter=parameter, value=value
+                ):
+                    return False
+            return True
+        return await self._client._put_paramset(
+            address=channel_address, paramset_key=ParamsetKey.VALUES, value=pending.paramset
+        )
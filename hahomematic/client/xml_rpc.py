@@ -1,17 +1,33 @@
-"""Implementation of a locking ServerProxy for XML-RPC communication."""
+"""Implementation of the ServerProxies for XML-RPC communication."""
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
-from enum import Enum, IntEnum, StrEnum
+from contextlib import contextmanager, nullcontext
+import copy
+from enum import StrEnum
 import errno
 import logging
-from ssl import SSLError
+from ssl import SSLContext, SSLError
+import threading
 from typing import Any, Final, TypeVar
 import xmlrpc.client
 
-from hahomematic import central as hmcu
+from aiohttp import (
+    ClientConnectorError,
+    ClientError,
+    ClientSession,
+    ClientSSLError,
+    ClientTimeout,
+    TCPConnector,
+)
+
+from hahomematic import central as hmcu, config
+from hahomematic.client import xml_rpc_codec
+from hahomematic.client.circuit_breaker import CircuitBreaker
+from hahomematic.client.latency import LatencyTracker
+from hahomematic.client.limiter import ConcurrencyLimiter
 from hahomematic.exceptions import (
     AuthFailure,
     BaseHomematicException,
@@ -25,9 +41,10 @@ _LOGGER: Final = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
-_CONTEXT: Final = "context"
+_HEADERS: Final = "headers"
 _ENCODING_ISO_8859_1: Final = "ISO-8859-1"
 _TLS: Final = "tls"
+_TRANSPORT: Final = "transport"
 _VERIFY_TLS: Final = "verify_tls"
 
 
@@ -36,8 +53,10 @@ class XmlRpcMethod(StrEnum):
 
     GET_VERSION = "getVersion"
     INIT = "init"
+    LIST_BIDCOS_INTERFACES = "listBidcosInterfaces"
     PING = "ping"
     SYSTEM_LIST_METHODS = "system.listMethods"
+    SYSTEM_MULTICALL = "system.multicall"
 
 
 _VALID_XMLRPC_COMMANDS_ON_NO_CONNECTION: Final[tuple[str, ...]] = (
@@ -47,6 +66,18 @@ _VALID_XMLRPC_COMMANDS_ON_NO_CONNECTION: Final[tuple[str, ...]] = (
     XmlRpcMethod.SYSTEM_LIST_METHODS,
 )
 
+# Max pooled keep-alive connections of an AsyncXmlRpcProxy without client_session.
+_MAX_CONNECTIONS_PER_HOST: Final = 4
+
+# Used for proxies without concurrency limiter.
+_NO_LIMIT: Final = nullcontext()
+
+# Errors, that are sent by the backend. The backend is reachable.
+_BACKEND_ERRORS: Final = (xmlrpc.client.Fault, xmlrpc.client.ProtocolError)
+
+# Errors, that are counted as connection failures. OSError includes timeouts.
+_CONNECTION_ERRORS: Final = (NoConnection, OSError)
+
 _SSL_ERROR_CODES: Final[dict[int, str]] = {
     errno.ENOEXEC: "EOF occurred in violation of protocol",
 }
@@ -59,6 +90,115 @@ _OS_ERROR_CODES: Final[dict[int, str]] = {
 }
 
 
+@contextmanager
+def _circuit_breaker_guard(
+    circuit_breaker: CircuitBreaker | None, interface_id: str
+) -> Iterator[None]:
+    """Fail fast on an open circuit, and record the result of the request."""
+    if circuit_breaker is None:
+        yield
+        return
+    if not circuit_breaker.allow_request():
+        raise NoConnection(
+            f"Circuit breaker for {interface_id} is open, "
+            f"retry in {circuit_breaker.retry_in:.1f}s"
+        )
+    try:
+        yield
+    except _BACKEND_ERRORS:
+        circuit_breaker.record_success()
+        raise
+    except _CONNECTION_ERRORS:
+        circuit_breaker.record_failure()
+        raise
+    except BaseException:
+        # Cancelled requests and local errors tell nothing about the connection.
+        circuit_breaker.release_probe()
+        raise
+    circuit_breaker.record_success()
+
+
+class _CodecTransportMixin:
+    """Decode the responses with the xml_rpc_codec, and apply the timeout of the request."""
+
+    _timeout: float | None = None
+
+    def request(
+        self,
+        host: Any,
+        handler: str,
+        request_body: Any,
+        verbose: bool = False,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send a request with a timeout in seconds."""
+        self._timeout = timeout
+        return super().request(host, handler, request_body, verbose)  # type: ignore[misc]
+
+    def make_connection(self, host: Any) -> Any:
+        """Return the connection with the timeout of the request."""
+        connection = super().make_connection(host)  # type: ignore[misc]
+        if self._timeout is not None:
+            connection.timeout = self._timeout
+            if connection.sock:
+                connection.sock.settimeout(self._timeout)
+        return connection
+
+    def parse_response(self, response: Any) -> Any:
+        """Return the result of the response."""
+        data = response.read()
+        if response.getheader("Content-Encoding", "") == "gzip":
+            data = xmlrpc.client.gzip_decode(data)
+        return xml_rpc_codec.loads(data)
+
+
+class _Transport(_CodecTransportMixin, xmlrpc.client.Transport):
+    """Transport, that decodes the responses with the xml_rpc_codec."""
+
+
+class _SafeTransport(_CodecTransportMixin, xmlrpc.client.SafeTransport):
+    """SafeTransport, that decodes the responses with the xml_rpc_codec."""
+
+
+class _ThreadLocalTransport:
+    """
+    Transport with one connection per executor thread.
+
+    A xmlrpc transport keeps a single http connection,
+    that must not be used by concurrent requests.
+    """
+
+    def __init__(self, transport: xmlrpc.client.Transport) -> None:
+        """Init the transport."""
+        self._transport: Final = transport
+        self._local: Final = threading.local()
+        self._transports: Final[list[xmlrpc.client.Transport]] = []
+        self._lock: Final = threading.Lock()
+
+    def _get_transport(self) -> xmlrpc.client.Transport:
+        """Return the transport of the current thread."""
+        if (transport := getattr(self._local, "transport", None)) is None:
+            transport = copy.copy(self._transport)
+            # The copy must not share the connection of the original transport.
+            # xmlrpc.client has no public api to reset it.
+            transport._connection = (None, None)  # pylint: disable=protected-access
+            transport._extra_headers = []  # pylint: disable=protected-access
+            self._local.transport = transport
+            with self._lock:
+                self._transports.append(transport)
+        return transport
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """Send a request with the transport of the current thread."""
+        return self._get_transport().request(*args, **kwargs)
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            for transport in self._transports:
+                transport.close()
+
+
 # noinspection PyProtectedMember,PyUnresolvedReferences
 class XmlRpcProxy(xmlrpc.client.ServerProxy):
     """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
@@ -69,12 +209,18 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         interface_id: str,
         connection_state: hmcu.CentralConnectionState,
         *args: Any,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        latency_tracker: LatencyTracker | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize new proxy for server and get local ip."""
         self._tasks: Final[set[asyncio.Future[Any]]] = set()
         self.interface_id: Final = interface_id
         self._connection_state: Final = connection_state
+        self._concurrency_limiter: Final = concurrency_limiter
+        self._circuit_breaker: Final = circuit_breaker
+        self._latency_tracker: Final = latency_tracker
         self._loop: Final = asyncio.get_running_loop()
         self._proxy_executor: Final = (
             ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id)
@@ -84,11 +230,20 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         self._tls: Final[bool] = kwargs.pop(_TLS, False)
         self._verify_tls: Final[bool] = kwargs.pop(_VERIFY_TLS, True)
         self._supported_methods: tuple[str, ...] = ()
-        if self._tls:
-            kwargs[_CONTEXT] = get_tls_context(self._verify_tls)
+        kwargs[_TRANSPORT] = (
+            _SafeTransport(
+                headers=kwargs.pop(_HEADERS, ()), context=get_tls_context(self._verify_tls)
+            )
+            if self._tls
+            else _Transport(headers=kwargs.pop(_HEADERS, ()))
+        )
         xmlrpc.client.ServerProxy.__init__(  # type: ignore[misc]
             self, encoding=_ENCODING_ISO_8859_1, *args, **kwargs
         )
+        if max_workers > 1:
+            self._ServerProxy__transport = _ThreadLocalTransport(
+                transport=self._ServerProxy__transport  # type: ignore[has-type]
+            )
 
     async def do_init(self) -> None:
         """Init the xml rpc proxy."""
@@ -111,9 +266,18 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         task.add_done_callback(self._tasks.remove)
         return task
 
+    def _request(self, request: bytes, timeout: float | None) -> Any:
+        """Send the request with the transport of the ServerProxy."""
+        return self._ServerProxy__transport.request(
+            self._ServerProxy__host,
+            self._ServerProxy__handler,
+            request,
+            verbose=self._ServerProxy__verbose,
+            timeout=timeout,
+        )
+
     async def __async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Call method on server side."""
-        parent = xmlrpc.client.ServerProxy
         try:
             method = args[0]
             if self._supported_methods and method not in self._supported_methods:
@@ -127,14 +291,29 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
                     issuer=self, iid=self.interface_id
                 )
             ):
-                args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
-                result = await self._async_add_proxy_executor_job(
-                    # pylint: disable=protected-access
-                    parent._ServerProxy__request,  # type: ignore[attr-defined]
-                    self,
-                    *args,
-                )
+                request = xml_rpc_codec.dumps(method=method, params=args[1])
+                with _circuit_breaker_guard(
+                    circuit_breaker=self._circuit_breaker, interface_id=self.interface_id
+                ):
+                    async with (
+                        self._concurrency_limiter.limit_request(method=method)
+                        if self._concurrency_limiter
+                        else _NO_LIMIT
+                    ):
+                        timeout = (
+                            self._latency_tracker.get_timeout(method=method)
+                            if self._latency_tracker
+                            else None
+                        )
+                        with (
+                            self._latency_tracker.measure(method=method, timeout=timeout)
+                            if self._latency_tracker and timeout
+                            else _NO_LIMIT
+                        ):
+                            result = await self._async_add_proxy_executor_job(
+                                self._request, request, timeout
+                            )
                 self._connection_state.remove_issue(issuer=self, iid=self.interface_id)
                 return result
             raise NoConnection(f"No connection to {self.interface_id}")
@@ -181,36 +360,150 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             self._proxy_executor.shutdown()
 
 
-def _cleanup_args(*args: Any) -> Any:
-    """Cleanup the type of args."""
-    if len(args[1]) == 0:
-        return args
-    if len(args) == 2:
-        new_args: list[Any] = []
-        for data in args[1]:
-            if isinstance(data, dict):
-                new_args.append(_cleanup_paramset(paramset=data))
+class AsyncXmlRpcProxy:
+    """
+    XmlRPC proxy based on aiohttp.
+
+    Calls run on the event loop and use pooled keep-alive connections
+    instead of a ThreadPoolExecutor with a blocking ServerProxy.
+    """
+
+    def __init__(
+        self,
+        interface_id: str,
+        connection_state: hmcu.CentralConnectionState,
+        uri: str,
+        headers: list[tuple[str, str]],
+        tls: bool = False,
+        verify_tls: bool = True,
+        client_session: ClientSession | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        latency_tracker: LatencyTracker | None = None,
+    ) -> None:
+        """Initialize new proxy for server."""
+        self._tasks: Final[set[asyncio.Future[Any]]] = set()
+        self.interface_id: Final = interface_id
+        self._connection_state: Final = connection_state
+        self._concurrency_limiter: Final = concurrency_limiter
+        self._circuit_breaker: Final = circuit_breaker
+        self._latency_tracker: Final = latency_tracker
+        self._loop: Final = asyncio.get_running_loop()
+        self._uri: Final = uri
+        self._headers: Final = {"Content-Type": "text/xml", **dict(headers)}
+        self._tls_context: Final[SSLContext | bool] = get_tls_context(verify_tls) if tls else False
+        self._owns_client_session: Final = client_session is None
+        self._client_session: Final = client_session or ClientSession(
+            connector=TCPConnector(limit_per_host=_MAX_CONNECTIONS_PER_HOST),
+        )
+        self._timeout: Final = ClientTimeout(total=config.TIMEOUT)
+        self._supported_methods: tuple[str, ...] = ()
+
+    async def do_init(self) -> None:
+        """Init the xml rpc proxy."""
+        if supported_methods := await self.system.listMethods():
+            # ping is missing in VirtualDevices interface but can be used.
+            supported_methods.append(XmlRpcMethod.PING)
+            self._supported_methods = tuple(supported_methods)
+
+    @property
+    def supported_methods(self) -> tuple[str, ...]:
+        """Return the supported methods."""
+        return self._supported_methods
+
+    async def _async_request(self, *args: Any) -> Any:
+        """Call method on server side."""
+        try:
+            method = args[0]
+            if self._supported_methods and method not in self._supported_methods:
+                raise UnsupportedException(
+                    f"_ASYNC_REQUEST: method '{method} not supported by backend."
+                )
+
+            if method in _VALID_XMLRPC_COMMANDS_ON_NO_CONNECTION or not (
+                self._connection_state.has_issue(issuer=self, iid=self.interface_id)
+            ):
+                _LOGGER.debug("_ASYNC_REQUEST: %s", args)
+                request = xml_rpc_codec.dumps(method=method, params=args[1])
+                with _circuit_breaker_guard(
+                    circuit_breaker=self._circuit_breaker, interface_id=self.interface_id
+                ):
+                    async with (
+                        self._concurrency_limiter.limit_request(method=method)
+                        if self._concurrency_limiter
+                        else _NO_LIMIT
+                    ):
+                        timeout = (
+                            self._latency_tracker.get_timeout(method=method)
+                            if self._latency_tracker
+                            else None
+                        )
+                        with (
+                            self._latency_tracker.measure(method=method, timeout=timeout)
+                            if self._latency_tracker and timeout
+                            else _NO_LIMIT
+                        ):
+                            result = await self._post(request=request, timeout=timeout)
+                self._connection_state.remove_issue(issuer=self, iid=self.interface_id)
+                return result
+            raise NoConnection(f"No connection to {self.interface_id}")
+        except BaseHomematicException:
+            raise
+        except ClientSSLError as sslerr:
+            message = f"SSLError on {self.interface_id}: {reduce_args(args=sslerr.args)}"
+            _LOGGER.error(message)
+            raise NoConnection(message) from sslerr
+        except ClientConnectorError as cce:
+            message = f"OSError on {self.interface_id}: {reduce_args(args=cce.os_error.args)}"
+            if cce.os_error.errno in _OS_ERROR_CODES:
+                if self._connection_state.add_issue(issuer=self, iid=self.interface_id):
+                    _LOGGER.error(message)
+                else:
+                    _LOGGER.debug(message)
             else:
-                new_args.append(_cleanup_parameter(value=data))
-        return (args[0], tuple(new_args))
-    _LOGGER.error("XmlRpcProxy command: Too many arguments")
-    return args
-
-
-def _cleanup_parameter(value: Any) -> Any:
-    """Cleanup a single parameter."""
-    if isinstance(value, StrEnum):
-        return str(value)
-    if isinstance(value, IntEnum):
-        return int(value)
-    if isinstance(value, Enum):
-        _LOGGER.error("XmlRpcProxy command: Enum is not supported as parameter value")
-    return value
-
-
-def _cleanup_paramset(paramset: Mapping[str, Any]) -> dict[str, Any]:
-    """Cleanup a single parameter."""
-    new_paramset: dict[str, Any] = {}
-    for name, value in paramset.items():
-        new_paramset[name] = _cleanup_parameter(value=value)
-    return new_paramset
+                _LOGGER.error(message)
+            raise NoConnection(message) from cce
+        except (ClientError, TimeoutError) as cer:
+            message = f"{type(cer).__name__} on {self.interface_id}: {reduce_args(args=cer.args)}"
+            _LOGGER.error(message)
+            raise NoConnection(message) from cer
+        except xmlrpc.client.Fault as fex:
+            raise ClientException(
+                f"XMLRPC Fault from backend: {fex.faultCode} {fex.faultString}"
+            ) from fex
+        except TypeError as terr:
+            raise ClientException(terr) from terr
+        except xmlrpc.client.ProtocolError as per:
+            if not self._connection_state.has_issue(issuer=self, iid=self.interface_id):
+                if per.errmsg == "Unauthorized":
+                    raise AuthFailure(per) from per
+                raise NoConnection(per) from per
+        except Exception as ex:
+            raise ClientException(ex) from ex
+
+    async def _post(self, request: bytes, timeout: float | None = None) -> Any:
+        """Send the request and return the unmarshalled response."""
+        async with self._client_session.post(
+            self._uri,
+            data=request,
+            headers=self._headers,
+            timeout=ClientTimeout(total=timeout) if timeout else self._timeout,
+            ssl=self._tls_context,
+        ) as response:
+            if response.status != 200:
+                raise xmlrpc.client.ProtocolError(
+                    self._uri, response.status, response.reason or "", dict(response.headers)
+                )
+            data = await response.read()
+        return xml_rpc_codec.loads(data)
+
+    def __getattr__(self, name: str) -> Any:
+        """Magic method dispatcher."""
+        return xmlrpc.client._Method(self._async_request, name)  # type: ignore[arg-type]
+
+    def stop(self) -> None:
+        """Stop depending services."""
+        if self._owns_client_session and not self._client_session.closed:
+            task = self._loop.create_task(self._client_session.close())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.remove)
@@ -0,0 +1,366 @@
+"""
+Codec for the XML-RPC subset used by the HomeMatic backends.
+
+The decoder builds the result lists and dicts in one pass over the tokens of the
+response, instead of dispatching every element through the generic xmlrpc.client
+unmarshaller. Responses outside of the subset, e.g. faults, are decoded by expat.
+The encoder writes enums as their plain values, so the arguments don't need to be copied
+before sending, and has pre-specialized encoders for setValue and putParamset.
+"""
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable, Mapping
+from enum import Enum, IntEnum, StrEnum
+import html
+import re
+from typing import Any, Final
+import xml.parsers.expat
+import xmlrpc.client
+
+_ENCODING_ISO_8859_1: Final = "ISO-8859-1"
+
+_MAXINT: Final = 2**31 - 1
+_MININT: Final = -(2**31)
+
+_CONTAINER_TAGS: Final = frozenset({"array", "struct"})
+
+# Typed values, untyped values and names, start and end of structs and arrays.
+# Other elements like params, member and data carry no values and are skipped.
+_TOKENS: Final = re.compile(
+    r"<value>\s*<([\w.]+)>([^<]*)</\1>\s*</value>"
+    r"|<(value|name)>([^<]*)</\3>"
+    r"|<(/?)(struct|array)>"
+)
+# Empty elements, faults, comments and CDATA are left to expat.
+_UNSUPPORTED: Final = (b"/>", b"<!", b"<fault>")
+_XML_DECLARATION: Final = re.compile(rb"<\?xml[^>]*encoding=[\"']([\w.-]+)[\"']")
+
+
+def _to_bool(text: str) -> bool:
+    """Convert a boolean value."""
+    if text == "1":
+        return True
+    if text == "0":
+        return False
+    raise TypeError(f"bad boolean value: {text}")
+
+
+def _to_binary(text: str) -> xmlrpc.client.Binary:
+    """Convert a base64 value."""
+    return xmlrpc.client.Binary(base64.decodebytes(text.encode("ascii")))
+
+
+# {tag, converter of the text}
+_CONVERTERS: Final[dict[str, Callable[[str], Any]]] = {
+    "boolean": _to_bool,
+    "double": float,
+    "i1": int,
+    "i2": int,
+    "i4": int,
+    "i8": int,
+    "int": int,
+    "string": str,
+    "base64": _to_binary,
+    "dateTime.iso8601": xmlrpc.client.DateTime,
+    "nil": lambda text: None,
+}
+
+
+# An empty struct is matched like a typed value.
+_TOKEN_CONVERTERS: Final[dict[str, Callable[[str], Any]]] = {
+    **_CONVERTERS,
+    "struct": lambda text: {},
+}
+
+
+class _UnsupportedDocument(Exception):
+    """The response is outside of the subset of the token decoder."""
+
+
+class _Unmarshaller:
+    """Build the values of a methodResponse while the document is parsed."""
+
+    __slots__ = ("_containers", "_names", "_params", "_text", "_typed", "_is_fault")
+
+    def __init__(self) -> None:
+        """Init the unmarshaller."""
+        # open arrays and structs, the innermost last
+        self._containers: list[list[Any] | dict[str, Any]] = []
+        # the member name of each open struct
+        self._names: list[str] = []
+        self._params: list[Any] = []
+        self._text: str = ""
+        self._typed: bool = False
+        self._is_fault: bool = False
+
+    def start(self, tag: str, attrs: Any) -> None:
+        """Handle the start of an element."""
+        self._text = ""
+        if tag == "value":
+            self._typed = False
+        elif tag in _CONTAINER_TAGS:
+            if tag == "struct":
+                self._containers.append({})
+                self._names.append("")
+            else:
+                self._containers.append([])
+
+    def data(self, text: str) -> None:
+        """Handle character data."""
+        self._text += text
+
+    def end(self, tag: str) -> None:
+        """Handle the end of an element."""
+        if (converter := _CONVERTERS.get(tag)) is not None:
+            self._add(converter(self._text))
+        elif tag == "value":
+            # A value without type is a string.
+            if self._typed is False:
+                self._add(self._text)
+        elif tag == "name":
+            self._names[-1] = self._text
+        elif tag == "struct":
+            self._names.pop()
+            self._add(self._containers.pop())
+        elif tag == "array":
+            self._add(self._containers.pop())
+        elif tag == "fault":
+            self._is_fault = True
+
+    def _add(self, value: Any) -> None:
+        """Add a value to the innermost container or to the params."""
+        self._typed = True
+        if self._containers:
+            container = self._containers[-1]
+            if isinstance(container, dict):
+                container[self._names[-1]] = value
+            else:
+                container.append(value)
+        else:
+            self._params.append(value)
+
+    def close(self) -> Any:
+        """Return the result of the response."""
+        if self._is_fault:
+            fault = self._params[0]
+            raise xmlrpc.client.Fault(fault["faultCode"], fault["faultString"])
+        if len(self._params) == 1:
+            return self._params[0]
+        return tuple(self._params)
+
+
+def loads(data: bytes) -> Any:
+    """Return the result of a XML-RPC methodResponse. Raise Fault for a fault response."""
+    if not any(unsupported in data for unsupported in _UNSUPPORTED):
+        try:
+            return _loads_tokens(data=data)
+        except _UnsupportedDocument:
+            pass
+    return _loads_expat(data=data)
+
+
+def _loads_tokens(data: bytes) -> Any:
+    """Decode a response by its tokens."""
+    encoding = (
+        match.group(1).decode("ascii") if (match := _XML_DECLARATION.match(data)) else "utf-8"
+    )
+    params: list[Any] = []
+    container: Any = params
+    in_struct = False
+    name = ""
+    # [(container, in_struct, name)] of the enclosing containers
+    stack: list[tuple[Any, bool, str]] = []
+    for value_type, typed_text, tag, text, closing, container_tag in _TOKENS.findall(
+        data.decode(encoding)
+    ):
+        if value_type:
+            if value_type == "string":
+                value: Any = html.unescape(typed_text) if "&" in typed_text else typed_text
+            elif (converter := _TOKEN_CONVERTERS.get(value_type)) is not None:
+                value = converter(typed_text)
+            else:
+                raise _UnsupportedDocument(value_type)
+        elif tag == "name":
+            name = html.unescape(text) if "&" in text else text
+            continue
+        elif tag:
+            # A value without type is a string.
+            value = html.unescape(text) if "&" in text else text
+        elif closing:
+            if not stack:
+                raise _UnsupportedDocument(container_tag)
+            value = container
+            container, in_struct, name = stack.pop()
+        else:
+            stack.append((container, in_struct, name))
+            in_struct = container_tag == "struct"
+            container = {} if in_struct else []
+            continue
+        if in_struct:
+            container[name] = value
+        else:
+            container.append(value)
+    if stack:
+        raise _UnsupportedDocument("unclosed container")
+    if len(params) == 1:
+        return params[0]
+    return tuple(params)
+
+
+def _loads_expat(data: bytes) -> Any:
+    """Decode a response by expat."""
+    unmarshaller = _Unmarshaller()
+    parser = xml.parsers.expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = unmarshaller.start
+    parser.EndElementHandler = unmarshaller.end
+    parser.CharacterDataHandler = unmarshaller.data
+    parser.Parse(data, True)
+    return unmarshaller.close()
+
+
+def _escape(text: str) -> str:
+    """Escape the xml special characters."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _dump_bool(value: Any, out: list[str]) -> None:
+    """Add a boolean to out."""
+    out.append(
+        "<value><boolean>1</boolean></value>" if value else "<value><boolean>0</boolean></value>"
+    )
+
+
+def _dump_int(value: Any, out: list[str]) -> None:
+    """Add an integer to out."""
+    if value > _MAXINT or value < _MININT:
+        raise OverflowError("int exceeds XML-RPC limits")
+    out.append(f"<value><int>{int(value)}</int></value>")
+
+
+def _dump_float(value: Any, out: list[str]) -> None:
+    """Add a double to out."""
+    out.append(f"<value><double>{float(value)!r}</double></value>")
+
+
+def _dump_str(value: Any, out: list[str]) -> None:
+    """Add a string to out."""
+    out.append(f"<value><string>{_escape(str(value))}</string></value>")
+
+
+def _dump_struct(value: Any, out: list[str]) -> None:
+    """Add a struct to out."""
+    out.append("<value><struct>")
+    for name, member in value.items():
+        if not isinstance(name, str):
+            raise TypeError("dictionary key must be string")
+        out.append(f"<member><name>{_escape(name)}</name>")
+        _dump_value(member, out)
+        out.append("</member>")
+    out.append("</struct></value>")
+
+
+def _dump_array(value: Any, out: list[str]) -> None:
+    """Add an array to out."""
+    out.append("<value><array><data>")
+    for item in value:
+        _dump_value(item, out)
+    out.append("</data></array></value>")
+
+
+# {type, encoder}, extended by the subclasses, that have been encoded.
+_ENCODERS: Final[dict[type, Callable[[Any, list[str]], None]]] = {
+    bool: _dump_bool,
+    dict: _dump_struct,
+    float: _dump_float,
+    int: _dump_int,
+    list: _dump_array,
+    str: _dump_str,
+    tuple: _dump_array,
+}
+
+
+def _get_encoder(value_type: type) -> Callable[[Any, list[str]], None]:
+    """Return the encoder of a subclass of a supported type, e.g. StrEnum or IntEnum."""
+    if issubclass(value_type, Enum) and not issubclass(value_type, StrEnum | IntEnum):
+        raise TypeError("Enum is not supported as parameter value")
+    for base_type in (bool, str, int, float, Mapping, list, tuple):
+        if issubclass(value_type, base_type):
+            encoder = _ENCODERS[dict if base_type is Mapping else base_type]
+            _ENCODERS[value_type] = encoder
+            return encoder
+    raise TypeError(f"cannot marshal {value_type}")
+
+
+def _dump_value(value: Any, out: list[str]) -> None:
+    """Add the encoded value to out."""
+    if (encoder := _ENCODERS.get(type(value))) is None:
+        encoder = _get_encoder(value_type=type(value))
+    encoder(value, out)
+
+
+def _dump_request(method: str, out: list[str]) -> bytes:
+    """Return the methodCall of the encoded params."""
+    return (
+        f"<?xml version='1.0' encoding='{_ENCODING_ISO_8859_1}'?>\n"
+        f"<methodCall><methodName>{method}</methodName><params>"
+        f"{''.join(out)}</params></methodCall>"
+    ).encode(_ENCODING_ISO_8859_1, "xmlcharrefreplace")
+
+
+def dumps(method: str, params: tuple[Any, ...]) -> bytes:
+    """Return the encoded methodCall of a method."""
+    if (request_encoder := _REQUEST_ENCODERS.get(method)) is not None:
+        try:
+            return request_encoder(*params)
+        except TypeError:
+            # unexpected arguments are encoded by the generic encoder
+            pass
+    out: list[str] = []
+    for param in params:
+        out.append("<param>")
+        _dump_value(param, out)
+        out.append("</param>")
+    return _dump_request(method=method, out=out)
+
+
+def dumps_set_value(address: str, parameter: str, value: Any, rx_mode: str | None = None) -> bytes:
+    """Return the encoded methodCall of setValue."""
+    out: list[str] = [
+        f"<param><value><string>{_escape(address)}</string></value></param>"
+        f"<param><value><string>{_escape(parameter)}</string></value></param><param>"
+    ]
+    _dump_value(value, out)
+    out.append("</param>")
+    if rx_mode is not None:
+        out.append(f"<param><value><string>{_escape(rx_mode)}</string></value></param>")
+    return _dump_request(method="setValue", out=out)
+
+
+def dumps_put_paramset(
+    address: str, paramset_key: str, paramset: Mapping[str, Any], rx_mode: str | None = None
+) -> bytes:
+    """Return the encoded methodCall of putParamset."""
+    out: list[str] = [
+        f"<param><value><string>{_escape(address)}</string></value></param>"
+        f"<param><value><string>{_escape(paramset_key)}</string></value></param><param>"
+    ]
+    _dump_struct(paramset, out)
+    out.append("</param>")
+    if rx_mode is not None:
+        out.append(f"<param><value><string>{_escape(rx_mode)}</string></value></param>")
+    return _dump_request(method="putParamset", out=out)
+
+
+# {method, pre-specialized encoder}
+_REQUEST_ENCODERS: Final[dict[str, Callable[..., bytes]]] = {
+    "putParamset": dumps_put_paramset,
+    "setValue": dumps_set_value,
+}
@@ -5,22 +5,39 @@ from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum, StrEnum
-from typing import Final
-
+from typing import Any, Final
+
+DEFAULT_ADAPTIVE_READ_CONCURRENCY: Final = False  # adapt parallel reads to the backend (AIMD)
+DEFAULT_ADAPTIVE_TIMEOUT_MIN: Final = 5.0  # lower bound of the adaptive timeouts in seconds
+DEFAULT_ADAPTIVE_TIMEOUTS: Final = False  # derive the rpc timeouts from the measured latencies
+DEFAULT_ASYNC_XML_RPC_PROXY: Final = False  # use the aiohttp based XmlRPC proxy
+DEFAULT_ASYNC_XML_RPC_SERVER: Final = False  # use the asyncio based callback server
+DEFAULT_CIRCUIT_BREAKER_BASE_DELAY: Final = 2.0  # first delay of a recovery probe in seconds
+DEFAULT_CIRCUIT_BREAKER_MAX_DELAY: Final = 300.0  # max delay between recovery probes in seconds
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD: Final = 3  # connection failures to open the circuit, 0=off
+DEFAULT_COMMAND_QUEUE_RATE: Final = 0.0  # radio commands per second per interface, 0=off
+DEFAULT_COMMAND_QUEUE_SIZE: Final = 20  # max burst of radio commands per interface
 DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = 15  # check if connection is available via rpc ping
+DEFAULT_DEVICE_DATA_REFRESH_DELAY: Final = 2.0  # collect devices, that are reachable again
 DEFAULT_ENCODING: Final = "UTF-8"
+DEFAULT_EVENT_QUEUE_HIGH_WATER_MARK: Final = 5000  # apply the overload policy above this depth
 DEFAULT_JSON_SESSION_AGE: Final = 90
+DEFAULT_MAX_READ_WORKERS: Final = 1  # max parallel reads per interface
 DEFAULT_PING_PONG_MISMATCH_COUNT: Final = 15
 DEFAULT_PING_PONG_MISMATCH_COUNT_TTL: Final = 300
 DEFAULT_RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
+DEFAULT_SYSVAR_DELTA_POLLING: Final = False  # only poll sysvars that changed since the last poll
 DEFAULT_TIMEOUT: Final = 60  # default timeout for a connection
 DEFAULT_TLS: Final = False
 DEFAULT_VERIFY_TLS: Final = False
+DEFAULT_WEAK_EVENT_SUBSCRIPTIONS: Final = False  # don't keep entities alive by subscriptions
+DEFAULT_WRITE_COALESCING_WINDOW: Final = 0.0  # merge writes to a channel within seconds, 0=off
 
 REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
 REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 REGA_SCRIPT_PATH: Final = "../rega_scripts"
 REGA_SCRIPT_SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
+REGA_SCRIPT_SYSTEM_VARIABLES_CHANGES: Final = "get_system_variables_changes.fn"
 REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER: Final = "get_system_variables_ext_marker.fn"
 
 DEFAULT_DEVICE_DESCRIPTIONS_DIR: Final = "export_device_descriptions"
@@ -51,12 +68,17 @@ CONF_USERNAME: Final = "username"
 EVENT_ADDRESS: Final = "address"
 EVENT_AVAILABLE: Final = "available"
 EVENT_CHANNEL_NO: Final = "channel_no"
+EVENT_CIRCUIT_STATE: Final = "circuit_state"
+EVENT_COALESCED_EVENTS: Final = "coalesced_events"
 EVENT_DATA: Final = "data"
 EVENT_DEVICE_TYPE: Final = "device_type"
+EVENT_DROPPED_EVENTS: Final = "dropped_events"
 EVENT_INSTANCE_NAME: Final = "instance_name"
 EVENT_INTERFACE_ID: Final = "interface_id"
+EVENT_OVERLOAD_POLICY: Final = "overload_policy"
 EVENT_PARAMETER: Final = "parameter"
 EVENT_PONG_MISMATCH_COUNT: Final = "pong_mismatch_count"
+EVENT_RETRY_IN: Final = "retry_in"
 EVENT_SECONDS_SINCE_LAST_EVENT: Final = "seconds_since_last_event"
 EVENT_TYPE: Final = "type"
 EVENT_VALUE: Final = "value"
@@ -85,6 +107,22 @@ class CallSource(StrEnum):
     MANUAL_OR_SCHEDULED = "manual_or_scheduled"
 
 
+class CircuitState(StrEnum):
+    """Enum with the states of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+class CommandPriority(IntEnum):
+    """Enum with the priorities of the command queue. Lower priorities are sent first."""
+
+    USER = 0
+    MASTER = 1
+    BACKGROUND = 2
+
+
 class DataOperationResult(Enum):
     """Enum with data operation results."""
 
@@ -146,6 +184,14 @@ class EntityUsage(StrEnum):
     NO_CREATE = "entity_no_create"
 
 
+class EventLane(IntEnum):
+    """Enum with the priority lanes of the event queue. Lower lanes are drained first."""
+
+    AVAILABILITY = 0
+    INTERACTION = 1
+    TELEMETRY = 2
+
+
 class EventType(StrEnum):
     """Enum with hahomematic event types."""
 
@@ -156,6 +202,17 @@ class EventType(StrEnum):
     KEYPRESS = "homematic.keypress"
 
 
+class EventOverloadPolicy(StrEnum):
+    """Enum with policies for an overloaded event queue."""
+
+    BLOCK = "block"
+    COALESCE = "coalesce"
+    SHED_TELEMETRY = "shed_telemetry"
+
+
+DEFAULT_EVENT_OVERLOAD_POLICY: Final = EventOverloadPolicy.COALESCE
+
+
 class Flag(IntEnum):
     """Enum with homematic flags."""
 
@@ -222,6 +279,7 @@ class Parameter(StrEnum):
     DURATION_VALUE = "DURATION_VALUE"
     DUTYCYCLE = "DUTYCYCLE"
     DUTY_CYCLE = "DUTY_CYCLE"
+    DUTY_CYCLE_LEVEL = "DUTY_CYCLE_LEVEL"
     EFFECT = "EFFECT"
     ENERGY_COUNTER = "ENERGY_COUNTER"
     ERROR = "ERROR"
@@ -356,6 +414,8 @@ class InterfaceEventType(StrEnum):
     """Enum with hahomematic event types."""
 
     CALLBACK = "callback"
+    CIRCUIT_BREAKER = "circuit_breaker"
+    EVENT_OVERLOAD = "event_overload"
     PENDING_PONG = "pending_pong"
     PROXY = "proxy"
     UNKNOWN_PONG = "unknown_pong"
@@ -380,6 +440,7 @@ class SystemEvent(StrEnum):
     HUB_REFRESHED = "hubEntityRefreshed"
     LIST_DEVICES = "listDevices"
     NEW_DEVICES = "newDevices"
+    PARAMSET_DESCRIPTIONS_PROGRESS = "paramsetDescriptionsProgress"
     REPLACE_DEVICE = "replaceDevice"
     RE_ADDED_DEVICE = "readdedDevice"
     UPDATE_DEVICE = "updateDevice"
@@ -428,6 +489,41 @@ ENTITY_EVENTS: Final[tuple[EventType, ...]] = (
 
 IMPULSE_EVENTS: Final[tuple[Parameter, ...]] = (Parameter.SEQUENCE_OK,)
 
+# Events that must not be coalesced to the latest value
+NON_COALESCING_EVENTS: Final[tuple[str, ...]] = (
+    *CLICK_EVENTS,
+    *IMPULSE_EVENTS,
+    Parameter.CONFIG_PENDING,
+    Parameter.PONG,
+)
+
+# Events about the availability and configuration of a device
+AVAILABILITY_EVENTS: Final[tuple[str, ...]] = (
+    Parameter.CONFIG_PENDING,
+    Parameter.PONG,
+    Parameter.STICKY_UN_REACH,
+    Parameter.UN_REACH,
+)
+
+# Measurement events, that can be shed, if the event queue is overloaded
+TELEMETRY_EVENTS: Final[tuple[str, ...]] = (
+    Parameter.ACTUAL_HUMIDITY,
+    Parameter.ACTUAL_TEMPERATURE,
+    Parameter.CONCENTRATION,
+    Parameter.CURRENT,
+    Parameter.CURRENT_ILLUMINATION,
+    Parameter.ENERGY_COUNTER,
+    Parameter.FREQUENCY,
+    Parameter.HUMIDITY,
+    Parameter.ILLUMINATION,
+    Parameter.OPERATING_VOLTAGE,
+    Parameter.POWER,
+    Parameter.RSSI_DEVICE,
+    Parameter.RSSI_PEER,
+    Parameter.TEMPERATURE,
+    Parameter.VOLTAGE,
+)
+
 KEY_CHANNEL_OPERATION_MODE_VISIBILITY: Final[Mapping[str, tuple[str, ...]]] = {
     Parameter.STATE: ("BINARY_BEHAVIOR",),
     Parameter.PRESS_LONG: ("KEY_BEHAVIOR", "SWITCH_BEHAVIOR"),
@@ -514,6 +610,15 @@ class SystemVariableData(HubData):
     values: tuple[str, ...] | None = None
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SystemVariableChanges:
+    """Changes of the system variables since the last poll."""
+
+    changed: tuple[SystemVariableData, ...]
+    deleted: tuple[str, ...]
+    complete: bool
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class SystemInformation:
     """System information of the backend."""
@@ -522,3 +627,14 @@ class SystemInformation:
     auth_enabled: bool | None = None
     https_redirect_enabled: bool | None = None
     serial: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StartupMetadata:
+    """Metadata of the backend, that is fetched together at startup."""
+
+    device_details: tuple[dict[str, Any], ...]
+    channel_ids_room: Mapping[str, set[str]]
+    channel_ids_function: Mapping[str, set[str]]
+    system_variables: tuple[SystemVariableData, ...]
+    programs: tuple[ProgramData, ...]
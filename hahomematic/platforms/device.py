@@ -538,10 +538,8 @@ class HmDevice(PayloadMixin):
 
     async def load_value_cache(self) -> None:
         """Init the parameter cache."""
-        if len(self._generic_entities) > 0:
-            await self.value_cache.init_base_entities()
-        if len(self._generic_events) > 0:
-            await self.value_cache.init_readable_events()
+        if len(self._generic_entities) > 0 or len(self._generic_events) > 0:
+            await self.value_cache.init_entities()
         _LOGGER.debug(
             "INIT_DATA: Skipping load_data, missing entities for %s",
             self._device_address,
@@ -595,28 +593,82 @@ class ValueCache:
 
     def __init__(self, device: HmDevice) -> None:
         """Init the value cache."""
-        self._sema_get_or_load_value: Final = asyncio.Semaphore()
         self._device: Final = device
+        # {(channel_address, paramset_key, parameter), future of the running load}
+        self._in_flight: Final[dict[tuple[str, str, str], asyncio.Future[Any]]] = {}
         # {key, CacheEntry}
         self._device_cache: Final[dict[str, CacheEntry]] = {}
 
-    async def init_base_entities(self) -> None:
-        """Load data by get_value."""
-        try:
-            for entity in self._get_base_entities():
-                value = await self.get_value(
+    async def init_entities(self) -> None:
+        """Load the values of the base entities and readable events by one request."""
+        entities: list[GenericEntity | GenericEvent] = [
+            *self._get_base_entities(),
+            *self._get_readable_events(),
+        ]
+        values: dict[tuple[str, str, str], Any] = {}
+        keys_to_load: list[tuple[str, str, str]] = []
+        in_flight: dict[tuple[str, str, str], asyncio.Future[Any]] = {}
+        for entity in entities:
+            key = (entity.channel_address, entity.paramset_key, entity.parameter)
+            if key in values or key in keys_to_load or key in in_flight:
+                continue
+            if (future := self._in_flight.get(key)) is not None:
+                in_flight[key] = future
+            elif (
+                cached_value := self._get_value_from_cache(
                     channel_address=entity.channel_address,
                     paramset_key=entity.paramset_key,
                     parameter=entity.parameter,
-                    call_source=CallSource.HM_INIT,
                 )
-                entity.write_value(value=value)
-        except BaseHomematicException as ex:
-            _LOGGER.debug(
-                "init_base_entities: Failed to init cache for channel0 %s, %s [%s]",
-                self._device.device_type,
-                self._device.device_address,
-                ex,
+            ) != NO_CACHE_ENTRY:
+                values[key] = (
+                    NO_CACHE_ENTRY if cached_value == self._NO_VALUE_CACHE_ENTRY else cached_value
+                )
+            else:
+                keys_to_load.append(key)
+
+        if keys_to_load:
+            # Concurrent get_value calls for these keys wait for the bulk load.
+            futures = {key: self._register_load(key=key) for key in keys_to_load}
+            loaded_values: dict[tuple[str, str, str], Any] = {}
+            try:
+                loaded_values = await self._device.client.get_values(
+                    values=keys_to_load, call_source=CallSource.HM_INIT
+                )
+            except BaseHomematicException as ex:
+                _LOGGER.debug(
+                    "INIT_ENTITIES: Failed to init cache for %s, %s [%s]",
+                    self._device.device_type,
+                    self._device.device_address,
+                    ex,
+                )
+            except BaseException:
+                # On cancellation nothing is cached, the waiting requests load the values.
+                for key, future in futures.items():
+                    future.cancel()
+                    self._unregister_load(key=key, future=future)
+                raise
+            for key, future in futures.items():
+                value = loaded_values.get(key, NO_CACHE_ENTRY)
+                channel_address, paramset_key, parameter = key
+                self._add_entry_to_device_cache(
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    parameter=parameter,
+                    value=self._NO_VALUE_CACHE_ENTRY if value == NO_CACHE_ENTRY else value,
+                )
+                values[key] = value
+                future.set_result(value)
+                self._unregister_load(key=key, future=future)
+
+        for key, future in in_flight.items():
+            values[key] = await self._wait_for_load(
+                key=key, future=future, call_source=CallSource.HM_INIT
+            )
+
+        for entity in entities:
+            entity.write_value(
+                value=values[(entity.channel_address, entity.paramset_key, entity.parameter)]
             )
 
     def _get_base_entities(self) -> set[GenericEntity]:
@@ -631,25 +683,6 @@ class ValueCache:
                 entities.append(entity)
         return set(entities)
 
-    async def init_readable_events(self) -> None:
-        """Load data by get_value."""
-        try:
-            for event in self._get_readable_events():
-                value = await self.get_value(
-                    channel_address=event.channel_address,
-                    paramset_key=event.paramset_key,
-                    parameter=event.parameter,
-                    call_source=CallSource.HM_INIT,
-                )
-                event.write_value(value=value)
-        except BaseHomematicException as ex:
-            _LOGGER.debug(
-                "init_base_events: Failed to init cache for channel0 %s, %s [%s]",
-                self._device.device_type,
-                self._device.device_address,
-                ex,
-            )
-
     def _get_readable_events(self) -> set[GenericEvent]:
         """Get readable events."""
         events: list[GenericEvent] = []
@@ -666,47 +699,96 @@ class ValueCache:
         call_source: CallSource,
         direct_call: bool = False,
     ) -> Any:
-        """Load data."""
-        async with self._sema_get_or_load_value:
+        """Load data. Concurrent loads of the same parameter share one backend request."""
+        key = (channel_address, paramset_key, parameter)
+        if direct_call is False:
             if (
-                direct_call is False
-                and (
-                    cached_value := self._get_value_from_cache(
-                        channel_address=channel_address,
-                        paramset_key=paramset_key,
-                        parameter=parameter,
-                    )
-                )
-                != NO_CACHE_ENTRY
-            ):
-                return (
-                    NO_CACHE_ENTRY if cached_value == self._NO_VALUE_CACHE_ENTRY else cached_value
-                )
-
-            value: Any = self._NO_VALUE_CACHE_ENTRY
-            try:
-                value = await self._device.client.get_value(
+                cached_value := self._get_value_from_cache(
                     channel_address=channel_address,
                     paramset_key=paramset_key,
                     parameter=parameter,
-                    call_source=call_source,
                 )
-            except BaseHomematicException as ex:
-                _LOGGER.debug(
-                    "GET_OR_LOAD_VALUE: Failed to get data for %s, %s, %s: %s",
-                    self._device.device_type,
-                    channel_address,
-                    parameter,
-                    ex,
+            ) != NO_CACHE_ENTRY:
+                return (
+                    NO_CACHE_ENTRY if cached_value == self._NO_VALUE_CACHE_ENTRY else cached_value
                 )
-            self._add_entry_to_device_cache(
+            if (future := self._in_flight.get(key)) is not None:
+                return await self._wait_for_load(key=key, future=future, call_source=call_source)
+
+        # The load runs in its own task, so a cancelled requester doesn't cancel the others.
+        task = asyncio.create_task(
+            self._load_value(
                 channel_address=channel_address,
                 paramset_key=paramset_key,
                 parameter=parameter,
-                value=value,
+                call_source=call_source,
+            ),
+            name=f"load_value_{channel_address}_{parameter}",
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._unregister_load(key=key, future=done))
+        return await asyncio.shield(task)
+
+    async def _wait_for_load(
+        self, key: tuple[str, str, str], future: asyncio.Future[Any], call_source: CallSource
+    ) -> Any:
+        """Wait for a running load. Load the value again, if the running load was cancelled."""
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+        channel_address, paramset_key, parameter = key
+        return await self.get_value(
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            call_source=call_source,
+        )
+
+    async def _load_value(
+        self,
+        channel_address: str,
+        paramset_key: str,
+        parameter: str,
+        call_source: CallSource,
+    ) -> Any:
+        """Load a value from the backend and add it to the cache."""
+        value: Any = self._NO_VALUE_CACHE_ENTRY
+        try:
+            value = await self._device.client.get_value(
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                parameter=parameter,
+                call_source=call_source,
             )
+        except BaseHomematicException as ex:
+            _LOGGER.debug(
+                "GET_OR_LOAD_VALUE: Failed to get data for %s, %s, %s: %s",
+                self._device.device_type,
+                channel_address,
+                parameter,
+                ex,
+            )
+        self._add_entry_to_device_cache(
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            value=value,
+        )
+
+        return NO_CACHE_ENTRY if value == self._NO_VALUE_CACHE_ENTRY else value
+
+    def _register_load(self, key: tuple[str, str, str]) -> asyncio.Future[Any]:
+        """Register a running load, that concurrent requests for the key can wait for."""
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        return future
 
-            return NO_CACHE_ENTRY if value == self._NO_VALUE_CACHE_ENTRY else value
+    def _unregister_load(self, key: tuple[str, str, str], future: asyncio.Future[Any]) -> None:
+        """Remove a finished load, unless a newer load for the key is already running."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
 
     @staticmethod
     def _get_key(channel_address: str, paramset_key: str, parameter: str) -> str:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Callable, Mapping
 from datetime import datetime
 from functools import wraps
@@ -785,6 +786,21 @@ class CallParameterCollector:
     async def send_data(self) -> bool:
         """Send data to backend."""
         for paramset_no in dict(sorted(self._paramsets.items())).values():
+            if write_scheduler := self._client.write_scheduler:
+                # The channels of a collector_order are written in parallel.
+                results = await asyncio.gather(
+                    *(
+                        write_scheduler.write(
+                            channel_address=channel_address,
+                            paramset=paramset,
+                            use_put_paramset=self._use_put_paramset,
+                        )
+                        for channel_address, paramset in paramset_no.items()
+                    )
+                )
+                if not all(results):
+                    return False  # pragma: no cover
+                continue
             for channel_address, paramset in paramset_no.items():
                 if len(paramset.values()) == 1 or self._use_put_paramset is False:
                     for parameter, value in paramset.items():
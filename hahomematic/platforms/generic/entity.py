@@ -1,8 +1,11 @@
 """Generic python representation of a CCU parameter."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from datetime import datetime
 import logging
+import time
 from typing import Any, Final
 
 from hahomematic.const import CallSource, EntityUsage, EventType, Parameter, ParamsetKey
@@ -37,6 +40,15 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
             parameter=parameter,
             parameter_data=parameter_data,
         )
+        self._event_policy: Final = self._central.event_policy.get_event_policy(
+            device_type=self._device.device_type,
+            channel_no=self._channel_no,
+            paramset_key=self._paramset_key,
+            parameter=self._parameter,
+        )
+        self._event_accepted_at: float | None = None
+        self._debounced_value: Any = None
+        self._debounce_handle: asyncio.TimerHandle | None = None
 
     @config_property
     def usage(self) -> EntityUsage:
@@ -49,7 +61,53 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
 
     def event(self, value: Any) -> None:
         """Handle event for which this entity has subscribed."""
-
+        if self._event_policy is not None and not self._accept_event(value=value):
+            # dropped events still prove, that the value is current
+            self._set_last_refreshed(now=datetime.now())
+            return
+        self._process_event(value=value)
+
+    def _accept_event(self, value: Any) -> bool:
+        """Return if the event should be processed according to the event policy."""
+        assert self._event_policy is not None
+        if (delta := self._event_policy.delta) is not None:
+            new_value = self._convert_value(value)
+            if (
+                isinstance(new_value, int | float)
+                and isinstance(self._value, int | float)
+                and not isinstance(new_value, bool)
+                and abs(new_value - self._value) <= delta
+            ):
+                return False
+        if (throttle := self._event_policy.throttle) is not None:
+            now = time.monotonic()
+            if self._event_accepted_at is not None and now - self._event_accepted_at < throttle:
+                return False
+            self._event_accepted_at = now
+        if (debounce := self._event_policy.debounce) is not None:
+            self._debounced_value = value
+            if self._debounce_handle is not None:
+                self._debounce_handle.cancel()
+            self._debounce_handle = self._central.loop.call_later(
+                debounce, self._process_debounced_event
+            )
+            return False
+        return True
+
+    def fire_remove_entity_callback(self, *args: Any) -> None:
+        """Cancel a pending debounced event, and do what is needed when the entity has been removed."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        super().fire_remove_entity_callback(*args)
+
+    def _process_debounced_event(self) -> None:
+        """Process the last event after the debounce period."""
+        self._debounce_handle = None
+        self._process_event(value=self._debounced_value)
+
+    def _process_event(self, value: Any) -> None:
+        """Process the event."""
         old_value, new_value = self.write_value(value=value)
         if old_value == new_value:
             return
@@ -82,6 +140,12 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
                 event_type=EventType.DEVICE_AVAILABILITY,
                 event_data=self.get_event_data(new_value),
             )
+            # values of a device, that is reachable again, may be outdated
+            if self._parameter == Parameter.UN_REACH and new_value is False and old_value is True:
+                self._central.add_device_data_refresh(
+                    interface_id=self._device.interface_id,
+                    device_address=self._device.device_address,
+                )
 
     async def send_value(
         self,
@@ -13,6 +13,7 @@ from hahomematic.const import (
     HmPlatform,
     ProgramData,
     SystemEvent,
+    SystemVariableChanges,
     SystemVariableData,
     SysvarType,
 )
@@ -46,19 +47,35 @@ class Hub:
         """Fetch sysvar data for the hub."""
         async with self._sema_fetch_sysvars:
             if self._central.available:
-                await self._update_sysvar_entities(include_internal=include_internal)
+                await self._fetch_sysvar_entities(include_internal=include_internal)
 
     async def fetch_program_data(self, include_internal: bool = False) -> None:
         """Fetch program data for the hub."""
         async with self._sema_fetch_programs:
             if self._central.available:
-                await self._update_program_entities(include_internal=include_internal)
+                await self._fetch_program_entities(include_internal=include_internal)
 
-    async def _update_program_entities(self, include_internal: bool) -> None:
+    async def update_program_data(self, programs: tuple[ProgramData, ...]) -> None:
+        """Update the hub with program data, that has already been fetched."""
+        async with self._sema_fetch_programs:
+            if self._central.available:
+                self._update_program_entities(programs=programs)
+
+    async def update_sysvar_data(self, variables: tuple[SystemVariableData, ...]) -> None:
+        """Update the hub with sysvar data, that has already been fetched."""
+        async with self._sema_fetch_sysvars:
+            if self._central.available:
+                self._update_sysvar_entities(variables=variables)
+
+    async def _fetch_program_entities(self, include_internal: bool) -> None:
         """Retrieve all program data and update program values."""
         programs: tuple[ProgramData, ...] = ()
         if client := self._central.primary_client:
             programs = await client.get_all_programs(include_internal=include_internal)
+        self._update_program_entities(programs=programs)
+
+    def _update_program_entities(self, programs: tuple[ProgramData, ...]) -> None:
+        """Update program entities."""
         if not programs:
             _LOGGER.debug(
                 "UPDATE_PROGRAM_ENTITIES: No programs received for %s",
@@ -88,11 +105,46 @@ class Hub:
                 new_hub_entities=_get_new_hub_entities(entities=new_programs),
             )
 
-    async def _update_sysvar_entities(self, include_internal: bool = True) -> None:
+    async def _fetch_sysvar_entities(self, include_internal: bool = True) -> None:
         """Retrieve all variable data and update hmvariable values."""
         variables: tuple[SystemVariableData, ...] = ()
         if client := self._central.primary_client:
+            if self._central.config.sysvar_delta_polling and (
+                changes := await client.get_system_variable_changes(
+                    include_internal=include_internal
+                )
+            ):
+                self._merge_sysvar_changes(changes=changes)
+                return
             variables = await client.get_all_system_variables(include_internal=include_internal)
+        self._update_sysvar_entities(variables=variables)
+
+    def _merge_sysvar_changes(self, changes: SystemVariableChanges) -> None:
+        """Merge the changed and deleted variables into the sysvar entities."""
+        if changes.complete:
+            self._update_sysvar_entities(variables=changes.changed)
+            return
+        _LOGGER.debug(
+            "MERGE_SYSVAR_CHANGES: %i changed and %i deleted sysvars received for %s",
+            len(changes.changed),
+            len(changes.deleted),
+            self._central.name,
+        )
+        if changes.deleted:
+            self._remove_sysvar_entity(del_entities=changes.deleted)
+        variables = changes.changed
+        if self._central.model is Backend.CCU:
+            variables = _clean_variables(variables)
+        for sysvar in variables:
+            # A changed ext marker requires a new entity.
+            if (
+                entity := self._central.get_sysvar_entity(name=sysvar.name)
+            ) and entity.is_extended is not sysvar.extended_sysvar:
+                self._remove_sysvar_entity(del_entities=(sysvar.name,))
+        self._write_sysvar_entities(variables=variables)
+
+    def _update_sysvar_entities(self, variables: tuple[SystemVariableData, ...]) -> None:
+        """Update sysvar entities."""
         if not variables:
             _LOGGER.debug(
                 "UPDATE_SYSVAR_ENTITIES: No sysvars received for %s",
@@ -113,6 +165,10 @@ class Hub:
         if missing_variable_names := self._identify_missing_variable_names(variables=variables):
             self._remove_sysvar_entity(del_entities=missing_variable_names)
 
+        self._write_sysvar_entities(variables=variables)
+
+    def _write_sysvar_entities(self, variables: tuple[SystemVariableData, ...]) -> None:
+        """Write the values of existing sysvar entities and create the new ones."""
         new_sysvars: list[GenericSystemVariable] = []
 
         for sysvar in variables:
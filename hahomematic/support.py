@@ -5,13 +5,14 @@ import base64
 from collections.abc import Callable, Collection
 import contextlib
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import cache
 import logging
 import os
 import re
 import socket
 import ssl
+import time
 from typing import Any, Final, TypeVar
 
 from hahomematic.const import (
@@ -191,6 +192,11 @@ def changed_within_seconds(last_change: datetime, max_age: int | float = MAX_CAC
     return False
 
 
+def monotonic_to_datetime(timestamp: float) -> datetime:
+    """Convert a time.monotonic timestamp to a datetime."""
+    return datetime.now() - timedelta(seconds=time.monotonic() - timestamp)
+
+
 def find_free_port() -> int:
     """Find a free port for XmlRpc server default port."""
     with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
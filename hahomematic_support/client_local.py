@@ -1,6 +1,7 @@
 """The local client-object and its methods."""
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 import importlib.resources
@@ -17,7 +18,9 @@ from hahomematic.const import (
     ProductGroup,
     ProgramData,
     ProxyInitState,
+    StartupMetadata,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
 )
 
@@ -80,9 +83,16 @@ class ClientLocal(Client):  # pragma: no cover
     async def fetch_all_device_data(self) -> None:
         """Fetch all device data from CCU."""
 
+    async def fetch_device_data(self, addresses: Collection[str] = ()) -> None:
+        """Fetch the device data of the interface. Optionally only of some devices or channels."""
+
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
 
+    async def fetch_startup_metadata(self) -> StartupMetadata | None:
+        """Fetch the startup metadata."""
+        return None
+
     async def is_connected(self) -> bool:
         """
         Perform actions required for connectivity check.
@@ -96,6 +106,9 @@ class ClientLocal(Client):  # pragma: no cover
         """Return if XmlRPC-Server is alive based on received events for this client."""
         return True
 
+    async def update_duty_cycle_level(self) -> None:
+        """Update the duty cycle level of the command queue. Not supported."""
+
     async def check_connection_availability(self, handle_ping_pong: bool) -> bool:
         """Send ping to CCU to generate PONG event."""
         if handle_ping_pong and self.supports_ping_pong:
@@ -124,6 +137,12 @@ class ClientLocal(Client):  # pragma: no cover
         """Get all system variables from CCU / Homegear."""
         return ()
 
+    async def get_system_variable_changes(
+        self, include_internal: bool
+    ) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the last call."""
+        return None
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return ()
@@ -188,6 +207,19 @@ class ClientLocal(Client):  # pragma: no cover
         """Return a value from CCU."""
         return
 
+    @property
+    def _supports_multicall(self) -> bool:
+        """Return if the backend supports system.multicall."""
+        return False
+
+    async def get_values(
+        self,
+        values: Iterable[tuple[str, str, str]],
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[tuple[str, str, str], Any]:
+        """Return values from CCU."""
+        return dict.fromkeys(values)
+
     async def set_value(
         self,
         channel_address: str,
@@ -0,0 +1,346 @@
+"""
+Record and replay the event stream of a backend.
+
+The EventRecorder can be attached to the XmlRPC-Server with
+xml_rpc_server.event_recorder = EventRecorder(file_path=...).
+It writes all incoming events to a compact append-only binary log.
+The EventReplayer feeds a recorded log into a central,
+or over the wire into a callback server.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+import logging
+import os
+import struct
+import threading
+import time
+from types import TracebackType
+from typing import Any, BinaryIO, Final
+import xmlrpc.client
+
+from aiohttp import ClientSession
+import orjson
+
+from hahomematic import central as hmcu
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+FILE_HEADER: Final = b"HMEVREC1"
+
+_RECORD_STRING: Final = 1
+_RECORD_EVENT: Final = 2
+
+_VALUE_NONE: Final = 0
+_VALUE_FALSE: Final = 1
+_VALUE_TRUE: Final = 2
+_VALUE_INT: Final = 3
+_VALUE_FLOAT: Final = 4
+_VALUE_STR: Final = 5
+_VALUE_JSON: Final = 6
+
+_LENGTH: Final = struct.Struct("<I")
+_EVENT: Final = struct.Struct("<dIII")
+_INT: Final = struct.Struct("<q")
+_FLOAT: Final = struct.Struct("<d")
+
+# Yield to the event loop after this number of events, when replaying at maximum speed.
+_MAX_SPEED_YIELD_INTERVAL: Final = 100
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RecordedEvent:
+    """An event read from an event log."""
+
+    timestamp: float
+    interface_id: str
+    channel_address: str
+    parameter: str
+    value: Any
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ReplayResult:
+    """Result of a replay."""
+
+    event_count: int
+    duration: float
+    max_lag: float
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the replayed events per second."""
+        return self.event_count / self.duration if self.duration > 0 else 0.0
+
+
+class EventRecorder:
+    """Append-only binary recorder for incoming events."""
+
+    def __init__(self, file_path: str) -> None:
+        """Init the event recorder."""
+        self._file_path: Final = file_path
+        self._lock: Final = threading.Lock()
+        # {string, index}
+        self._strings: Final[dict[str, int]] = {}
+        self._event_count: int = 0
+        # The file stays open until close, so it can't be managed by a with statement.
+        # pylint: disable=consider-using-with
+        if os.path.exists(file_path) and (file_size := os.path.getsize(file_path)) > 0:
+            complete_size = len(FILE_HEADER)
+            for record, end_pos in _read_records(file_path=file_path):
+                if isinstance(record, str):
+                    self._strings[record] = len(self._strings)
+                complete_size = end_pos
+            if complete_size < file_size:
+                # Appending after a truncated record would corrupt the following records.
+                _LOGGER.debug(
+                    "EVENT_RECORDER: Removing truncated record at the end of %s", file_path
+                )
+                os.truncate(file_path, complete_size)
+            self._file: BinaryIO = open(file_path, "ab")  # noqa: SIM115
+        else:
+            self._file = open(file_path, "wb")  # noqa: SIM115
+            self._file.write(FILE_HEADER)
+
+    def __call__(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Record an event. Can be called from any thread."""
+        with self._lock:
+            if self._file.closed:
+                return
+            # The string records must be written before the event record.
+            indexes = (
+                self._get_string_index(interface_id),
+                self._get_string_index(channel_address),
+                self._get_string_index(parameter),
+            )
+            self._file.write(
+                bytes((_RECORD_EVENT,))
+                + _EVENT.pack(time.monotonic(), *indexes)
+                + _encode_value(value=value)
+            )
+            self._event_count += 1
+
+    def __enter__(self) -> EventRecorder:
+        """Enter the context of the recorder."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the recorder."""
+        self.close()
+
+    @property
+    def event_count(self) -> int:
+        """Return the number of events recorded by this recorder."""
+        return self._event_count
+
+    @property
+    def file_path(self) -> str:
+        """Return the path of the event log."""
+        return self._file_path
+
+    def flush(self) -> None:
+        """Flush the event log to disk."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the event log."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def _get_string_index(self, string: str) -> int:
+        """Return the index of a string. Writes the string on first use."""
+        if (index := self._strings.get(string)) is None:
+            index = self._strings[string] = len(self._strings)
+            encoded = string.encode()
+            self._file.write(bytes((_RECORD_STRING,)) + _LENGTH.pack(len(encoded)) + encoded)
+        return index
+
+
+class EventReplayer:
+    """
+    Replay a recorded event log.
+
+    A speed of 1.0 replays in real time, 10.0 ten times faster.
+    None replays at maximum speed.
+    The interface_id of the recorded events can be replaced.
+    """
+
+    def __init__(
+        self, file_path: str, speed: float | None = 1.0, interface_id: str | None = None
+    ) -> None:
+        """Init the event replayer."""
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be greater than 0")
+        self._file_path: Final = file_path
+        self._speed: Final = speed
+        self._interface_id: Final = interface_id
+
+    async def replay_to_central(self, central: hmcu.CentralUnit) -> ReplayResult:
+        """Feed the recorded events into central.event."""
+
+        async def _send(event: RecordedEvent) -> None:
+            central.event(
+                interface_id=event.interface_id,
+                channel_address=event.channel_address,
+                parameter=event.parameter,
+                value=event.value,
+            )
+
+        return await self._replay(send=_send)
+
+    async def replay_to_url(
+        self, url: str, client_session: ClientSession | None = None
+    ) -> ReplayResult:
+        """Send the recorded events as XML-RPC event calls to a callback server."""
+        session = client_session or ClientSession()
+
+        async def _send(event: RecordedEvent) -> None:
+            async with session.post(
+                url,
+                data=xmlrpc.client.dumps(
+                    (event.interface_id, event.channel_address, event.parameter, event.value),
+                    methodname="event",
+                    allow_none=True,
+                ),
+                headers={"Content-Type": "text/xml"},
+            ) as response:
+                await response.read()
+
+        try:
+            return await self._replay(send=_send)
+        finally:
+            if client_session is None:
+                await session.close()
+
+    async def _replay(self, send: Callable[[RecordedEvent], Awaitable[None]]) -> ReplayResult:
+        """Replay the events with the given send coroutine."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first_timestamp: float | None = None
+        event_count = 0
+        max_lag = 0.0
+        for event in read_events(file_path=self._file_path, interface_id=self._interface_id):
+            if first_timestamp is None:
+                first_timestamp = event.timestamp
+            if self._speed is None:
+                if event_count % _MAX_SPEED_YIELD_INTERVAL == 0:
+                    await asyncio.sleep(0)
+            else:
+                scheduled = start + (event.timestamp - first_timestamp) / self._speed
+                if (delay := scheduled - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                max_lag = max(max_lag, loop.time() - scheduled)
+            await send(event)
+            event_count += 1
+        duration = loop.time() - start
+        _LOGGER.debug(
+            "REPLAY: Replayed %i events of %s in %.3fs", event_count, self._file_path, duration
+        )
+        return ReplayResult(event_count=event_count, duration=duration, max_lag=max_lag)
+
+
+def read_events(file_path: str, interface_id: str | None = None) -> Iterator[RecordedEvent]:
+    """Read the events of an event log. A truncated last record is ignored."""
+    strings: list[str] = []
+    for record, _ in _read_records(file_path=file_path):
+        if isinstance(record, str):
+            strings.append(record)
+            continue
+        timestamp, interface_index, channel_index, parameter_index, value = record
+        yield RecordedEvent(
+            timestamp=timestamp,
+            interface_id=interface_id or strings[interface_index],
+            channel_address=strings[channel_index],
+            parameter=strings[parameter_index],
+            value=value,
+        )
+
+
+def _read_records(
+    file_path: str,
+) -> Iterator[tuple[str | tuple[float, int, int, int, Any], int]]:
+    """Read the complete records of an event log with the position after each record."""
+    with open(file_path, "rb") as fptr:
+        data = fptr.read()
+    if not data.startswith(FILE_HEADER):
+        raise ValueError(f"{file_path} is not an event log")
+    pos = len(FILE_HEADER)
+    try:
+        while pos < len(data):
+            record_type = data[pos]
+            pos += 1
+            if record_type == _RECORD_STRING:
+                (length,) = _LENGTH.unpack_from(data, pos)
+                pos += _LENGTH.size
+                if pos + length > len(data):
+                    return
+                pos += length
+                yield data[pos - length : pos].decode(), pos
+            elif record_type == _RECORD_EVENT:
+                timestamp, interface_index, channel_index, parameter_index = _EVENT.unpack_from(
+                    data, pos
+                )
+                pos += _EVENT.size
+                value, pos = _decode_value(data=data, pos=pos)
+                yield (timestamp, interface_index, channel_index, parameter_index, value), pos
+            else:
+                raise ValueError(f"Unknown record type {record_type} in {file_path}")
+    except (struct.error, IndexError):
+        _LOGGER.debug("READ_EVENTS: Ignoring truncated record at the end of %s", file_path)
+
+
+def _encode_value(value: Any) -> bytes:
+    """Encode a value with its type."""
+    if value is None:
+        return bytes((_VALUE_NONE,))
+    if value is True:
+        return bytes((_VALUE_TRUE,))
+    if value is False:
+        return bytes((_VALUE_FALSE,))
+    if isinstance(value, int):
+        return bytes((_VALUE_INT,)) + _INT.pack(value)
+    if isinstance(value, float):
+        return bytes((_VALUE_FLOAT,)) + _FLOAT.pack(value)
+    if isinstance(value, str):
+        encoded = value.encode()
+        return bytes((_VALUE_STR,)) + _LENGTH.pack(len(encoded)) + encoded
+    encoded = orjson.dumps(value, default=str)
+    return bytes((_VALUE_JSON,)) + _LENGTH.pack(len(encoded)) + encoded
+
+
+def _decode_value(data: bytes, pos: int) -> tuple[Any, int]:
+    """Decode a value and return it with the next position."""
+    value_type = data[pos]
+    pos += 1
+    if value_type == _VALUE_NONE:
+        return None, pos
+    if value_type == _VALUE_TRUE:
+        return True, pos
+    if value_type == _VALUE_FALSE:
+        return False, pos
+    if value_type == _VALUE_INT:
+        return _INT.unpack_from(data, pos)[0], pos + _INT.size
+    if value_type == _VALUE_FLOAT:
+        return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+    (length,) = _LENGTH.unpack_from(data, pos)
+    pos += _LENGTH.size
+    if pos + length > len(data):
+        raise IndexError("truncated value")
+    raw = data[pos : pos + length]
+    if value_type == _VALUE_STR:
+        return raw.decode(), pos + length
+    if value_type == _VALUE_JSON:
+        return orjson.loads(raw), pos + length
+    raise ValueError(f"Unknown value type {value_type}")
@@ -7,6 +7,7 @@ import logging
 import os
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
+import xmlrpc.client
 
 from aiohttp import ClientSession
 import orjson
@@ -41,6 +42,7 @@ class Factory:
         self,
         interface_config: InterfaceConfig | None,
         un_ignore_list: list[str] | None = None,
+        event_policy_list: list[str] | None = None,
     ) -> CentralUnit:
         """Return a central based on give address_device_translation."""
         interface_configs = {interface_config} if interface_config else set()
@@ -55,6 +57,7 @@ class Factory:
             default_callback_port=54321,
             client_session=self._client_session,
             un_ignore_list=un_ignore_list,
+            event_policy_list=event_policy_list,
             start_direct=True,
         ).create_central()
 
@@ -70,6 +73,7 @@ class Factory:
         do_mock_client: bool = True,
         ignore_devices_on_create: list[str] | None = None,
         un_ignore_list: list[str] | None = None,
+        event_policy_list: list[str] | None = None,
     ) -> tuple[CentralUnit, Client | Mock]:
         """Return a central based on give address_device_translation."""
         interface_config = InterfaceConfig(
@@ -81,6 +85,7 @@ class Factory:
         central = await self.get_raw_central(
             interface_config=interface_config,
             un_ignore_list=un_ignore_list,
+            event_policy_list=event_policy_list,
         )
 
         _client = ClientLocal(
@@ -98,6 +103,9 @@ class Factory:
         )
         await _client.init_client()
         client = get_mock(_client) if do_mock_client else _client
+        if do_mock_client:
+            # Properties of the mock return mocks, the write scheduler is used as is.
+            client.write_scheduler = _client.write_scheduler
 
         assert central
         assert client
@@ -111,6 +119,7 @@ class Factory:
         add_programs: bool = False,
         ignore_devices_on_create: list[str] | None = None,
         un_ignore_list: list[str] | None = None,
+        event_policy_list: list[str] | None = None,
     ) -> tuple[CentralUnit, Client | Mock]:
         """Return a central based on give address_device_translation."""
         central, client = await self.get_unpatched_default_central(
@@ -118,6 +127,7 @@ class Factory:
             do_mock_client=do_mock_client,
             ignore_devices_on_create=ignore_devices_on_create,
             un_ignore_list=un_ignore_list,
+            event_policy_list=event_policy_list,
         )
 
         patch("hahomematic.central.CentralUnit._get_primary_client", return_value=client).start()
@@ -154,6 +164,52 @@ def get_prepared_custom_entity(
     return None
 
 
+async def add_cloned_devices(
+    central: CentralUnit, interface_id: str, template_address: str, count: int
+) -> tuple[str, ...]:
+    """Clone an existing device count times and return the new device addresses."""
+    device_addresses: list[str] = []
+    template_descriptions = [
+        dev_desc
+        for dev_desc in central.device_descriptions.get_raw_device_descriptions(interface_id)
+        if dev_desc["ADDRESS"].split(":")[0] == template_address
+    ]
+    for no in range(count):
+        device_address = f"CLONE{no:05}"
+        device_addresses.append(device_address)
+        for dev_desc in template_descriptions:
+            template_channel_address = dev_desc["ADDRESS"]
+            channel_address = template_channel_address.replace(template_address, device_address)
+            clone = {
+                key: value.replace(template_address, device_address)
+                if isinstance(value, str)
+                else [v.replace(template_address, device_address) for v in value]
+                if key == "CHILDREN"
+                else value
+                for key, value in dev_desc.items()
+            }
+            # add_device_description checks for duplicates, which is slow for many devices.
+            central.device_descriptions._raw_device_descriptions[interface_id].append(clone)
+            central.device_descriptions._convert_device_description(
+                interface_id=interface_id, device_description=clone
+            )
+            for paramset_key in central.paramset_descriptions.get_paramset_keys(
+                interface_id=interface_id, channel_address=template_channel_address
+            ):
+                central.paramset_descriptions.add(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    paramset_description=central.paramset_descriptions.get_paramset_descriptions(
+                        interface_id=interface_id,
+                        channel_address=template_channel_address,
+                        paramset_key=paramset_key,
+                    ),
+                )
+    await central._create_devices()
+    return tuple(device_addresses)
+
+
 def load_device_description(central: CentralUnit, filename: str) -> Any:
     """Load device description."""
     dev_desc = _load_json_file(
@@ -163,6 +219,32 @@ def load_device_description(central: CentralUnit, filename: str) -> Any:
     return dev_desc
 
 
+def load_xml_rpc_response(resource: str, count: int | None = None) -> tuple[Any, bytes]:
+    """Load pydevccu descriptions and return them with their recorded XML-RPC response."""
+    package_path = str(importlib.resources.files("pydevccu"))
+    payload: Any = None
+    for filename in sorted(os.listdir(os.path.join(package_path, resource)))[:count]:
+        data = _load_json_file(anchor="pydevccu", resource=resource, filename=filename)
+        if isinstance(data, list):
+            payload = [*(payload or []), *data]
+        else:
+            payload = {**(payload or {}), **data}
+    # The backends don't send empty values.
+    payload = _remove_none(payload)
+    return payload, xmlrpc.client.dumps(
+        (payload,), methodresponse=True, encoding="ISO-8859-1"
+    ).encode("ISO-8859-1", "xmlcharrefreplace")
+
+
+def _remove_none(value: Any) -> Any:
+    """Remove None from lists and dicts."""
+    if isinstance(value, dict):
+        return {key: _remove_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_remove_none(item) for item in value if item is not None]
+    return value
+
+
 def get_mock(instance, **kwargs):
     """Create a mock and copy instance attributes over mock."""
     if isinstance(instance, Mock):
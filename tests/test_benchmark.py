@@ -0,0 +1,318 @@
+"""Benchmarks for the HaHomematic hot paths."""
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import MagicMock
+import xmlrpc.client
+
+import orjson
+import pydevccu
+import pytest
+
+from hahomematic.caches.dynamic import CentralDataCache
+from hahomematic.central import CentralConnectionState
+from hahomematic.central.xml_rpc_server import AsyncXmlRpcServer, RPCFunctions
+from hahomematic.client import xml_rpc_codec
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, XmlRpcProxy
+from hahomematic.const import EventLane, ParamsetKey
+from hahomematic.support import build_xml_rpc_uri, find_free_port
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+# The benchmarks only run with HAHM_BENCHMARK=1, e.g. HAHM_BENCHMARK=1 pytest -m benchmark -s
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        os.environ.get("HAHM_BENCHMARK") != "1", reason="benchmarks require HAHM_BENCHMARK=1"
+    ),
+]
+
+# The event path may take this factor of the time of the subscribed handlers alone.
+_MAX_EVENT_OVERHEAD_FACTOR = 3.0
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_benchmark_rpc_event(
+    factory: helper.Factory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Report events/second through RPCFunctions.event for 1,000 devices against the handlers."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    device_addresses = await helper.add_cloned_devices(
+        central=central, interface_id=const.INTERFACE_ID, template_address="VCU2128127", count=1000
+    )
+    assert len(central.devices) == 1001
+    # Mock callbacks would dominate the measurement.
+    central.unregister_entity_event_callback(factory.entity_event_mock)
+    central.unregister_ha_event_callback(factory.ha_event_mock)
+    server = AsyncXmlRpcServer(local_port=find_free_port())
+    server.register_central(central)
+    rpc_functions = RPCFunctions(server)
+    events = [
+        (f"{device_address}:{channel_no}", parameter, value)
+        for value in (True, False)
+        for device_address in device_addresses
+        for channel_no, parameter in ((4, "STATE"), (7, "POWER"), (0, "RSSI_DEVICE"))
+    ]
+    # The baseline only calls the subscribed handlers of the events.
+    handlers = [
+        (tuple(central._event_subscriptions.get_handlers(channel_address, parameter)), value)
+        for channel_address, parameter, value in events
+    ]
+    # The event path is measured without its debug logging.
+    caplog.set_level(logging.INFO, logger="hahomematic")
+    try:
+        start = time.perf_counter()
+        for event_handlers, value in handlers:
+            for handler in event_handlers:
+                handler(value)
+        baseline_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for channel_address, parameter, value in events:
+            rpc_functions.event(const.INTERFACE_ID, channel_address, parameter, value)
+        duration = time.perf_counter() - start
+    finally:
+        server.un_register_central(central)
+        await server.stop()
+
+    assert central.get_generic_entity(f"{device_addresses[-1]}:4", "STATE").value is False
+    _LOGGER.debug(
+        "BENCHMARK RPCFunctions.event: %i events in %.3fs, %.0f events/second, "
+        "handlers only %.3fs",
+        len(events),
+        duration,
+        len(events) / duration,
+        baseline_duration,
+    )
+    assert duration < baseline_duration * _MAX_EVENT_OVERHEAD_FACTOR
+
+
+@pytest.mark.asyncio
+async def test_benchmark_event_lane_latency(factory: helper.Factory) -> None:
+    """Report the keypress latency of the event queue during a telemetry burst."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    device_addresses = await helper.add_cloned_devices(
+        central=central, interface_id=const.INTERFACE_ID, template_address="VCU2128127", count=1000
+    )
+    central.unregister_entity_event_callback(factory.entity_event_mock)
+    central.unregister_ha_event_callback(factory.ha_event_mock)
+    loop = asyncio.get_running_loop()
+
+    def _burst() -> None:
+        for value in range(5):
+            central.event_queue.put_batch(
+                const.INTERFACE_ID,
+                tuple(
+                    (f"{device_address}:{channel_no}", parameter, value)
+                    for device_address in device_addresses
+                    for channel_no, parameter in ((7, "POWER"), (7, "ENERGY_COUNTER"))
+                ),
+            )
+            central.event_queue.put(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True)
+
+    await loop.run_in_executor(None, _burst)
+    while central.event_queue.depth:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
+
+    latencies = central.event_queue.latencies
+    for lane in (EventLane.INTERACTION, EventLane.TELEMETRY):
+        _LOGGER.debug(
+            "BENCHMARK EventQueue lane %s: %i events, mean %.4fs, p99 <= %ss, max %.4fs",
+            lane.name,
+            latencies[lane].count,
+            latencies[lane].mean,
+            latencies[lane].percentile(99),
+            latencies[lane].max,
+        )
+    assert latencies[EventLane.INTERACTION].count == 5
+    assert latencies[EventLane.INTERACTION].mean <= latencies[EventLane.TELEMETRY].mean
+
+
+@pytest.mark.asyncio
+async def test_benchmark_xml_rpc_proxy(pydev_ccu_mini: pydevccu.Server) -> None:
+    """Report calls/second of the XmlRpcProxy and the AsyncXmlRpcProxy."""
+    connection_state = CentralConnectionState()
+    uri = build_xml_rpc_uri(host=const.CCU_HOST, port=const.CCU_PORT, path=None)
+    proxies: dict[str, XmlRpcProxy | AsyncXmlRpcProxy] = {
+        "XmlRpcProxy": XmlRpcProxy(
+            max_workers=1,
+            interface_id=const.INTERFACE_ID,
+            connection_state=connection_state,
+            uri=uri,
+            headers=[],
+        ),
+        "AsyncXmlRpcProxy": AsyncXmlRpcProxy(
+            interface_id=const.INTERFACE_ID,
+            connection_state=connection_state,
+            uri=uri,
+            headers=[],
+        ),
+    }
+    calls = 200
+    calls_per_second: dict[str, float] = {}
+    try:
+        for name, proxy in proxies.items():
+            await proxy.do_init()
+            for mode in ("sequential", "concurrent"):
+                start = time.perf_counter()
+                if mode == "sequential":
+                    for _ in range(calls):
+                        await proxy.getVersion()
+                else:
+                    await asyncio.gather(*(proxy.getVersion() for _ in range(calls)))
+                duration = time.perf_counter() - start
+                calls_per_second[f"{name} {mode}"] = calls / duration
+                _LOGGER.debug(
+                    "BENCHMARK %s %s: %i calls in %.3fs, %.0f calls/second",
+                    name,
+                    mode,
+                    calls,
+                    duration,
+                    calls / duration,
+                )
+    finally:
+        for proxy in proxies.values():
+            proxy.stop()
+        await asyncio.sleep(0.1)
+    assert all(value > 0 for value in calls_per_second.values())
+
+
+@pytest.mark.asyncio
+async def test_benchmark_get_values(central_unit_mini) -> None:
+    """Report the duration of get_value calls against one get_values call."""
+    client = central_unit_mini.get_client(const.INTERFACE_ID)
+    keys = [
+        (entity.channel_address, entity.paramset_key, entity.parameter)
+        for device in central_unit_mini.devices
+        for entity in device.generic_entities
+        if entity.is_readable and entity.paramset_key == ParamsetKey.VALUES
+    ]
+    rounds = 20
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for channel_address, paramset_key, parameter in keys:
+            await client.get_value(
+                channel_address=channel_address, paramset_key=paramset_key, parameter=parameter
+            )
+    get_value_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await client.get_values(values=keys)
+    get_values_duration = time.perf_counter() - start
+
+    _LOGGER.debug(
+        "BENCHMARK Client.get_value: %i values in %.3fs, Client.get_values: %i values in %.3fs",
+        len(keys) * rounds,
+        get_value_duration,
+        len(keys) * rounds,
+        get_values_duration,
+    )
+    assert get_values_duration < get_value_duration
+
+
+@pytest.mark.parametrize(
+    "resource",
+    ["device_descriptions", "paramset_descriptions"],
+)
+def test_benchmark_xml_rpc_codec(resource: str) -> None:
+    """Report the decode duration of xmlrpc.client and the xml_rpc_codec for a large response."""
+    payload, data = helper.load_xml_rpc_response(resource=resource, count=200)
+    rounds = 3
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        assert xmlrpc.client.loads(data)[0][0] == payload
+    xmlrpc_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        assert xml_rpc_codec.loads(data) == payload
+    codec_duration = time.perf_counter() - start
+
+    _LOGGER.debug(
+        "BENCHMARK decode %s (%i bytes): xmlrpc.client %.3fs, xml_rpc_codec %.3fs",
+        resource,
+        len(data),
+        xmlrpc_duration / rounds,
+        codec_duration / rounds,
+    )
+    assert codec_duration < xmlrpc_duration
+
+
+def _measure(func: Any, rounds: int) -> tuple[float, int]:
+    """Return the best duration and the peak memory of a function."""
+    duration = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            duration = min(duration, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def test_benchmark_all_device_data() -> None:
+    """Report the duration and peak memory to decode and cache the all device data."""
+    interface = "HmIP-RF"
+    all_device_data = {
+        f"{interface}.VCU{device:07}%3A{channel}.PARAMETER_{parameter}": device * 0.5
+        for device in range(2000)
+        for channel in range(10)
+        for parameter in range(5)
+    }
+    body = orjson.dumps({"id": 0, "result": orjson.dumps(all_device_data).decode(), "error": None})
+
+    def _decode_json() -> None:
+        # response.json(), orjson for the embedded document and a copy into the cache
+        value_cache: dict[str, Any] = {}
+        response = json.loads(body.decode())
+        value_cache.update(orjson.loads(response["result"]))
+
+    def _decode_orjson() -> None:
+        data_cache = CentralDataCache(central=MagicMock())
+        response = orjson.loads(body)
+        response["result"] = orjson.loads(response["result"])
+        data_cache.add_data(interface=interface, all_device_data=response["result"])
+
+    json_duration, json_peak = _measure(_decode_json, rounds=10)
+    orjson_duration, orjson_peak = _measure(_decode_orjson, rounds=10)
+    # The decoding of the envelope is the part, that differs between both.
+    json_envelope_duration, _ = _measure(lambda: json.loads(body.decode()), rounds=10)
+    orjson_envelope_duration, _ = _measure(lambda: orjson.loads(body), rounds=10)
+    _LOGGER.debug(
+        "BENCHMARK all device data (%i bytes): json %.3fs/%.1fMB (envelope %.3fs), "
+        "orjson %.3fs/%.1fMB (envelope %.3fs)",
+        len(body),
+        json_duration,
+        json_peak / 1_000_000,
+        json_envelope_duration,
+        orjson_duration,
+        orjson_peak / 1_000_000,
+        orjson_envelope_duration,
+    )
+    assert orjson_envelope_duration < json_envelope_duration
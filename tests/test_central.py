@@ -7,10 +7,14 @@ from unittest.mock import call, patch
 
 import pytest
 
+from hahomematic.central import INTERFACE_INSTANCES
+from hahomematic.central.event_subscriptions import EventSubscriptions
+from hahomematic.client import get_client
 from hahomematic.config import PING_PONG_MISMATCH_COUNT
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
     EVENT_AVAILABLE,
+    INIT_DATETIME,
     EntityUsage,
     EventType,
     HmPlatform,
@@ -524,6 +528,34 @@ async def test_central_callbacks(factory: helper.Factory) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_central_event_timestamps(factory: helper.Factory) -> None:
+    """Test that a single event is a batch of one and stamps a monotonic timestamp."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    entity = central.get_generic_entity("VCU2128127:4", "STATE")
+    with (
+        patch.object(central, "event_batch", wraps=central.event_batch) as event_batch,
+        patch("hahomematic.central.datetime") as central_datetime,
+    ):
+        central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    assert event_batch.call_args == call(
+        interface_id=const.INTERFACE_ID, events=(("VCU2128127:4", "STATE", True),)
+    )
+    central_datetime.now.assert_not_called()
+    assert entity.value is True
+    timestamp = central._last_event_timestamps[const.INTERFACE_ID]
+    assert mock_client.last_event_timestamp == timestamp
+    assert (datetime.now() - central.last_events[const.INTERFACE_ID]).total_seconds() < 1
+
+    # the datetime of the client is converted on read, until it is set again
+    client = mock_client._mock_wraps
+    client.last_event_timestamp = timestamp - 60
+    assert 59 < (datetime.now() - client.last_updated).total_seconds() < 61
+    client.last_updated = INIT_DATETIME
+    assert client.last_event_timestamp is None
+    assert client.last_updated == INIT_DATETIME
+
+
 @pytest.mark.asyncio
 async def test_central_services(factory: helper.Factory) -> None:
     """Test central fetch sysvar and programs."""
@@ -536,29 +568,29 @@ async def test_central_services(factory: helper.Factory) -> None:
     await central.fetch_sysvar_data()
     assert mock_client.method_calls[-1] == call.get_all_system_variables(include_internal=True)
 
-    assert len(mock_client.method_calls) == 39
+    assert len(mock_client.method_calls) == 14
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.MASTER)
-    assert len(mock_client.method_calls) == 39
+    assert len(mock_client.method_calls) == 14
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.VALUES)
-    assert len(mock_client.method_calls) == 56
+    assert len(mock_client.method_calls) == 31
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 57
+    assert len(mock_client.method_calls) == 32
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(name="sv_alarm", value=True)
-    assert len(mock_client.method_calls) == 58
+    assert len(mock_client.method_calls) == 33
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 58
+    assert len(mock_client.method_calls) == 33
 
     await central.set_install_mode(interface_id=const.INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 59
+    assert len(mock_client.method_calls) == 34
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 59
+    assert len(mock_client.method_calls) == 34
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -572,7 +604,7 @@ async def test_central_services(factory: helper.Factory) -> None:
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 60
+    assert len(mock_client.method_calls) == 35
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -581,7 +613,7 @@ async def test_central_services(factory: helper.Factory) -> None:
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 60
+    assert len(mock_client.method_calls) == 35
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         address="123",
@@ -591,14 +623,14 @@ async def test_central_services(factory: helper.Factory) -> None:
     assert mock_client.method_calls[-1] == call.put_paramset(
         address="123", paramset_key="VALUES", value={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 61
+    assert len(mock_client.method_calls) == 36
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             address="123",
             paramset_key=ParamsetKey.VALUES,
             value={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 61
+    assert len(mock_client.method_calls) == 36
 
     assert (
         central.get_generic_entity(
@@ -743,3 +775,90 @@ async def test_central_getter(factory: helper.Factory) -> None:
     assert central.get_event("123", 1) is None
     assert central.get_program_button("123") is None
     assert central.get_sysvar_entity("123") is None
+
+
+@pytest.mark.asyncio
+async def test_interface_instances(factory: helper.Factory) -> None:
+    """Test the interface_id registry."""
+    central, client = await factory.get_default_central(TEST_DEVICES)
+    assert INTERFACE_INSTANCES[const.INTERFACE_ID] == (central, client)
+    assert get_client(interface_id=const.INTERFACE_ID) is client
+    assert get_client(interface_id="unknown") is None
+    await central.stop()
+    assert const.INTERFACE_ID not in INTERFACE_INSTANCES
+    assert get_client(interface_id=const.INTERFACE_ID) is None
+
+
+@pytest.mark.parametrize("use_weak_references", [False, True])
+def test_event_subscriptions(use_weak_references: bool) -> None:
+    """Test the event subscription registry."""
+
+    class Handler:
+        """Handler for events."""
+
+        def event(self, value: Any) -> None:
+            """Handle the event."""
+
+    subscriptions = EventSubscriptions(use_weak_references=use_weak_references)
+    handler1 = Handler()
+    handler2 = Handler()
+    token1 = subscriptions.subscribe("VCU0000001:1", "STATE", handler1.event)
+    token2 = subscriptions.subscribe("VCU0000001:1", "STATE", handler2.event)
+    token3 = subscriptions.subscribe("VCU0000001:2", "LEVEL", handler1.event)
+    token4 = subscriptions.subscribe("VCU0000002:1", "STATE", handler1.event)
+    assert len(subscriptions) == 4
+    assert tuple(subscriptions.get_handlers("VCU0000001:1", "STATE")) == (
+        handler1.event,
+        handler2.event,
+    )
+    assert subscriptions.get_handlers("VCU0000001:3", "STATE") == ()
+
+    subscriptions.unsubscribe(token=token1)
+    assert tuple(subscriptions.get_handlers("VCU0000001:1", "STATE")) == (handler2.event,)
+    subscriptions.unsubscribe(token=token1)
+    assert len(subscriptions) == 3
+
+    # the returned handlers are a snapshot, that is not changed by an unsubscribe
+    handlers = subscriptions.get_handlers("VCU0000001:1", "STATE")
+    subscriptions.unsubscribe_device(device_address="VCU0000001")
+    assert tuple(handlers) == (handler2.event,)
+    assert subscriptions.has_subscription("VCU0000001:1", "STATE") is False
+    assert subscriptions.has_subscription("VCU0000001:2", "LEVEL") is False
+    assert subscriptions.has_subscription("VCU0000002:1", "STATE") is True
+    subscriptions.unsubscribe(token=token2)
+    subscriptions.unsubscribe(token=token3)
+    assert len(subscriptions) == 1
+
+    del handler1
+    if use_weak_references:
+        assert tuple(subscriptions.get_handlers("VCU0000002:1", "STATE")) == ()
+        assert len(subscriptions) == 0
+    else:
+        assert len(subscriptions.get_handlers("VCU0000002:1", "STATE")) == 1
+        subscriptions.unsubscribe(token=token4)
+        assert len(subscriptions) == 0
+
+
+@pytest.mark.asyncio
+async def test_remove_device_event_subscriptions(factory: helper.Factory) -> None:
+    """Test that removing a device removes its event subscriptions."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    subscription_count = len(central._event_subscriptions)
+    assert central._event_subscriptions.has_subscription("VCU2128127:4", "STATE") is True
+    device = central.get_device("VCU2128127")
+    keys = {(entity.channel_address, entity.parameter) for entity in device.generic_entities}
+    with patch.object(
+        central._event_subscriptions,
+        "unsubscribe_device",
+        wraps=central._event_subscriptions.unsubscribe_device,
+    ) as unsubscribe_device:
+        await central.remove_device(device)
+    unsubscribe_device.assert_called_once_with(device_address="VCU2128127")
+    assert not any(
+        central._event_subscriptions.get_handlers(channel_address, parameter)
+        for channel_address, parameter in keys
+    )
+    assert central._event_subscriptions.has_subscription("VCU2128127:4", "STATE") is False
+    assert len(central._event_subscriptions) < subscription_count
+    assert central._event_subscriptions.has_subscription("VCU6354483:1", "ACTUAL_TEMPERATURE")
+    assert not any("vcu2128127" in unique_id for unique_id in central._event_subscription_tokens)
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import os
+from unittest.mock import MagicMock
 
 import orjson
 import pytest
 
-from hahomematic.const import EntityUsage
+from hahomematic.const import NO_CACHE_ENTRY, EntityUsage, ParamsetKey, SystemEvent
 from hahomematic.platforms.decorators import (
     get_public_attributes_for_config_property,
     get_public_attributes_for_value_property,
@@ -30,6 +31,88 @@ async def test_central_mini(central_unit_mini) -> None:
     assert len(central_unit_mini.get_entities(exclude_no_create=False)) == 29
 
 
+@pytest.mark.asyncio
+async def test_client_get_values(central_unit_mini) -> None:
+    """Test the batched read by system.multicall."""
+    client = central_unit_mini.get_client(const.INTERFACE_ID)
+    assert "system.multicall" in client._proxy_read.supported_methods
+    keys = [
+        (entity.channel_address, entity.paramset_key, entity.parameter)
+        for device in central_unit_mini.devices
+        for entity in device.generic_entities
+        if entity.is_readable
+    ]
+    assert ("VCU1769958:1", ParamsetKey.MASTER, "TEMPERATURE_MAXIMUM") in keys
+    unknown_key = ("VCU0000000:1", ParamsetKey.VALUES, "STATE")
+    values = await client.get_values(values=[*keys, unknown_key])
+    assert len(values) == len(keys) + 1
+    assert values[unknown_key] == NO_CACHE_ENTRY
+    for channel_address, paramset_key, parameter in keys:
+        assert values[(channel_address, paramset_key, parameter)] == await client.get_value(
+            channel_address=channel_address, paramset_key=paramset_key, parameter=parameter
+        )
+
+    # without system.multicall the values are loaded one by one
+    client._proxy_read._supported_methods = tuple(
+        method for method in client._proxy_read.supported_methods if method != "system.multicall"
+    )
+    assert await client.get_values(values=[*keys, unknown_key]) == values
+
+
+@pytest.mark.asyncio
+async def test_client_fetch_all_paramset_descriptions(central_unit_mini) -> None:
+    """Test the bulk fetch of paramset descriptions."""
+    client = central_unit_mini.get_client(const.INTERFACE_ID)
+    device_descriptions = tuple(
+        central_unit_mini.device_descriptions.get_raw_device_descriptions(const.INTERFACE_ID)
+    )
+    paramset_descriptions = await client.get_all_paramset_descriptions(
+        device_descriptions=device_descriptions
+    )
+    assert len(paramset_descriptions) == len(device_descriptions)
+    assert paramset_descriptions["VCU1769958:1"][ParamsetKey.MASTER]
+    assert paramset_descriptions["VCU1769958:1"][ParamsetKey.VALUES]
+
+    system_event_mock = MagicMock()
+    central_unit_mini.register_system_event_callback(system_event_mock)
+    await central_unit_mini.paramset_descriptions.clear()
+    await client.fetch_all_paramset_descriptions(
+        device_descriptions=device_descriptions, report_progress=True
+    )
+    progress_calls = [
+        event_call
+        for event_call in system_event_mock.call_args_list
+        if event_call.args[0] == SystemEvent.PARAMSET_DESCRIPTIONS_PROGRESS
+    ]
+    assert progress_calls
+    assert progress_calls[-1].kwargs["fetched"] == progress_calls[-1].kwargs["total"]
+
+    # the fetch for a single device doesn't report progress
+    system_event_mock.reset_mock()
+    await client.fetch_paramset_descriptions(device_description=device_descriptions[0])
+    assert not any(
+        event_call.args[0] == SystemEvent.PARAMSET_DESCRIPTIONS_PROGRESS
+        for event_call in system_event_mock.call_args_list
+    )
+    assert (
+        central_unit_mini.paramset_descriptions.get_paramset_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU1769958:1",
+            paramset_key=ParamsetKey.VALUES,
+        )
+        == paramset_descriptions["VCU1769958:1"][ParamsetKey.VALUES]
+    )
+
+    # without system.multicall the paramset descriptions are loaded one by one
+    client._proxy_read._supported_methods = tuple(
+        method for method in client._proxy_read.supported_methods if method != "system.multicall"
+    )
+    assert (
+        await client.get_all_paramset_descriptions(device_descriptions=device_descriptions)
+        == paramset_descriptions
+    )
+
+
 @pytest.mark.asyncio
 async def test_central_full(central_unit_full) -> None:
     """Test the central."""
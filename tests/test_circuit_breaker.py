@@ -0,0 +1,162 @@
+"""Test the circuit breaker."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, call
+
+import pydevccu
+import pytest
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.circuit_breaker import CircuitBreaker
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, _circuit_breaker_guard
+from hahomematic.const import CircuitState
+from hahomematic.exceptions import NoConnection
+from hahomematic.support import build_xml_rpc_uri, find_free_port
+
+from tests import const
+
+# pylint: disable=protected-access
+
+
+def test_circuit_breaker_states() -> None:
+    """Test the transitions between closed, open and half open."""
+    state_changed_mock = MagicMock()
+    circuit_breaker = CircuitBreaker(
+        name="test",
+        failure_threshold=2,
+        base_delay=0.0,
+        max_delay=0.0,
+        state_changed_callback=state_changed_mock,
+    )
+    assert circuit_breaker.state == CircuitState.CLOSED
+    circuit_breaker.record_failure()
+    assert circuit_breaker.allow_request() is True
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert state_changed_mock.call_args_list == [call(CircuitState.OPEN, 0.0)]
+
+    # only one probe passes
+    assert circuit_breaker.allow_request() is True
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    assert circuit_breaker.allow_request() is False
+
+    # a failed probe opens the circuit again
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert circuit_breaker.allow_request() is True
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert [args[0] for args, _ in state_changed_mock.call_args_list] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_circuit_breaker_backoff() -> None:
+    """Test that the delay between the probes grows exponentially with jitter."""
+    circuit_breaker = CircuitBreaker(
+        name="test", failure_threshold=1, base_delay=10.0, max_delay=100.0
+    )
+    circuit_breaker.record_failure()
+    assert 5.0 <= circuit_breaker.retry_in <= 10.0
+    assert circuit_breaker.allow_request() is False
+
+    for attempt, max_delay in enumerate((20.0, 40.0, 80.0, 100.0, 100.0), start=1):
+        circuit_breaker._probe_at = 0.0
+        assert circuit_breaker.allow_request() is True
+        circuit_breaker.record_failure()
+        assert circuit_breaker._attempts == attempt
+        assert max_delay / 2 - 0.1 <= circuit_breaker.retry_in <= max_delay
+
+    # the jitter spreads the probes of several clients
+    delays = set()
+    for _ in range(10):
+        other = CircuitBreaker(name="test", failure_threshold=1, base_delay=10.0, max_delay=100.0)
+        other.record_failure()
+        delays.add(round(other.retry_in, 3))
+    assert len(delays) > 1
+
+
+def test_circuit_breaker_guard_cancelled() -> None:
+    """Test that only connection errors are counted, and a cancelled probe is released."""
+    circuit_breaker = CircuitBreaker(
+        name="test", failure_threshold=1, base_delay=60.0, max_delay=60.0
+    )
+    with pytest.raises(asyncio.CancelledError), _circuit_breaker_guard(
+        circuit_breaker=circuit_breaker, interface_id="test"
+    ):
+        raise asyncio.CancelledError
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+    with pytest.raises(TimeoutError), _circuit_breaker_guard(
+        circuit_breaker=circuit_breaker, interface_id="test"
+    ):
+        raise TimeoutError
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    # a cancelled probe lets the next request probe again
+    circuit_breaker._probe_at = 0.0
+    with pytest.raises(asyncio.CancelledError), _circuit_breaker_guard(
+        circuit_breaker=circuit_breaker, interface_id="test"
+    ):
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+        raise asyncio.CancelledError
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert circuit_breaker._attempts == 0
+    assert circuit_breaker.allow_request() is True
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_proxy_no_connection() -> None:
+    """Test that an open circuit fails fast."""
+    circuit_breaker = CircuitBreaker(
+        name=const.INTERFACE_ID, failure_threshold=2, base_delay=60.0, max_delay=60.0
+    )
+    proxy = AsyncXmlRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        uri=build_xml_rpc_uri(host=const.CCU_HOST, port=find_free_port(), path=None),
+        headers=[],
+        circuit_breaker=circuit_breaker,
+    )
+    proxy._post = MagicMock(wraps=proxy._post)
+    try:
+        for _ in range(2):
+            with pytest.raises(NoConnection):
+                await proxy.ping(const.INTERFACE_ID)
+        assert circuit_breaker.state == CircuitState.OPEN
+        assert proxy._post.call_count == 2
+
+        with pytest.raises(NoConnection, match="Circuit breaker"):
+            await proxy.ping(const.INTERFACE_ID)
+        assert proxy._post.call_count == 2
+    finally:
+        await proxy._client_session.close()
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_proxy_recovery(pydev_ccu_mini: pydevccu.Server) -> None:
+    """Test that a successful probe closes the circuit."""
+    circuit_breaker = CircuitBreaker(
+        name=const.INTERFACE_ID, failure_threshold=1, base_delay=0.1, max_delay=0.1
+    )
+    proxy = AsyncXmlRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        uri=build_xml_rpc_uri(host=const.CCU_HOST, port=const.CCU_PORT, path=None),
+        headers=[],
+        circuit_breaker=circuit_breaker,
+    )
+    try:
+        circuit_breaker.record_failure()
+        with pytest.raises(NoConnection, match="Circuit breaker"):
+            await proxy.getVersion()
+        await asyncio.sleep(circuit_breaker.retry_in)
+        assert await proxy.getVersion()
+        assert circuit_breaker.state == CircuitState.CLOSED
+    finally:
+        await proxy._client_session.close()
@@ -0,0 +1,131 @@
+"""Test the duty cycle aware command queue."""
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hahomematic.client import Client
+from hahomematic.client.command_queue import CommandQueue
+from hahomematic.const import CommandPriority, InterfaceName
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_command_queue_token_bucket() -> None:
+    """Test that commands above the bucket size wait for new tokens."""
+    command_queue = CommandQueue(name="test", rate=20.0, size=2)
+    assert command_queue.rate == 20.0
+
+    start = time.monotonic()
+    for _ in range(2):
+        await command_queue.acquire(priority=CommandPriority.USER)
+    assert time.monotonic() - start < 0.05
+    await command_queue.acquire(priority=CommandPriority.USER)
+    assert time.monotonic() - start >= 0.04
+    assert command_queue.depth == 0
+
+    # background reads don't need tokens
+    start = time.monotonic()
+    for _ in range(10):
+        await command_queue.acquire(priority=CommandPriority.BACKGROUND)
+    assert time.monotonic() - start < 0.05
+
+    wait_times = command_queue.wait_times
+    assert wait_times[CommandPriority.USER].count == 3
+    assert wait_times[CommandPriority.USER].max >= 0.04
+    assert wait_times[CommandPriority.BACKGROUND].count == 10
+    assert wait_times[CommandPriority.MASTER].count == 0
+
+
+@pytest.mark.asyncio
+async def test_command_queue_priority() -> None:
+    """Test that waiting user commands are sent before MASTER writes, background reads bypass."""
+    command_queue = CommandQueue(name="test", rate=50.0, size=1)
+    await command_queue.acquire(priority=CommandPriority.USER)
+    order: list[str] = []
+
+    async def _command(name: str, priority: CommandPriority) -> None:
+        await command_queue.acquire(priority=priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(_command("master_1", CommandPriority.MASTER)),
+        asyncio.create_task(_command("master_2", CommandPriority.MASTER)),
+        asyncio.create_task(_command("background", CommandPriority.BACKGROUND)),
+    ]
+    await asyncio.sleep(0)
+    assert command_queue.depth == 2
+    assert order == ["background"]
+    tasks.append(asyncio.create_task(_command("user", CommandPriority.USER)))
+    await asyncio.gather(*tasks)
+    assert order == ["background", "user", "master_1", "master_2"]
+
+
+@pytest.mark.asyncio
+async def test_command_queue_cancel() -> None:
+    """Test that a cancelled command doesn't block the queue."""
+    command_queue = CommandQueue(name="test", rate=20.0, size=1)
+    await command_queue.acquire(priority=CommandPriority.USER)
+    task = asyncio.create_task(command_queue.acquire(priority=CommandPriority.MASTER))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert command_queue.depth == 0
+    await asyncio.wait_for(command_queue.acquire(priority=CommandPriority.USER), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_command_queue_duty_cycle() -> None:
+    """Test that the refill rate follows the reported duty cycle."""
+    command_queue = CommandQueue(name="test", rate=10.0, size=5)
+    command_queue.set_duty_cycle_level(channel_address="VCU0000001:0", value=50.0)
+    assert command_queue.duty_cycle_level == 50.0
+    assert command_queue.rate == 5.0
+
+    # the highest level of the access points of the interface is used
+    command_queue.set_duty_cycle_level(channel_address="VCU0000002:0", value=100.0)
+    assert command_queue.duty_cycle_level == 100.0
+    assert command_queue.rate == pytest.approx(1.0)
+
+    command_queue.set_duty_cycle_level(channel_address="VCU0000002:0", value=0.0)
+    command_queue.set_duty_cycle_level(channel_address="VCU0000001:0", value=2.0)
+    assert command_queue.duty_cycle_level == 2.0
+    assert command_queue.rate == pytest.approx(9.8)
+    assert command_queue.tokens == 5.0
+
+    # invalid levels are ignored
+    command_queue.set_duty_cycle_level(channel_address="VCU0000001:0", value="invalid")
+    command_queue.set_duty_cycle_level(channel_address="VCU0000001:0", value=None)
+    assert command_queue.duty_cycle_level == 2.0
+
+
+@pytest.mark.asyncio
+async def test_command_queue_bidcos_duty_cycle() -> None:
+    """Test that the duty cycle of the BidCos-RF rf modules is read by listBidcosInterfaces."""
+    proxy = MagicMock(supported_methods=("listBidcosInterfaces",))
+    proxy.listBidcosInterfaces = AsyncMock(
+        return_value=[
+            {"ADDRESS": "KEQ0000001", "CONNECTED": True, "DUTY_CYCLE": 20},
+            {"ADDRESS": "KEQ0000002", "CONNECTED": True, "DUTY_CYCLE": 40},
+        ]
+    )
+    client = SimpleNamespace(
+        _command_queue=CommandQueue(name="test", rate=10.0, size=5),
+        _proxy=proxy,
+        interface=InterfaceName.BIDCOS_RF,
+        interface_id=f"test-{InterfaceName.BIDCOS_RF}",
+    )
+    await Client.update_duty_cycle_level(client)  # type: ignore[arg-type]
+    assert client._command_queue.duty_cycle_level == 40.0
+
+    # other interfaces don't provide listBidcosInterfaces
+    client.interface = InterfaceName.HMIP_RF
+    proxy.listBidcosInterfaces.reset_mock()
+    await Client.update_duty_cycle_level(client)  # type: ignore[arg-type]
+    proxy.listBidcosInterfaces.assert_not_called()
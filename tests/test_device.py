@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from unittest.mock import call, patch
 
 import pytest
 
@@ -64,6 +65,25 @@ async def test_device_availability(factory: helper.Factory) -> None:
         assert custom_entity.available is True
 
 
+@pytest.mark.asyncio
+async def test_device_availability_refresh(factory: helper.Factory) -> None:
+    """Test that devices, that are reachable again, are refreshed together."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    with patch("hahomematic.central.DEFAULT_DEVICE_DATA_REFRESH_DELAY", 0.01), patch.object(
+        central, "refresh_device_data"
+    ) as refresh_device_data:
+        for device_address in TEST_DEVICES:
+            central.event(const.INTERFACE_ID, f"{device_address}:0", "UNREACH", 1)
+            central.event(const.INTERFACE_ID, f"{device_address}:0", "STICKY_UNREACH", 1)
+        for device_address in TEST_DEVICES:
+            central.event(const.INTERFACE_ID, f"{device_address}:0", "UNREACH", 0)
+            central.event(const.INTERFACE_ID, f"{device_address}:0", "STICKY_UNREACH", 0)
+        await asyncio.sleep(0.1)
+    assert refresh_device_data.call_args_list == [
+        call(interface_id=const.INTERFACE_ID, device_addresses=set(TEST_DEVICES))
+    ]
+
+
 @pytest.mark.asyncio
 async def test_device_config_pending(factory: helper.Factory) -> None:
     """Test device availability."""
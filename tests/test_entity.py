@@ -1,13 +1,14 @@
 """Tests for switch entities of hahomematic."""
 from __future__ import annotations
 
-from typing import cast
-from unittest.mock import MagicMock, call
+import asyncio
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
 from hahomematic.caches.visibility import check_ignore_parameters_is_clean
-from hahomematic.const import CallSource, EntityUsage
+from hahomematic.const import NO_CACHE_ENTRY, CallSource, EntityUsage
 from hahomematic.platforms.custom.definition import (
     get_required_parameters,
     validate_entity_definition,
@@ -161,3 +162,95 @@ def test_custom_required_entities() -> None:
     required_parameters = get_required_parameters()
     assert len(required_parameters) == 75
     assert check_ignore_parameters_is_clean() is True
+
+
+@pytest.mark.asyncio
+async def test_value_cache_single_flight(factory: helper.Factory) -> None:
+    """Test that concurrent loads of the same parameter share one request."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    device = central.get_device("VCU2128127")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _get_value(**kwargs) -> Any:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return kwargs["parameter"] == "STATE"
+
+    mock_client.get_value = AsyncMock(side_effect=_get_value)
+    results = await asyncio.gather(
+        *(
+            device.value_cache.get_value(
+                channel_address="VCU2128127:4",
+                paramset_key="VALUES",
+                parameter="STATE",
+                call_source=CallSource.MANUAL_OR_SCHEDULED,
+            )
+            for _ in range(5)
+        ),
+        device.value_cache.get_value(
+            channel_address="VCU2128127:4",
+            paramset_key="VALUES",
+            parameter="ON_TIME",
+            call_source=CallSource.MANUAL_OR_SCHEDULED,
+        ),
+    )
+    assert results == [True, True, True, True, True, False]
+    assert mock_client.get_value.call_count == 2
+    # unrelated parameters are loaded in parallel
+    assert max_in_flight == 2
+    assert device.value_cache._in_flight == {}
+
+    # the value is cached now
+    assert (
+        await device.value_cache.get_value(
+            channel_address="VCU2128127:4",
+            paramset_key="VALUES",
+            parameter="STATE",
+            call_source=CallSource.MANUAL_OR_SCHEDULED,
+        )
+        is True
+    )
+    assert mock_client.get_value.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_value_cache_cancelled_init(factory: helper.Factory) -> None:
+    """Test that a cancelled bulk load caches nothing, and the waiting requests load again."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    device = central.get_device("VCU2128127")
+
+    async def _get_values(**kwargs) -> Any:
+        await asyncio.sleep(1)
+        return {}
+
+    mock_client.get_values = AsyncMock(side_effect=_get_values)
+    mock_client.get_value = AsyncMock(return_value=True)
+    device.value_cache._device_cache.clear()
+    init_task = asyncio.create_task(device.value_cache.init_entities())
+    await asyncio.sleep(0)
+    assert ("VCU2128127:0", "VALUES", "UNREACH") in device.value_cache._in_flight
+    get_value_task = asyncio.create_task(
+        device.value_cache.get_value(
+            channel_address="VCU2128127:0",
+            paramset_key="VALUES",
+            parameter="UNREACH",
+            call_source=CallSource.MANUAL_OR_SCHEDULED,
+        )
+    )
+    await asyncio.sleep(0)
+    init_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await init_task
+    assert await get_value_task is True
+    assert mock_client.get_value.call_count == 1
+    assert device.value_cache._in_flight == {}
+    assert (
+        device.value_cache._get_value_from_cache(
+            channel_address="VCU2128127:0", paramset_key="VALUES", parameter="CONFIG_PENDING"
+        )
+        == NO_CACHE_ENTRY
+    )
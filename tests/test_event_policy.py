@@ -0,0 +1,133 @@
+"""Test the event policies."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from hahomematic.caches.event_policy import EventPolicy
+from hahomematic.const import INIT_DATETIME, ParamsetKey
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU3941846": "HMIP-PSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    (
+        "line",
+        "channel_no",
+        "parameter",
+        "expected_result",
+    ),
+    [
+        ("POWER throttle=5", 6, "POWER", EventPolicy(throttle=5.0)),
+        ("POWER:VALUES@HmIP-PSM:6 debounce=2", 6, "POWER", EventPolicy(debounce=2.0)),
+        ("POWER:VALUES@hmip-psm:all delta=10", 6, "POWER", EventPolicy(delta=10.0)),
+        (
+            "POWER:VALUES@all:6 throttle=1 delta=0.5",
+            6,
+            "POWER",
+            EventPolicy(throttle=1.0, delta=0.5),
+        ),
+        ("POWER:VALUES@HmIP-PSM:5 throttle=5", 6, "POWER", None),
+        ("POWER:VALUES@HmIP-BSM:all throttle=5", 6, "POWER", None),
+        ("POWER:MASTER@HmIP-PSM:6 throttle=5", 6, "POWER", None),
+        ("POWER", 6, "POWER", None),
+        ("POWER throttle=five", 6, "POWER", None),
+        ("POWER speed=5", 6, "POWER", None),
+        ("POWER:VALUES throttle=5", 6, "POWER", None),
+        ("CURRENT throttle=5", 6, "POWER", None),
+    ],
+)
+@pytest.mark.asyncio
+async def test_event_policy_lines(
+    factory: helper.Factory,
+    line: str,
+    channel_no: int,
+    parameter: str,
+    expected_result: EventPolicy | None,
+) -> None:
+    """Test the parsing of event policy lines."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    central.event_policy._add_line_to_cache(line)
+    central.event_policy.get_event_policy.cache_clear()
+    assert (
+        central.event_policy.get_event_policy(
+            device_type="HmIP-PSM",
+            channel_no=channel_no,
+            paramset_key=ParamsetKey.VALUES,
+            parameter=parameter,
+        )
+        == expected_result
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_policy_throttle(factory: helper.Factory) -> None:
+    """Test the leading edge throttle."""
+    central, _ = await factory.get_default_central(
+        TEST_DEVICES, event_policy_list=["POWER:VALUES@HmIP-PSM:6 throttle=5"]
+    )
+    power = central.get_generic_entity("VCU3941846:6", "POWER")
+    assert power._event_policy == EventPolicy(throttle=5.0)
+    with patch("hahomematic.platforms.generic.entity.time.monotonic", return_value=100.0):
+        central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 10.0)
+        assert power.value == 10.0
+        last_updated = power.last_updated
+        central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 20.0)
+        assert power.value == 10.0
+        assert power.last_updated == last_updated
+        assert power.last_refreshed > last_updated
+    with patch("hahomematic.platforms.generic.entity.time.monotonic", return_value=105.0):
+        central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 30.0)
+        assert power.value == 30.0
+
+    # parameters without policy are not affected
+    current = central.get_generic_entity("VCU3941846:6", "CURRENT")
+    assert current._event_policy is None
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "CURRENT", 1.0)
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "CURRENT", 2.0)
+    assert current.value == 2.0
+
+
+@pytest.mark.asyncio
+async def test_event_policy_debounce_and_delta(factory: helper.Factory) -> None:
+    """Test the trailing debounce and the delta policy."""
+    central, _ = await factory.get_default_central(
+        TEST_DEVICES,
+        event_policy_list=[
+            "POWER:VALUES@HmIP-PSM:6 debounce=0.01",
+            "VOLTAGE delta=2",
+        ],
+    )
+    power = central.get_generic_entity("VCU3941846:6", "POWER")
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 10.0)
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 20.0)
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 30.0)
+    assert power.value is None
+    assert power.last_updated == INIT_DATETIME
+    assert power.last_refreshed != INIT_DATETIME
+    await asyncio.sleep(0.05)
+    assert power.value == 30.0
+
+    voltage = central.get_generic_entity("VCU3941846:6", "VOLTAGE")
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "VOLTAGE", 230.0)
+    assert voltage.value == 230.0
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "VOLTAGE", 231.5)
+    assert voltage.value == 230.0
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "VOLTAGE", 227.5)
+    assert voltage.value == 227.5
+
+    # a pending debounced event is cancelled, when the device is removed
+    central.event(const.INTERFACE_ID, "VCU3941846:6", "POWER", 40.0)
+    assert power._debounce_handle is not None
+    await central.remove_device(central.get_device("VCU3941846"))
+    assert power._debounce_handle is None
+    await asyncio.sleep(0.05)
+    assert power.value == 30.0
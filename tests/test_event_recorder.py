@@ -0,0 +1,114 @@
+"""Test the event recorder and replayer."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from hahomematic.central.xml_rpc_server import AsyncXmlRpcServer, RPCFunctions
+from hahomematic.support import find_free_port
+from hahomematic_support.event_recorder import EventRecorder, EventReplayer, read_events
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+def test_event_recorder_values(tmp_path) -> None:
+    """Test that all value types are recorded."""
+    file_path = os.path.join(tmp_path, "events.bin")
+    values = [None, True, False, 0, -5, 2**40, 1.5, "text", "äöü", [1, 2], {"a": 1}]
+    with EventRecorder(file_path=file_path) as recorder:
+        for value in values:
+            recorder(const.INTERFACE_ID, "VCU2128127:4", "STATE", value)
+        assert recorder.event_count == len(values)
+    events = list(read_events(file_path=file_path))
+    assert [event.value for event in events] == values
+    assert events[0].interface_id == const.INTERFACE_ID
+    assert events[0].channel_address == "VCU2128127:4"
+    assert events[0].parameter == "STATE"
+    assert events[0].timestamp <= events[-1].timestamp
+
+    # append to an existing log and reuse its strings
+    size = os.path.getsize(file_path)
+    with EventRecorder(file_path=file_path) as recorder:
+        recorder(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    assert os.path.getsize(file_path) - size == 1 + 20 + 1
+    assert len(list(read_events(file_path=file_path))) == len(values) + 1
+
+    # a truncated last record is ignored
+    with open(file_path, "r+b") as fptr:
+        fptr.truncate(os.path.getsize(file_path) - 1)
+    assert len(list(read_events(file_path=file_path))) == len(values)
+    assert {event.interface_id for event in read_events(file_path, interface_id="other")} == {
+        "other"
+    }
+
+    # appending removes the truncated last record first
+    with EventRecorder(file_path=file_path) as recorder:
+        recorder(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    events = list(read_events(file_path=file_path))
+    assert len(events) == len(values) + 1
+    assert events[-1].value is False
+
+
+@pytest.mark.asyncio
+async def test_event_record_and_replay(factory: helper.Factory, tmp_path) -> None:
+    """Test recording at the xml rpc server and replaying into central and server."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    file_path = os.path.join(tmp_path, "events.bin")
+    server = AsyncXmlRpcServer(local_port=find_free_port())
+    server.register_central(central)
+    rpc_functions = RPCFunctions(server)
+    switch = central.get_generic_entity("VCU2128127:4", "STATE")
+    try:
+        with EventRecorder(file_path=file_path) as recorder:
+            server.event_recorder = recorder
+            rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+            rpc_functions.event_batch(
+                const.INTERFACE_ID,
+                [("VCU2128127:4", "STATE", False), ("VCU2128127:4", "STATE", True)],
+            )
+            server.event_recorder = None
+            # the events are recorded by the executor of the async server
+            server._record_executor.submit(lambda: None).result()
+        assert recorder.event_count == 3
+        assert switch.value is True
+
+        # a failing recorder doesn't stop the delivery of events
+        def _failing_recorder(*args) -> None:
+            raise OSError("disk full")
+
+        server.event_recorder = _failing_recorder
+        rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+        server._record_executor.submit(lambda: None).result()
+        server.event_recorder = None
+        assert switch.value is False
+
+        result = await EventReplayer(file_path=file_path, speed=None).replay_to_central(central)
+        assert result.event_count == 3
+        assert result.events_per_second > 0
+        assert switch.value is True
+
+        await switch.send_value(False)
+        result = await EventReplayer(file_path=file_path, speed=100.0).replay_to_central(central)
+        assert result.event_count == 3
+        assert switch.value is True
+
+        await server.start()
+        await switch.send_value(False)
+        result = await EventReplayer(file_path=file_path, speed=None).replay_to_url(
+            url=f"http://127.0.0.1:{server.local_port}/RPC2"
+        )
+        assert result.event_count == 3
+        assert switch.value is True
+    finally:
+        server.un_register_central(central)
+        await server.stop()
+
+    with pytest.raises(ValueError):
+        EventReplayer(file_path=file_path, speed=0)
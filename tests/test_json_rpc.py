@@ -1,11 +1,24 @@
 """Tests for json rpc client of hahomematic."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 import json
+import re
+import time
+from typing import Any
 
+from aiohttp import ClientSession, web
 import orjson
 import pytest
 
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.json_rpc import JsonRpcAioHttpClient, JsonRpcMethod
+from hahomematic.const import PATH_JSON_RPC
+from hahomematic.support import find_free_port
+
+from tests import const
+
 SUCCESS = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 FAILURE = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n,\r\n,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 
@@ -19,3 +32,389 @@ def test_convert_to_json_fails() -> None:
     """Test if convert to json is successful."""
     with pytest.raises(json.JSONDecodeError):
         orjson.loads(FAILURE)
+
+
+_RESULTS: dict[str, Any] = {
+    JsonRpcMethod.DEVICE_LIST_ALL_DETAIL: [
+        {
+            "id": "1",
+            "address": "VCU0000001",
+            "name": "Device",
+            "interface": "BidCos-RF",
+            "channels": [{"id": "2", "address": "VCU0000001:1", "name": "Channel"}],
+        }
+    ],
+    JsonRpcMethod.PROGRAM_GET_ALL: [
+        {
+            "id": "10",
+            "name": "Program",
+            "isActive": True,
+            "isInternal": False,
+            "lastExecuteTime": "",
+        }
+    ],
+    JsonRpcMethod.REGA_RUN_SCRIPT: orjson.dumps([{"id": "20", "hasExtMarker": True}]).decode(),
+    JsonRpcMethod.ROOM_GET_ALL: [{"id": "30", "name": "Kitchen", "channelIds": ["2"]}],
+    JsonRpcMethod.SESSION_LOGIN: "session",
+    JsonRpcMethod.SUBSECTION_GET_ALL: [{"id": "40", "name": "Light", "channelIds": ["2"]}],
+    JsonRpcMethod.SYSTEM_LIST_METHODS: [{"name": method} for method in JsonRpcMethod],
+    JsonRpcMethod.SYSVAR_GET_ALL: [
+        {
+            "id": "20",
+            "name": "Sysvar",
+            "isInternal": False,
+            "type": "BOOL",
+            "value": "true",
+            "unit": "",
+        }
+    ],
+}
+
+
+async def _start_json_rpc_server(
+    handler: Callable[[web.Request], Awaitable[web.Response]],
+) -> tuple[web.AppRunner, str]:
+    """Start a JSON-RPC server and return the runner and the device url."""
+    app = web.Application()
+    app.router.add_post(PATH_JSON_RPC, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = find_free_port()
+    await web.TCPSite(runner, const.CCU_HOST, port).start()
+    return runner, f"http://{const.CCU_HOST}:{port}"
+
+
+def _get_json_rpc_client(device_url: str, client_session: ClientSession) -> JsonRpcAioHttpClient:
+    """Return a JSON-RPC client for the device url."""
+    return JsonRpcAioHttpClient(
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        device_url=device_url,
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_startup_metadata() -> None:
+    """Test that the startup metadata is fetched concurrently within one session."""
+    delay = 0.1
+    calls: list[str] = []
+    running = 0
+    max_running = 0
+
+    async def _handle(request: web.Request) -> web.Response:
+        nonlocal running, max_running
+        method = (await request.json())["method"]
+        calls.append(method)
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return web.json_response({"result": _RESULTS.get(method), "error": None})
+
+    runner, device_url = await _start_json_rpc_server(handler=_handle)
+    client_session = ClientSession()
+    try:
+        json_rpc_client = _get_json_rpc_client(
+            device_url=device_url, client_session=client_session
+        )
+        start = time.monotonic()
+        metadata = await json_rpc_client.fetch_startup_metadata(
+            include_internal_sysvars=True, include_internal_programs=False
+        )
+        duration = time.monotonic() - start
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
+
+    assert metadata.device_details[0]["address"] == "VCU0000001"
+    assert metadata.channel_ids_room["2"] == {"Kitchen"}
+    assert metadata.channel_ids_function["2"] == {"Light"}
+    assert metadata.system_variables[0].name == "Sysvar"
+    assert metadata.system_variables[0].extended_sysvar is True
+    assert metadata.programs[0].pid == "10"
+
+    # one login and method check, then all requests run side by side,
+    # only the ext markers follow the system variables
+    assert calls[:2] == [JsonRpcMethod.SESSION_LOGIN, JsonRpcMethod.SYSTEM_LIST_METHODS]
+    assert calls.count(JsonRpcMethod.SESSION_LOGIN) == 1
+    assert len(calls) == 8
+    assert calls[-1] == JsonRpcMethod.REGA_RUN_SCRIPT
+    assert max_running == 5
+    assert duration < delay * 5
+
+
+@pytest.mark.parametrize(
+    ("login_result", "methods"),
+    [
+        (None, _RESULTS[JsonRpcMethod.SYSTEM_LIST_METHODS]),
+        ("session", [{"name": JsonRpcMethod.SESSION_LOGIN}]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fetch_startup_metadata_failed(
+    login_result: str | None, methods: list[dict[str, str]]
+) -> None:
+    """Test that no startup metadata is returned, if the login or the method check fails."""
+    calls: list[str] = []
+
+    async def _handle(request: web.Request) -> web.Response:
+        method = (await request.json())["method"]
+        calls.append(method)
+        results = {
+            **_RESULTS,
+            JsonRpcMethod.SESSION_LOGIN: login_result,
+            JsonRpcMethod.SYSTEM_LIST_METHODS: methods,
+        }
+        return web.json_response({"result": results.get(method), "error": None})
+
+    runner, device_url = await _start_json_rpc_server(handler=_handle)
+    client_session = ClientSession()
+    try:
+        json_rpc_client = _get_json_rpc_client(
+            device_url=device_url, client_session=client_session
+        )
+        assert (
+            await json_rpc_client.fetch_startup_metadata(
+                include_internal_sysvars=True, include_internal_programs=False
+            )
+            is None
+        )
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
+
+    assert JsonRpcMethod.DEVICE_LIST_ALL_DETAIL not in calls
+
+
+@pytest.mark.asyncio
+async def test_get_system_variable_changes() -> None:
+    """Test that only the changed system variables are polled."""
+    now = 1000
+    # {id, (name, value, timestamp)}
+    sysvars: dict[str, tuple[str, str, int]] = {
+        "1": ("Sysvar%20A", "1.500000", 900),
+        "2": ("Sysvar B", "true", 900),
+    }
+    ext_ids = {"2"}
+    scripts: list[str] = []
+    fail = False
+
+    def _get_variables(since: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": sid,
+                "name": name,
+                "type": "NUMBER" if "." in value else "LOGIC",
+                "isInternal": False,
+                "value": value,
+                "unit": "%25",
+            }
+            for sid, (name, value, timestamp) in sysvars.items()
+            if timestamp >= since
+        ]
+
+    async def _handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        method = payload["method"]
+        if method == JsonRpcMethod.SYSVAR_GET_ALL:
+            return web.json_response({"result": _get_variables(since=0), "error": None})
+        if method != JsonRpcMethod.REGA_RUN_SCRIPT:
+            return web.json_response({"result": _RESULTS.get(method), "error": None})
+        script = payload["params"]["script"]
+        if not (match := re.search(r"integer iSince = (\d+);", script)):
+            scripts.append("ext_markers")
+            markers = [{"id": sid, "hasExtMarker": sid in ext_ids} for sid in sysvars]
+            return web.json_response({"result": orjson.dumps(markers).decode(), "error": None})
+        scripts.append(f"changes:{match.group(1)}")
+        if fail:
+            return web.Response(status=500)
+        since = int(match.group(1))
+        result = {
+            "timestamp": now,
+            "ids": list(sysvars),
+            "changed": _get_variables(since=since),
+        }
+        return web.json_response({"result": orjson.dumps(result).decode(), "error": None})
+
+    runner, device_url = await _start_json_rpc_server(handler=_handle)
+    client_session = ClientSession()
+    try:
+        json_rpc_client = _get_json_rpc_client(
+            device_url=device_url, client_session=client_session
+        )
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is True
+        assert [(sv.name, sv.value, sv.unit) for sv in changes.changed] == [
+            ("Sysvar A", 1.5, "%"),
+            ("Sysvar B", True, "%"),
+        ]
+        assert [sv.extended_sysvar for sv in changes.changed] == [False, True]
+        assert scripts == ["changes:0", "ext_markers"]
+
+        # nothing changed
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is False
+        assert changes.changed == ()
+        assert changes.deleted == ()
+
+        # a value changed and a variable has been deleted
+        sysvars["1"] = ("Sysvar%20A", "2.500000", 1000)
+        del sysvars["2"]
+        now = 1100
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is False
+        assert [(sv.name, sv.value) for sv in changes.changed] == [("Sysvar A", 2.5)]
+        assert changes.deleted == ("Sysvar B",)
+        assert scripts == [
+            "changes:0",
+            "ext_markers",
+            "changes:1000",
+            "changes:1000",
+            "ext_markers",
+        ]
+
+        # a new variable with an older timestamp requires a complete poll
+        sysvars["3"] = ("Sysvar C", "false", 500)
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is True
+        assert [sv.name for sv in changes.changed] == ["Sysvar A", "Sysvar C"]
+        assert scripts[-3:] == ["changes:1100", "changes:0", "ext_markers"]
+
+        # the ext markers are only scanned again, if the variables changed or on a reset
+        ext_ids.add("1")
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.changed == ()
+        assert scripts[-1] == "changes:1100"
+        variables = await json_rpc_client.get_all_system_variables(include_internal=True)
+        assert [sv.extended_sysvar for sv in variables] == [False, False]
+        assert scripts[-1] == "changes:1100"
+        json_rpc_client.reset_system_variable_changes()
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is True
+        assert [(sv.name, sv.extended_sysvar) for sv in changes.changed] == [
+            ("Sysvar A", True),
+            ("Sysvar C", False),
+        ]
+        assert scripts[-2:] == ["changes:0", "ext_markers"]
+
+        # a failed poll returns None, so the hub falls back to all system variables
+        fail = True
+        assert await json_rpc_client.get_system_variable_changes(include_internal=True) is None
+        fail = False
+        changes = await json_rpc_client.get_system_variable_changes(include_internal=True)
+        assert changes
+        assert changes.complete is True
+        assert scripts[-2:] == ["changes:0", "ext_markers"]
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_get_all_device_data() -> None:
+    """Test that the device data is fetched for an interface or for some addresses."""
+    # {address, {key, value}}
+    device_data: dict[str, dict[str, Any]] = {
+        "000A570998B3FB": {
+            "HmIP-RF.000A570998B3FB%3A0.UNREACH": False,
+            "HmIP-RF.000A570998B3FB%3A1.STATE": True,
+        },
+        "000A5A4991BDDC": {
+            "HmIP-RF.000A5A4991BDDC%3A0.UNREACH": True,
+            "HmIP-RF.000A5A4991BDDC%3A1.STATE": False,
+        },
+    }
+    requested: list[tuple[str, str]] = []
+
+    async def _handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        method = payload["method"]
+        if method != JsonRpcMethod.REGA_RUN_SCRIPT:
+            return web.json_response({"result": _RESULTS.get(method), "error": None})
+        script = payload["params"]["script"]
+        interface = re.search(r'^string sUse_Interface = "(.*)";$', script, re.M)
+        addresses = re.search(r'^string sUse_Addresses = ",(.*),";$', script, re.M)
+        assert interface and addresses
+        requested.append((interface.group(1), addresses.group(1)))
+        result: dict[str, Any] = {}
+        for device_address, data in device_data.items():
+            for key, value in data.items():
+                channel_address = key.split(".")[1].replace("%3A", ":")
+                if addresses.group(1) in ("", device_address, channel_address):
+                    result[key] = value
+        return web.json_response({"result": orjson.dumps(result).decode(), "error": None})
+
+    runner, device_url = await _start_json_rpc_server(handler=_handle)
+    client_session = ClientSession()
+    try:
+        json_rpc_client = _get_json_rpc_client(
+            device_url=device_url, client_session=client_session
+        )
+        result = await json_rpc_client.get_all_device_data(interface="HmIP-RF")
+        assert len(result) == 4
+        result = await json_rpc_client.get_all_device_data(
+            interface="HmIP-RF", addresses=("000A5A4991BDDC",)
+        )
+        assert result == device_data["000A5A4991BDDC"]
+        result = await json_rpc_client.get_all_device_data(
+            interface="HmIP-RF", addresses=("000A570998B3FB:1",)
+        )
+        assert result == {"HmIP-RF.000A570998B3FB%3A1.STATE": True}
+        assert requested == [
+            ("HmIP-RF", ""),
+            ("HmIP-RF", "000A5A4991BDDC"),
+            ("HmIP-RF", "000A570998B3FB:1"),
+        ]
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_session_access_denied() -> None:
+    """Test that concurrent callers share one login after the session has been rejected."""
+    sessions = iter(("session1", "session2", "session3"))
+    calls: list[str] = []
+
+    async def _handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        method = payload["method"]
+        calls.append(method)
+        if method == JsonRpcMethod.SESSION_LOGIN:
+            return web.json_response({"result": next(sessions), "error": None})
+        if payload["params"].get("_session_id_") == "session1" and calls.count(method) > 1:
+            await asyncio.sleep(0.05)
+            return web.json_response({"result": None, "error": {"message": "access denied"}})
+        return web.json_response({"result": _RESULTS.get(method), "error": None})
+
+    runner, device_url = await _start_json_rpc_server(handler=_handle)
+    client_session = ClientSession()
+    try:
+        json_rpc_client = _get_json_rpc_client(
+            device_url=device_url, client_session=client_session
+        )
+        assert await json_rpc_client.get_all_channel_ids_room()
+        assert json_rpc_client._session_keeper.session_id == "session1"
+        results = await asyncio.gather(
+            *(json_rpc_client.get_all_channel_ids_room() for _ in range(5))
+        )
+        assert all(results)
+        assert json_rpc_client._session_keeper.session_id == "session2"
+        assert calls.count(JsonRpcMethod.SESSION_LOGIN) == 2
+        assert JsonRpcMethod.SESSION_LOGOUT not in calls
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
@@ -0,0 +1,105 @@
+"""Test the session keeper of the JSON-RPC client."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hahomematic.client.json_session import JsonSessionKeeper
+from hahomematic.exceptions import AuthFailure, NoConnection
+
+# pylint: disable=protected-access
+
+
+class _Backend:
+    """Count the logins and renewals of a session keeper."""
+
+    def __init__(self, renew_result: bool = True) -> None:
+        """Init the backend."""
+        self.logins = 0
+        self.renewals = 0
+        self.renew_result = renew_result
+
+    async def login(self) -> str | None:
+        """Return a new session."""
+        self.logins += 1
+        await asyncio.sleep(0.01)
+        return f"session{self.logins}"
+
+    async def renew(self, session_id: str) -> bool:
+        """Renew a session."""
+        self.renewals += 1
+        return self.renew_result
+
+
+@pytest.mark.asyncio
+async def test_json_session_keeper_shared_login() -> None:
+    """Test that concurrent callers share one login."""
+    backend = _Backend()
+    session_keeper = JsonSessionKeeper(
+        name="test", login=backend.login, renew=backend.renew, renew_interval=60.0
+    )
+    try:
+        assert session_keeper.session_id is None
+        session_ids = await asyncio.gather(*(session_keeper.get_session_id() for _ in range(10)))
+        assert set(session_ids) == {"session1"}
+        assert backend.logins == 1
+        assert await session_keeper.get_session_id() == "session1"
+        assert backend.logins == 1
+
+        # all callers with the rejected session share one login
+        session_ids = await asyncio.gather(
+            *(session_keeper.relogin(failed_session_id="session1") for _ in range(10))
+        )
+        assert set(session_ids) == {"session2"}
+        assert backend.logins == 2
+
+        # the session has already been replaced
+        assert await session_keeper.relogin(failed_session_id="session1") == "session2"
+        assert backend.logins == 2
+    finally:
+        session_keeper.clear()
+
+
+@pytest.mark.asyncio
+async def test_json_session_keeper_renew() -> None:
+    """Test that the session is renewed in the background."""
+    backend = _Backend()
+    session_keeper = JsonSessionKeeper(
+        name="test", login=backend.login, renew=backend.renew, renew_interval=0.05
+    )
+    assert await session_keeper.get_session_id() == "session1"
+    await asyncio.sleep(0.18)
+    assert backend.renewals >= 2
+    assert backend.logins == 1
+
+    # a failed renew leads to a new login
+    backend.renew_result = False
+    await asyncio.sleep(0.1)
+    assert backend.logins >= 2
+    assert session_keeper.session_id == f"session{backend.logins}"
+
+    # a rejected session leads to a new login
+    async def _renew_rejected(session_id: str) -> bool:
+        raise AuthFailure("test")
+
+    session_keeper._renew = _renew_rejected  # type: ignore[misc]
+    logins = backend.logins
+    await asyncio.sleep(0.1)
+    assert backend.logins > logins
+    assert session_keeper.session_id == f"session{backend.logins}"
+
+    # connection errors keep the session
+    async def _renew(session_id: str) -> bool:
+        raise NoConnection("test")
+
+    session_keeper._renew = _renew  # type: ignore[misc]
+    session_id = session_keeper.session_id
+    await asyncio.sleep(0.1)
+    assert session_keeper.session_id == session_id
+
+    renew_task = session_keeper._renew_task
+    session_keeper.clear()
+    assert session_keeper.session_id is None
+    await asyncio.sleep(0)
+    assert renew_task is not None and renew_task.cancelled()
@@ -0,0 +1,272 @@
+"""Test the latency tracker and the adaptive timeouts."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from aiohttp import ClientSession, web
+import pydevccu
+import pytest
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.json_rpc import JsonRpcAioHttpClient, JsonRpcMethod
+from hahomematic.client.latency import LatencyTracker
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, XmlRpcProxy
+from hahomematic.const import (
+    PATH_JSON_RPC,
+    REGA_SCRIPT_GET_SERIAL,
+    REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER,
+)
+from hahomematic.exceptions import NoConnection
+from hahomematic.support import build_xml_rpc_uri, find_free_port
+
+from tests import const
+
+# pylint: disable=protected-access
+
+
+def _observe(latency_tracker: LatencyTracker, method: str, latencies: list[float]) -> None:
+    """Add latencies of a method."""
+    for latency in latencies:
+        latency_tracker._get_latencies(method=method).observe(latency)
+
+
+def test_latency_tracker_timeouts() -> None:
+    """Test that the timeouts follow the p99 latency within the bounds."""
+    latency_tracker = LatencyTracker(name="test", adaptive=True, min_timeout=1.0, max_timeout=60.0)
+    assert latency_tracker.get_timeout(method="getValue") == 60.0
+
+    # too few latencies
+    _observe(latency_tracker, "getValue", [0.1] * 9)
+    assert latency_tracker.get_timeout(method="getValue") == 60.0
+    _observe(latency_tracker, "getValue", [0.1] * 90 + [0.5])
+    assert latency_tracker.get_timeout(method="getValue") == 1.0
+    _observe(latency_tracker, "getValue", [2.0] * 5)
+    assert latency_tracker.get_timeout(method="getValue") == pytest.approx(6.0)
+    _observe(latency_tracker, "getValue", [30.0] * 5)
+    assert latency_tracker.get_timeout(method="getValue") == 60.0
+
+    statistics = latency_tracker.statistics["getValue"]
+    assert statistics.count == 110
+    assert statistics.p50 == 0.1
+    assert statistics.p99 == 30.0
+    assert statistics.timeout == 60.0
+    assert statistics.timeouts == 0
+
+    # the timeouts are not adaptive
+    latency_tracker = LatencyTracker(
+        name="test", adaptive=False, min_timeout=1.0, max_timeout=60.0
+    )
+    _observe(latency_tracker, "getValue", [0.1] * 100)
+    assert latency_tracker.get_timeout(method="getValue") == 60.0
+
+
+def test_latency_tracker_measure() -> None:
+    """Test that latencies and timeouts are measured."""
+    latency_tracker = LatencyTracker(name="test", adaptive=True, min_timeout=1.0, max_timeout=60.0)
+    with latency_tracker.measure(method="ping", timeout=60.0):
+        time.sleep(0.01)
+    with pytest.raises(TimeoutError), latency_tracker.measure(method="ping", timeout=5.0):
+        raise TimeoutError
+    # other errors are not measured
+    with pytest.raises(ValueError), latency_tracker.measure(method="ping", timeout=60.0):
+        raise ValueError
+    statistics = latency_tracker.statistics["ping"]
+    assert statistics.count == 2
+    assert statistics.timeouts == 1
+    assert statistics.p99 == 5.0
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_proxy(pydev_ccu_mini: pydevccu.Server) -> None:
+    """Test that the proxies measure the latencies of the methods."""
+    connection_state = CentralConnectionState()
+    uri = build_xml_rpc_uri(host=const.CCU_HOST, port=const.CCU_PORT, path=None)
+    for proxy_class in (XmlRpcProxy, AsyncXmlRpcProxy):
+        latency_tracker = LatencyTracker(
+            name="test", adaptive=True, min_timeout=1.0, max_timeout=60.0
+        )
+        proxy = (
+            XmlRpcProxy(
+                max_workers=1,
+                interface_id=const.INTERFACE_ID,
+                connection_state=connection_state,
+                uri=uri,
+                headers=[],
+                latency_tracker=latency_tracker,
+            )
+            if proxy_class is XmlRpcProxy
+            else AsyncXmlRpcProxy(
+                interface_id=const.INTERFACE_ID,
+                connection_state=connection_state,
+                uri=uri,
+                headers=[],
+                latency_tracker=latency_tracker,
+            )
+        )
+        try:
+            for _ in range(20):
+                await proxy.getVersion()
+        finally:
+            proxy.stop()
+        statistics = latency_tracker.statistics["getVersion"]
+        assert statistics.count == 20
+        assert 0 < statistics.p50 <= statistics.p99 < 1.0
+        assert statistics.timeout == 1.0
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_hung_call() -> None:
+    """Test that a hung call times out after the adaptive timeout."""
+
+    async def _accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # The backend never answers.
+        await reader.read(1024)
+
+    port = find_free_port()
+    server = await asyncio.start_server(_accept, const.CCU_HOST, port)
+    uri = build_xml_rpc_uri(host=const.CCU_HOST, port=port, path=None)
+    try:
+        for proxy_class in (XmlRpcProxy, AsyncXmlRpcProxy):
+            latency_tracker = LatencyTracker(
+                name="test", adaptive=True, min_timeout=0.2, max_timeout=60.0
+            )
+            _observe(latency_tracker, "getValue", [0.01] * 20)
+            proxy = (
+                XmlRpcProxy(
+                    max_workers=1,
+                    interface_id=const.INTERFACE_ID,
+                    connection_state=CentralConnectionState(),
+                    uri=uri,
+                    headers=[],
+                    latency_tracker=latency_tracker,
+                )
+                if proxy_class is XmlRpcProxy
+                else AsyncXmlRpcProxy(
+                    interface_id=const.INTERFACE_ID,
+                    connection_state=CentralConnectionState(),
+                    uri=uri,
+                    headers=[],
+                    latency_tracker=latency_tracker,
+                )
+            )
+            start = time.monotonic()
+            try:
+                with pytest.raises(NoConnection):
+                    await proxy.getValue("VCU0000001:1", "STATE")
+            finally:
+                proxy.stop()
+            assert time.monotonic() - start < 2.0
+            assert latency_tracker.statistics["getValue"].timeouts == 1
+    finally:
+        server.close()
+        await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_json_rpc_body() -> None:
+    """Test that the JSON-RPC latency includes the body and a stalled body times out."""
+    stall = False
+
+    async def _handle(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        if stall:
+            await response.write(b'{"result": ')
+            await asyncio.sleep(2.0)
+        else:
+            await asyncio.sleep(0.05)
+        await response.write(b'{"result": true, "error": null}')
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post(PATH_JSON_RPC, _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = find_free_port()
+    await web.TCPSite(runner, const.CCU_HOST, port).start()
+    client_session = ClientSession()
+    latency_tracker = LatencyTracker(name="test", adaptive=True, min_timeout=0.2, max_timeout=60.0)
+    json_rpc_client = JsonRpcAioHttpClient(
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        device_url=f"http://{const.CCU_HOST}:{port}",
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+        latency_tracker=latency_tracker,
+    )
+    method = JsonRpcMethod.CCU_GET_AUTH_ENABLED
+    try:
+        response = await json_rpc_client._do_post(session_id=False, method=method)
+        assert response["result"] is True
+        assert latency_tracker.statistics[method].p99 >= 0.05
+
+        _observe(latency_tracker, method, [0.01] * 20)
+        stall = True
+        start = time.monotonic()
+        with pytest.raises(NoConnection):
+            await json_rpc_client._do_post(session_id=False, method=method)
+        assert time.monotonic() - start < 1.5
+        assert latency_tracker.statistics[method].timeouts == 1
+    finally:
+        await client_session.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_json_rpc_scripts() -> None:
+    """Test that each ReGa script has its own latencies and timeout."""
+    slow_delay = 0.1
+
+    async def _handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        method = payload["method"]
+        result: Any = True
+        if method == JsonRpcMethod.SESSION_LOGIN:
+            result = "session"
+        elif method == JsonRpcMethod.SYSTEM_LIST_METHODS:
+            result = [{"name": method} for method in JsonRpcMethod]
+        elif method == JsonRpcMethod.REGA_RUN_SCRIPT:
+            if "ext_marker" in payload["params"]["script"]:
+                await asyncio.sleep(slow_delay)
+            result = "[]"
+        return web.json_response({"result": result, "error": None})
+
+    app = web.Application()
+    app.router.add_post(PATH_JSON_RPC, _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = find_free_port()
+    await web.TCPSite(runner, const.CCU_HOST, port).start()
+    client_session = ClientSession()
+    latency_tracker = LatencyTracker(name="test", adaptive=True, min_timeout=0.2, max_timeout=60.0)
+    json_rpc_client = JsonRpcAioHttpClient(
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        device_url=f"http://{const.CCU_HOST}:{port}",
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+        latency_tracker=latency_tracker,
+    )
+    fast_method = f"{JsonRpcMethod.REGA_RUN_SCRIPT}:{REGA_SCRIPT_GET_SERIAL}"
+    slow_method = f"{JsonRpcMethod.REGA_RUN_SCRIPT}:{REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER}"
+    try:
+        for _ in range(10):
+            await json_rpc_client._post_script(script_name=REGA_SCRIPT_GET_SERIAL)
+            await json_rpc_client._post_script(script_name=REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER)
+
+        statistics = latency_tracker.statistics
+        assert JsonRpcMethod.REGA_RUN_SCRIPT not in statistics
+        assert statistics[fast_method].count == 10
+        assert statistics[slow_method].count == 10
+        assert statistics[fast_method].p99 < slow_delay <= statistics[slow_method].p99
+        # the fast script keeps the min timeout, the slow script does not share it
+        assert latency_tracker.get_timeout(method=fast_method) == 0.2
+        assert latency_tracker.get_timeout(method=slow_method) >= slow_delay * 3
+    finally:
+        json_rpc_client.clear_session()
+        await client_session.close()
+        await runner.cleanup()
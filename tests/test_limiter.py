@@ -0,0 +1,149 @@
+"""Test the concurrency limiter."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+import xmlrpc.client
+
+import pydevccu
+import pytest
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.limiter import ConcurrencyLimiter
+from hahomematic.client.xml_rpc import XmlRpcProxy
+from hahomematic.exceptions import ClientException
+from hahomematic.support import build_xml_rpc_uri
+
+from tests import const
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter() -> None:
+    """Test that the limiter never exceeds the limit."""
+    limiter = ConcurrencyLimiter(name="test", max_limit=3)
+    assert limiter.limit == 3
+    max_in_flight = 0
+
+    async def _request() -> None:
+        nonlocal max_in_flight
+        async with limiter.limit_request():
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(_request() for _ in range(10)))
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+
+    # a failed request does not change a fixed limit
+    with pytest.raises(ValueError):
+        async with limiter.limit_request():
+            raise ValueError
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter() -> None:
+    """Test the additive increase and multiplicative decrease of the limit."""
+    limiter = ConcurrencyLimiter(
+        name="test", max_limit=8, adaptive=True, ignored_exceptions=(xmlrpc.client.Fault,)
+    )
+    assert limiter.adaptive is True
+    assert limiter.limit == 1
+
+    monotonic = 0.0
+
+    def _monotonic() -> float:
+        return monotonic
+
+    async def _request(latency: float) -> None:
+        nonlocal monotonic
+        async with limiter.limit_request():
+            monotonic += latency
+
+    with patch("hahomematic.client.limiter.time.monotonic", side_effect=_monotonic):
+        for _ in range(20):
+            await _request(latency=0.1)
+        assert limiter.limit == 6
+        for _ in range(100):
+            await _request(latency=0.1)
+        assert limiter.limit == limiter.max_limit == 8
+
+        # backend errors, that are answers, keep the limit
+        with pytest.raises(xmlrpc.client.Fault):
+            async with limiter.limit_request():
+                monotonic += 0.1
+                raise xmlrpc.client.Fault(1, "unknown")
+        assert limiter.limit == 8
+
+        # errors halve the limit
+        with pytest.raises(OSError):
+            async with limiter.limit_request():
+                monotonic += 0.1
+                raise OSError
+        assert limiter.limit == 4
+
+        # a high latency halves the limit
+        await _request(latency=1.0)
+        assert limiter.limit == 2
+
+        # never below 1
+        for _ in range(3):
+            with pytest.raises(OSError):
+                async with limiter.limit_request():
+                    monotonic += 0.1
+                    raise OSError
+        assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_mixed_methods() -> None:
+    """Test that slower methods are compared with their own baseline."""
+    limiter = ConcurrencyLimiter(name="test", max_limit=8, adaptive=True)
+    monotonic = 0.0
+
+    def _monotonic() -> float:
+        return monotonic
+
+    async def _request(method: str, latency: float) -> None:
+        nonlocal monotonic
+        async with limiter.limit_request(method=method):
+            monotonic += latency
+
+    with patch("hahomematic.client.limiter.time.monotonic", side_effect=_monotonic):
+        for _ in range(100):
+            await _request(method="getValue", latency=0.01)
+            await _request(method="getParamset", latency=0.5)
+        assert limiter.limit == limiter.max_limit
+
+        # a slow getParamset still halves the limit
+        await _request(method="getParamset", latency=2.0)
+        assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_concurrency_limiter(pydev_ccu_mini: pydevccu.Server) -> None:
+    """Test that the XmlRpcProxy runs requests within the limit."""
+    limiter = ConcurrencyLimiter(name=const.INTERFACE_ID, max_limit=3, adaptive=True)
+    proxy = XmlRpcProxy(
+        max_workers=limiter.max_limit,
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        uri=build_xml_rpc_uri(host=const.CCU_HOST, port=const.CCU_PORT, path=None),
+        headers=[],
+        concurrency_limiter=limiter,
+    )
+    try:
+        await proxy.do_init()
+        versions = await asyncio.gather(*(proxy.getVersion() for _ in range(20)))
+        assert len(set(versions)) == 1
+        assert limiter.in_flight == 0
+        assert 1 <= limiter.limit <= 3
+
+        with pytest.raises(ClientException):
+            await proxy.getValue("unknown:1", "STATE")
+        assert limiter.in_flight == 0
+    finally:
+        proxy.stop()
@@ -0,0 +1,147 @@
+"""Test the write scheduler."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from hahomematic.client.write_scheduler import WriteScheduler
+from hahomematic.const import ParamsetKey
+
+# pylint: disable=protected-access
+
+_WINDOW = 0.02
+
+
+def _get_client(delay: float = 0.0) -> MagicMock:
+    """Return a client, that records the writes."""
+    client = MagicMock()
+    client.in_flight = 0
+    client.max_in_flight = 0
+
+    async def _write(**kwargs) -> bool:
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        await asyncio.sleep(delay)
+        client.in_flight -= 1
+        return True
+
+    client._set_value = AsyncMock(side_effect=_write)
+    client._put_paramset = AsyncMock(side_effect=_write)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_write_scheduler_merge() -> None:
+    """Test that writes to a channel within the window are merged."""
+    client = _get_client()
+    write_scheduler = WriteScheduler(client=client, window=_WINDOW)
+    assert write_scheduler.window == _WINDOW
+
+    assert await write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 1.0})
+    assert client._set_value.call_args_list == [
+        call(channel_address="VCU0000001:1", parameter="LEVEL", value=1.0)
+    ]
+    assert client._put_paramset.call_count == 0
+
+    results = await asyncio.gather(
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 0.5}),
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"RAMP_TIME": 2}),
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 0.7}),
+    )
+    assert results == [True, True, True]
+    assert client._set_value.call_count == 1
+    assert client._put_paramset.call_args_list == [
+        call(
+            address="VCU0000001:1",
+            paramset_key=ParamsetKey.VALUES,
+            value={"LEVEL": 0.7, "RAMP_TIME": 2},
+        )
+    ]
+
+    # without put_paramset the parameters are written one by one
+    await asyncio.gather(
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 0.1}),
+        write_scheduler.write(
+            channel_address="VCU0000001:1", paramset={"RAMP_TIME": 1}, use_put_paramset=False
+        ),
+    )
+    assert client._set_value.call_args_list[1:] == [
+        call(channel_address="VCU0000001:1", parameter="LEVEL", value=0.1),
+        call(channel_address="VCU0000001:1", parameter="RAMP_TIME", value=1),
+    ]
+    assert client._put_paramset.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_write_scheduler_parallel() -> None:
+    """Test that channels are written in parallel, and a channel in order."""
+    client = _get_client(delay=0.05)
+    write_scheduler = WriteScheduler(client=client, window=_WINDOW)
+
+    results = await asyncio.gather(
+        *(
+            write_scheduler.write(
+                channel_address=f"VCU0000001:{channel_no}", paramset={"STATE": 1}
+            )
+            for channel_no in range(10)
+        )
+    )
+    assert all(results)
+    assert client._set_value.call_count == 10
+    assert client.max_in_flight == 10
+
+    client.max_in_flight = 0
+
+    async def _write_later() -> bool:
+        # The first write is in flight, when the window of this write has passed.
+        await asyncio.sleep(_WINDOW * 1.5)
+        return await write_scheduler.write(channel_address="VCU0000001:1", paramset={"STATE": 3})
+
+    await asyncio.gather(
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"STATE": 2}),
+        _write_later(),
+    )
+    assert client.max_in_flight == 1
+    assert client._set_value.call_args_list[-2:] == [
+        call(channel_address="VCU0000001:1", parameter="STATE", value=2),
+        call(channel_address="VCU0000001:1", parameter="STATE", value=3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_scheduler_direct_and_cancel() -> None:
+    """Test that direct writes don't overtake pending writes and cancels don't hang."""
+    client = _get_client()
+    write_scheduler = WriteScheduler(client=client, window=1.0)
+
+    async def _send_direct() -> bool:
+        await client._put_paramset(
+            address="VCU0000001:1", paramset_key=ParamsetKey.MASTER, value={"MIN": 1}
+        )
+        return True
+
+    pending_write = asyncio.create_task(
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 1.0})
+    )
+    await asyncio.sleep(0)
+    # the pending write is sent first, without waiting for the window
+    assert await write_scheduler.write_direct(channel_address="VCU0000001:1", send=_send_direct)
+    assert await asyncio.wait_for(pending_write, timeout=0.5)
+    assert client._set_value.call_args_list == [
+        call(channel_address="VCU0000001:1", parameter="LEVEL", value=1.0)
+    ]
+    assert client._put_paramset.call_count == 1
+
+    # the waiters are released, when the window task is cancelled
+    pending_write = asyncio.create_task(
+        write_scheduler.write(channel_address="VCU0000001:1", paramset={"LEVEL": 0.5})
+    )
+    await asyncio.sleep(0)
+    for task in tuple(write_scheduler._tasks):
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(pending_write, timeout=0.5)
+    assert client._set_value.call_count == 1
+    assert write_scheduler._pending == {}
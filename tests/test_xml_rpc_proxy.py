@@ -0,0 +1,183 @@
+"""Test the HaHomematic xml rpc proxies."""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+import xmlrpc.client
+
+import pydevccu
+import pytest
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client import xml_rpc_codec
+from hahomematic.client.xml_rpc import AsyncXmlRpcProxy, XmlRpcProxy
+from hahomematic.const import CommandPriority, ParamsetKey
+from hahomematic.exceptions import ClientException, NoConnection, UnsupportedException
+from hahomematic.support import build_xml_rpc_uri, find_free_port
+
+from tests import const, helper
+
+# pylint: disable=protected-access
+
+
+def _get_proxies(
+    port: int = const.CCU_PORT,
+) -> tuple[XmlRpcProxy, AsyncXmlRpcProxy]:
+    """Return a XmlRpcProxy and an AsyncXmlRpcProxy for the same uri."""
+    connection_state = CentralConnectionState()
+    uri = build_xml_rpc_uri(host=const.CCU_HOST, port=port, path=None)
+    return (
+        XmlRpcProxy(
+            max_workers=1,
+            interface_id=const.INTERFACE_ID,
+            connection_state=connection_state,
+            uri=uri,
+            headers=[],
+        ),
+        AsyncXmlRpcProxy(
+            interface_id=const.INTERFACE_ID,
+            connection_state=connection_state,
+            uri=uri,
+            headers=[],
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_xml_rpc_proxy(pydev_ccu_mini: pydevccu.Server) -> None:
+    """Test that the async proxy returns the same results as the XmlRpcProxy."""
+    proxy, async_proxy = _get_proxies()
+    try:
+        await proxy.do_init()
+        await async_proxy.do_init()
+        assert async_proxy.supported_methods == proxy.supported_methods
+        assert "ping" in async_proxy.supported_methods
+        assert await async_proxy.getVersion() == await proxy.getVersion()
+        assert await async_proxy.listDevices() == await proxy.listDevices()
+        device_address = (await async_proxy.listDevices())[0]["ADDRESS"]
+        assert await async_proxy.getParamsetDescription(
+            device_address, "MASTER"
+        ) == await proxy.getParamsetDescription(device_address, "MASTER")
+
+        with pytest.raises(UnsupportedException):
+            await async_proxy.unknownMethod()
+        with pytest.raises(ClientException):
+            await async_proxy.getValue("unknown:1", "STATE")
+    finally:
+        proxy.stop()
+        async_proxy.stop()
+        assert len(async_proxy._tasks) == 1
+        await next(iter(async_proxy._tasks))
+    assert async_proxy._client_session.closed is True
+
+
+@pytest.mark.asyncio
+async def test_async_xml_rpc_proxy_no_connection() -> None:
+    """Test the error mapping of the async proxy without backend."""
+    _, async_proxy = _get_proxies(port=find_free_port())
+    try:
+        with pytest.raises(NoConnection):
+            await async_proxy.do_init()
+        # only commands, that are valid without connection, are sent
+        with pytest.raises(NoConnection):
+            await async_proxy.listDevices()
+        with pytest.raises(NoConnection):
+            await async_proxy.ping(const.INTERFACE_ID)
+    finally:
+        await async_proxy._client_session.close()
+
+
+@pytest.mark.parametrize(
+    "resource",
+    ["device_descriptions", "paramset_descriptions"],
+)
+def test_xml_rpc_codec_loads(resource: str) -> None:
+    """Test that the codec decodes recorded responses like xmlrpc.client."""
+    payload, data = helper.load_xml_rpc_response(resource=resource, count=50)
+    assert xml_rpc_codec.loads(data) == payload
+    assert xml_rpc_codec._loads_expat(data) == payload
+
+
+def test_xml_rpc_codec_loads_subset() -> None:
+    """Test the values of the subset and the fallback to expat."""
+    values = ({}, [], [[], {"A": {}}], "ä&<>", "", " ", 1.5, True, False, -3)
+    data = xmlrpc.client.dumps((values,), methodresponse=True, encoding="ISO-8859-1")
+    assert xml_rpc_codec.loads(data.encode("ISO-8859-1", "xmlcharrefreplace")) == list(values)
+    data = xmlrpc.client.dumps(("ä",), methodresponse=True, encoding="utf-8")
+    assert xml_rpc_codec.loads(data.encode()) == "ä"
+    # escaped member names are decoded like by xmlrpc.client
+    values = ({"A&B": 1, "<C>": {"D&amp;": "&"}, "E": "F"},)
+    data = xmlrpc.client.dumps(values, methodresponse=True)
+    assert xml_rpc_codec.loads(data.encode()) == xmlrpc.client.loads(data)[0][0] == values[0]
+    # untyped values are strings
+    assert (
+        xml_rpc_codec.loads(
+            b"<methodResponse><params><param><value>abc</value></param></params></methodResponse>"
+        )
+        == "abc"
+    )
+    # empty elements are decoded by expat
+    data = xmlrpc.client.dumps(([None, "x"],), methodresponse=True, allow_none=True)
+    assert xml_rpc_codec.loads(data.encode()) == [None, "x"]
+
+    fault = xmlrpc.client.dumps(xmlrpc.client.Fault(-2, "Unknown instance"), methodresponse=True)
+    with pytest.raises(xmlrpc.client.Fault) as exc_info:
+        xml_rpc_codec.loads(fault.encode())
+    assert exc_info.value.faultCode == -2
+    assert exc_info.value.faultString == "Unknown instance"
+
+
+@pytest.mark.parametrize(
+    ("method", "params", "expected_params"),
+    [
+        ("setValue", ("VCU0000001:1", "LEVEL", 0.5), ("VCU0000001:1", "LEVEL", 0.5)),
+        (
+            "setValue",
+            ("VCU0000001:1", "STATE", True, "WAKEUP"),
+            ("VCU0000001:1", "STATE", True, "WAKEUP"),
+        ),
+        (
+            "putParamset",
+            ("VCU0000001:1", ParamsetKey.VALUES, {"LEVEL": 1, "NAME": "a<&ä"}),
+            ("VCU0000001:1", "VALUES", {"LEVEL": 1, "NAME": "a<&ä"}),
+        ),
+        (
+            "putParamset",
+            ("VCU0000001:1", ParamsetKey.MASTER, {"PRIORITY": CommandPriority.MASTER}, "BURST"),
+            ("VCU0000001:1", "MASTER", {"PRIORITY": 1}, "BURST"),
+        ),
+        ("getValue", ("VCU0000001:1", "LEVEL"), ("VCU0000001:1", "LEVEL")),
+        (
+            "system.multicall",
+            ([{"methodName": "getValue", "params": ("VCU0000001:1", ParamsetKey.VALUES)}],),
+            ([{"methodName": "getValue", "params": ["VCU0000001:1", "VALUES"]}],),
+        ),
+    ],
+)
+def test_xml_rpc_codec_dumps(
+    method: str, params: tuple[Any, ...], expected_params: tuple[Any, ...]
+) -> None:
+    """Test that the codec encodes the requests with the plain values of enums."""
+    request = xml_rpc_codec.dumps(method=method, params=params)
+    assert xmlrpc.client.loads(request) == (expected_params, method)
+    # the pre-specialized encoders write the same request as the generic encoder
+    out: list[str] = []
+    for param in params:
+        out.append("<param>")
+        xml_rpc_codec._dump_value(param, out)
+        out.append("</param>")
+    assert request == xml_rpc_codec._dump_request(method=method, out=out)
+
+
+def test_xml_rpc_codec_dumps_unsupported() -> None:
+    """Test that unsupported values raise a TypeError."""
+
+    class _Color(Enum):
+        RED = 1
+
+    with pytest.raises(TypeError):
+        xml_rpc_codec.dumps(method="setValue", params=("VCU0000001:1", "STATE", None))
+    with pytest.raises(TypeError):
+        xml_rpc_codec.dumps(method="setValue", params=("VCU0000001:1", "COLOR", _Color.RED))
+    with pytest.raises(OverflowError):
+        xml_rpc_codec.dumps(method="setValue", params=("VCU0000001:1", "LEVEL", 2**40))
@@ -0,0 +1,394 @@
+"""Test the HaHomematic xml rpc server."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import call, patch
+import xmlrpc.client
+
+from aiohttp import ClientSession
+import pytest
+
+from hahomematic.central.event_queue import EventQueue, LatencyHistogram
+from hahomematic.central.xml_rpc_server import AsyncXmlRpcServer
+from hahomematic.const import (
+    EVENT_COALESCED_EVENTS,
+    EVENT_DATA,
+    EVENT_DROPPED_EVENTS,
+    EVENT_INTERFACE_ID,
+    EVENT_OVERLOAD_POLICY,
+    EVENT_TYPE,
+    EventLane,
+    EventOverloadPolicy,
+    EventType,
+    InterfaceEventType,
+)
+from hahomematic.support import find_free_port
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+async def _call(session: ClientSession, port: int, path: str, method: str, *params: Any) -> Any:
+    """Send a xml rpc request to the local server and return the result."""
+    async with session.post(
+        f"http://127.0.0.1:{port}{path}",
+        data=xmlrpc.client.dumps(params, methodname=method, allow_none=True),
+        headers={"Content-Type": "text/xml"},
+    ) as response:
+        assert response.status == 200
+        return xmlrpc.client.loads(await response.read())[0][0]
+
+
+@pytest.mark.asyncio
+async def test_async_xml_rpc_server(factory: helper.Factory) -> None:
+    """Test the async xml rpc server."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    server = AsyncXmlRpcServer(local_port=find_free_port())
+    server.register_central(central)
+    await server.start()
+    assert server.started is True
+    switch = central.get_generic_entity("VCU2128127:4", "STATE")
+    try:
+        async with ClientSession() as session:
+            await _call(
+                session,
+                server.local_port,
+                "/RPC2",
+                "event",
+                const.INTERFACE_ID,
+                "VCU2128127:4",
+                "STATE",
+                True,
+            )
+            assert switch.value is True
+            await _call(
+                session,
+                server.local_port,
+                "/",
+                "system.multicall",
+                [
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", False],
+                    },
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:3", "STATE", True],
+                    },
+                ],
+            )
+            assert switch.value is False
+            devices = await _call(
+                session, server.local_port, "/", "listDevices", const.INTERFACE_ID
+            )
+            assert len(devices) == len(central.list_devices(interface_id=const.INTERFACE_ID))
+            assert await _call(session, server.local_port, "/", "listDevices", "unknown") == []
+            assert "event" in await _call(
+                session, server.local_port, "/", "system.listMethods", const.INTERFACE_ID
+            )
+            async with session.post(
+                f"http://127.0.0.1:{server.local_port}/unknown", data=b""
+            ) as response:
+                assert response.status == 404
+    finally:
+        server.un_register_central(central)
+        await server.stop()
+    assert server.started is False
+    assert server.no_central_registered is True
+
+
+@pytest.mark.asyncio
+async def test_multicall_event_batch(factory: helper.Factory) -> None:
+    """Test that event bundles within a multicall are dispatched as batch."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    server = AsyncXmlRpcServer(local_port=find_free_port())
+    server.register_central(central)
+    switch = central.get_generic_entity("VCU2128127:4", "STATE")
+    factory.entity_event_mock.reset_mock()
+    try:
+        with patch.object(central, "event_batch", wraps=central.event_batch) as event_batch:
+            results = server._dispatcher.system_multicall(
+                [
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", True],
+                    },
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:3", "STATE", True],
+                    },
+                    {"methodName": "listDevices", "params": ["unknown"]},
+                    {"methodName": "unknownMethod", "params": []},
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", False],
+                    },
+                ]
+            )
+        assert event_batch.call_count == 2
+        assert results[:3] == [[None], [None], [[]]]
+        assert results[3]["faultCode"] == 1
+        assert results[4] == [None]
+        assert switch.value is False
+        assert factory.entity_event_mock.call_count == 3
+        assert factory.entity_event_mock.call_args_list[0] == call(
+            const.INTERFACE_ID, "VCU2128127:4", "STATE", True
+        )
+    finally:
+        server.un_register_central(central)
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_event_queue(factory: helper.Factory) -> None:
+    """Test the coalescing event queue."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    switch = central.get_generic_entity("VCU2128127:4", "STATE")
+    factory.entity_event_mock.reset_mock()
+
+    central.event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    central.event_queue.put(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True)
+    central.event_queue.put_batch(
+        const.INTERFACE_ID,
+        (
+            ("VCU2128127:4", "STATE", False),
+            ("VCU2128127:1", "PRESS_SHORT", True),
+            ("VCU2128127:4", "STATE", True),
+        ),
+    )
+    assert central.event_queue.depth == 3
+    assert switch.value is None
+    await asyncio.sleep(0)
+    assert central.event_queue.depth == 0
+    assert switch.value is True
+    # events of the interaction lane are dispatched first
+    assert factory.entity_event_mock.call_args_list == [
+        call(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True),
+        call(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True),
+        call(const.INTERFACE_ID, "VCU2128127:4", "STATE", True),
+    ]
+    statistics = central.event_queue.statistics
+    assert statistics.received == 5
+    assert statistics.coalesced == 2
+    assert statistics.drained == 3
+    assert statistics.drain_cycles == 1
+    assert statistics.max_depth == 3
+
+
+@pytest.mark.parametrize(
+    (
+        "overload_policy",
+        "expected_depth",
+        "expected_dropped",
+        "expected_coalesced",
+        "expected_state",
+    ),
+    [
+        (EventOverloadPolicy.COALESCE, 4, 0, 3, False),
+        # at the max depth the oldest telemetry event (STATE) is dropped
+        (EventOverloadPolicy.SHED_TELEMETRY, 4, 2, 1, None),
+    ],
+)
+@pytest.mark.asyncio
+async def test_event_queue_overload(
+    factory: helper.Factory,
+    overload_policy: EventOverloadPolicy,
+    expected_depth: int,
+    expected_dropped: int,
+    expected_coalesced: int,
+    expected_state: bool | None,
+) -> None:
+    """Test the overload policies of the event queue."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    event_queue = EventQueue(
+        central=central,
+        loop=asyncio.get_running_loop(),
+        high_water_mark=2,
+        overload_policy=overload_policy,
+    )
+    factory.ha_event_mock.reset_mock()
+    event_queue.put_batch(
+        const.INTERFACE_ID,
+        (
+            ("VCU2128127:4", "STATE", True),
+            ("VCU2128127:1", "PRESS_SHORT", True),
+            ("VCU2128127:1", "PRESS_SHORT", True),
+            ("VCU2128127:4", "STATE", False),
+            ("VCU2128127:0", "RSSI_DEVICE", -60),
+            ("VCU2128127:1", "PRESS_LONG", True),
+            ("VCU2128127:1", "PRESS_SHORT", True),
+        ),
+    )
+    assert event_queue.depth == expected_depth
+    statistics = event_queue.statistics
+    assert statistics.dropped == expected_dropped
+    assert statistics.coalesced == expected_coalesced
+
+    await asyncio.sleep(0)
+    assert event_queue.depth == 0
+    assert central.get_generic_entity("VCU2128127:4", "STATE").value is expected_state
+    assert (
+        call(
+            EventType.INTERFACE,
+            {
+                EVENT_INTERFACE_ID: const.INTERFACE_ID,
+                EVENT_TYPE: InterfaceEventType.EVENT_OVERLOAD,
+                EVENT_DATA: {
+                    EVENT_DROPPED_EVENTS: expected_dropped,
+                    EVENT_COALESCED_EVENTS: expected_coalesced,
+                    EVENT_OVERLOAD_POLICY: overload_policy,
+                },
+            },
+        )
+        in factory.ha_event_mock.call_args_list
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_queue_overload_block(factory: helper.Factory) -> None:
+    """Test that the block policy blocks the producer until the queue is drained."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    loop = asyncio.get_running_loop()
+    event_queue = EventQueue(
+        central=central,
+        loop=loop,
+        high_water_mark=1,
+        overload_policy=EventOverloadPolicy.BLOCK,
+    )
+    # producers in the event loop are never blocked
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:3", "STATE", True)
+    assert event_queue.depth == 2
+
+    await loop.run_in_executor(
+        None, event_queue.put, const.INTERFACE_ID, "VCU2128127:4", "STATE", False
+    )
+    await asyncio.sleep(0)
+    statistics = event_queue.statistics
+    assert statistics.drain_cycles == 2
+    assert statistics.drained == 3
+    assert statistics.max_depth == 2
+    assert statistics.dropped == 0
+    assert central.get_generic_entity("VCU2128127:4", "STATE").value is False
+
+
+@pytest.mark.asyncio
+async def test_event_queue_lanes(factory: helper.Factory) -> None:
+    """Test that the priority lanes are drained first and record their latencies."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    factory.entity_event_mock.reset_mock()
+
+    central.event_queue.put_batch(
+        const.INTERFACE_ID,
+        (
+            ("VCU2128127:0", "RSSI_DEVICE", -60),
+            ("VCU2128127:4", "STATE", True),
+            ("VCU2128127:1", "PRESS_SHORT", True),
+            ("VCU2128127:0", "UNREACH", False),
+            ("VCU2128127:1", "PRESS_LONG", True),
+        ),
+    )
+    await asyncio.sleep(0)
+    assert [event_call.args[2] for event_call in factory.entity_event_mock.call_args_list] == [
+        "UNREACH",
+        "PRESS_SHORT",
+        "PRESS_LONG",
+        "RSSI_DEVICE",
+        "STATE",
+    ]
+
+    latencies = central.event_queue.latencies
+    assert latencies[EventLane.AVAILABILITY].count == 1
+    assert latencies[EventLane.INTERACTION].count == 2
+    assert latencies[EventLane.TELEMETRY].count == 2
+    histogram = latencies[EventLane.INTERACTION]
+    assert sum(histogram.buckets.values()) == 2
+    assert 0 <= histogram.mean <= histogram.max
+    assert histogram.percentile(99) in histogram.buckets
+
+
+@pytest.mark.asyncio
+async def test_event_queue_chunks(factory: helper.Factory) -> None:
+    """Test that events of higher lanes are dispatched between chunks of a burst."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    event_queue = EventQueue(
+        central=central,
+        loop=asyncio.get_running_loop(),
+        high_water_mark=5000,
+        overload_policy=EventOverloadPolicy.COALESCE,
+    )
+    dispatched: list[tuple[str, int]] = []
+
+    def _event_batch(interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        if not dispatched:
+            # arrives, while the first chunk is dispatched
+            event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "UNREACH", True)
+        dispatched.append((events[0][1], len(events)))
+
+    event_queue.put_batch(
+        const.INTERFACE_ID,
+        tuple((f"VCU2128127:{channel_no}", "RSSI_DEVICE", -60) for channel_no in range(250)),
+    )
+    with patch.object(central, "event_batch", side_effect=_event_batch):
+        await asyncio.sleep(0)
+    assert dispatched == [
+        ("RSSI_DEVICE", 100),
+        ("UNREACH", 1),
+        ("RSSI_DEVICE", 100),
+        ("RSSI_DEVICE", 50),
+    ]
+    assert event_queue.statistics.drain_cycles == 1
+
+    # the latency of coalesced events starts with the first event
+    with patch("hahomematic.central.event_queue.time.monotonic", return_value=10.0):
+        event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    with patch("hahomematic.central.event_queue.time.monotonic", return_value=12.0):
+        event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+        event_queue._drain()
+    assert event_queue.latencies[EventLane.TELEMETRY].max == 2.0
+
+
+@pytest.mark.asyncio
+async def test_event_queue_poisoned_event(factory: helper.Factory) -> None:
+    """Test that a failing event doesn't stop the delivery of the following events."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    switch = central.get_generic_entity("VCU2128127:4", "STATE")
+
+    # the PONG value is not a string
+    central.event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "PONG", 5)
+    central.event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    await asyncio.sleep(0)
+    assert central.event_queue.depth == 0
+    assert switch.value is True
+
+    # a failing batch is logged, and the drain continues with the next events
+    with patch.object(central, "event_batch", side_effect=ValueError("poisoned")):
+        central.event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+        await asyncio.sleep(0)
+    assert central.event_queue._drain_scheduled is False
+    central.event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    await asyncio.sleep(0)
+    assert switch.value is False
+    assert central.event_queue._drain_scheduled is False
+
+
+def test_latency_histogram() -> None:
+    """Test the latency histogram."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    for latency in (0.0005, 0.002, 0.002, 0.2, 10.0):
+        histogram.observe(latency)
+    assert histogram.count == 5
+    assert histogram.max == 10.0
+    assert histogram.buckets[0.001] == 1
+    assert histogram.buckets[0.005] == 2
+    assert histogram.buckets[0.5] == 1
+    assert histogram.buckets[float("inf")] == 1
+    assert histogram.percentile(50) == 0.005
+    assert histogram.percentile(100) == float("inf")